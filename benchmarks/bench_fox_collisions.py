@@ -0,0 +1,169 @@
+"""
+Benchmark: fox collision checks, per-fox Python loop vs. the ActorStore.
+
+Foxes are scattered over a large maze and nudged every frame. Two
+queries are timed:
+  chicken - one chicken against all foxes: a loop over the Fox views,
+            and the ActorStore kernel that
+            FoxManager.check_collisions_with_chicken() uses
+  fox-fox - every fox against every other fox (future fox interactions)
+
+The store tests every fox in one pass over its position arrays, so there
+is no broad phase to keep up to date: foxes move every tick, and
+re-bucketing them into a grid costs as much as the array test itself.
+
+Usage:
+    python benchmarks/bench_fox_collisions.py [--frames N]
+"""
+
+import argparse
+import random
+import time
+
+from pacman.entities.fox import FoxManager
+from pacman.maps.maze import Maze
+from pacman.utils.constants import CHICKEN_SIZE, FOX_SIZE, FOX_SPEED
+
+FOX_COUNTS = (4, 16, 64, 250, 1000)
+MAZE_SIZE = 120  # Tiles per side
+
+
+def _setup(fox_count: int, seed: int):
+    """
+    Build a maze with foxes on random walkable tiles.
+
+    Args:
+        fox_count: Number of foxes
+        seed: RNG seed
+
+    Returns:
+        Tuple of (maze, fox manager, rng)
+    """
+    rng = random.Random(seed)
+    maze = Maze(width=MAZE_SIZE, height=MAZE_SIZE)
+    tiles = [
+        (x, y)
+        for y in range(maze.height)
+        for x in range(maze.width)
+        if not maze.is_wall(x, y)
+    ]
+    manager = FoxManager()
+    manager.create_foxes(maze, rng.sample(tiles, fox_count))
+    return maze, manager, rng
+
+
+def _nudge(manager: FoxManager, rng: random.Random):
+    """Move every fox a little."""
+    store = manager.store
+    store.x += [rng.uniform(-FOX_SPEED, FOX_SPEED) for _ in range(store.count)]
+    store.y += [rng.uniform(-FOX_SPEED, FOX_SPEED) for _ in range(store.count)]
+
+
+def bench_chicken(fox_count: int, frames: int, seed: int = 1):
+    """
+    Time the chicken query by a loop over the foxes and by the store.
+
+    Args:
+        fox_count: Number of foxes
+        frames: Simulated frames
+        seed: RNG seed
+
+    Returns:
+        Tuple of (loop, store) µs per frame
+    """
+    maze, manager, rng = _setup(fox_count, seed)
+    chicken_radius = CHICKEN_SIZE // 2
+    chicken_x, chicken_y = maze.get_tile_center(maze.width // 2, maze.height // 2)
+
+    loop_time = store_time = 0.0
+    for _ in range(frames):
+        _nudge(manager, rng)
+
+        start = time.perf_counter()
+        expected = [
+            fox
+            for fox in manager.foxes
+            if fox.check_collision_with_chicken(chicken_x, chicken_y, chicken_radius)
+        ]
+        loop_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = manager.check_collisions_with_chicken(
+            chicken_x, chicken_y, chicken_radius
+        )
+        store_time += time.perf_counter() - start
+
+        assert found == expected
+
+    scale = 1e6 / frames
+    return loop_time * scale, store_time * scale
+
+
+def bench_fox_pairs(fox_count: int, frames: int, seed: int = 1):
+    """
+    Time finding all touching fox pairs by a double loop and by the store.
+
+    Args:
+        fox_count: Number of foxes
+        frames: Simulated frames
+        seed: RNG seed
+
+    Returns:
+        Tuple of (loop, store) µs per frame
+    """
+    _, manager, rng = _setup(fox_count, seed)
+    store = manager.store
+    foxes = manager.foxes
+    reach_squared = FOX_SIZE * FOX_SIZE
+
+    loop_time = store_time = 0.0
+    for _ in range(frames):
+        _nudge(manager, rng)
+
+        start = time.perf_counter()
+        loop_pairs = 0
+        for fox in foxes:
+            for other in foxes:
+                dx = fox.center_x - other.center_x
+                dy = fox.center_y - other.center_y
+                if other is not fox and dx * dx + dy * dy < reach_squared:
+                    loop_pairs += 1
+        loop_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        # Each fox overlaps itself, the store counts it too
+        store_pairs = -store.count
+        for index in range(store.count):
+            store_pairs += len(
+                store.colliding(store.x[index], store.y[index], store.radius)
+            )
+        store_time += time.perf_counter() - start
+
+        assert loop_pairs == store_pairs
+
+    scale = 1e6 / frames
+    return loop_time * scale, store_time * scale
+
+
+def main():
+    """Print per-frame cost for each fox count."""
+    parser = argparse.ArgumentParser(description="Fox collision benchmark")
+    parser.add_argument("--frames", type=int, default=200, help="Frames per fox count")
+    args = parser.parse_args()
+
+    # Fox-fox loops are quadratic, keep their frame count small
+    pair_frames = max(1, args.frames // 20)
+
+    print(f"{'foxes':>6} | {'chicken µs':^17} | {'fox-fox µs':^21}")
+    print(f"{'':>6} | {'loop':>8} {'store':>8} | {'loop':>10} {'store':>10}")
+    for fox_count in FOX_COUNTS:
+        loop_us, store_us = bench_chicken(fox_count, args.frames)
+        pair_loop_us, pair_store_us = bench_fox_pairs(fox_count, pair_frames)
+        print(
+            f"{fox_count:>6} | {loop_us:>8.1f} {store_us:>8.1f} | "
+            f"{pair_loop_us:>10.1f} {pair_store_us:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
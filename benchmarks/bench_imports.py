@@ -0,0 +1,117 @@
+"""
+Benchmark: import time of the game logic, which must not load arcade.
+
+Each module is imported in a fresh interpreter (so nothing is cached in
+sys.modules) and timed from inside it. The logic modules are what batch
+workers and training environments import; they must work without
+arcade, pyglet or a display. The windowed game is timed too, for
+comparison.
+
+Exits with status 1 if a headless module loads arcade or pyglet, or
+takes longer than --max-ms.
+
+Usage:
+    python benchmarks/bench_imports.py [--repeat N] [--max-ms MS]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+# Modules that must import without a display
+HEADLESS_MODULES = (
+    "pacman.maps.maze",
+    "pacman.maps.generator",
+    "pacman.maps.level_loader",
+    "pacman.entities.player",
+    "pacman.entities.fox",
+    "pacman.entities.collectibles",
+    "pacman.simulation",
+    "pacman.replay",
+    "pacman.batch",
+    "pacman.vector_env",
+    "pacman.observation",
+)
+
+# Needs arcade; shows what the headless modules avoid
+WINDOWED_MODULE = "pacman.game"
+
+GRAPHICS_PACKAGES = ("arcade", "pyglet")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in {packages!r} if name in sys.modules)
+print(json.dumps([elapsed, loaded]))
+"""
+
+
+def time_import(module: str) -> Tuple[float, List[str]]:
+    """
+    Import a module in a new interpreter.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        Tuple of (import time in ms, graphics packages it loaded)
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _PROBE.format(module=module, packages=GRAPHICS_PACKAGES),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    elapsed, loaded = json.loads(output.strip().splitlines()[-1])
+    return elapsed * 1000, loaded
+
+
+def main():
+    """Print import times and check the headless modules."""
+    parser = argparse.ArgumentParser(description="Import time benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per module")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Fail if a headless module's best import time exceeds this",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<30} {'best ms':>9} {'median ms':>10}  loads")
+    for module in HEADLESS_MODULES + (WINDOWED_MODULE,):
+        runs = [time_import(module) for _ in range(args.repeat)]
+        times = [elapsed for elapsed, _loaded in runs]
+        loaded = runs[-1][1]
+        best = min(times)
+        print(
+            f"{module:<30} {best:>9.1f} {statistics.median(times):>10.1f}  "
+            f"{', '.join(loaded) or '-'}"
+        )
+
+        if module == WINDOWED_MODULE:
+            continue
+        if loaded:
+            failures.append(f"{module} loads {', '.join(loaded)}")
+        if args.max_ms is not None and best > args.max_ms:
+            failures.append(
+                f"{module} takes {best:.1f} ms (limit {args.max_ms:.1f} ms)"
+            )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
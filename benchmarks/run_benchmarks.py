@@ -0,0 +1,354 @@
+"""
+Benchmark suite: maze, seeds and fox AI at several maze sizes (headless).
+
+Every case runs on generated mazes (pacman.maps.generator) from the
+built-in 24x18 size up to 1000x1000 (vector_env_step, timed per game
+step, only on mazes small enough for a pathfinding table). Setup work is
+excluded from the timings; each case reports the median and best time
+per operation over several repeats (garbage collection is off while
+timing, like timeit).
+
+Results can be saved as a baseline JSON file and later runs compared
+against it; a case whose best time is slower than the baseline by more
+than the threshold is flagged as a regression (exit status 1). The best
+time is compared because it is the least sensitive to other load on the
+machine.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 24x18,100x100]
+        [--save baseline.json] [--compare baseline.json] [--threshold 0.25]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pacman.entities.collectibles import SeedManager
+from pacman.entities.fox import FoxManager
+from pacman.maps.generator import generate_grid, generate_level
+from pacman.maps.maze import Maze
+from pacman.simulation import Simulation
+from pacman.utils.constants import CHICKEN_SIZE
+from pacman.vector_env import VectorEnv
+
+# (width, height, repeats); big mazes get fewer repeats
+SCALES = (
+    (24, 18, 30),
+    (100, 100, 10),
+    (300, 300, 5),
+    (1000, 1000, 3),
+)
+MAZE_SEED = 1
+SIM_SEED = 1
+
+COLLISION_CHECKS = 1000  # check_collisions() calls per repeat
+FOX_TICKS = 120  # FoxManager.update() calls per repeat
+SIM_TICKS = 120  # Simulation.step() calls per repeat
+INPUT_HOLD_TICKS = 30  # Scripted input: change direction this often
+VECTOR_ENVS = 256  # Games stepped together by VectorEnv
+VECTOR_TICKS = 120  # VectorEnv.step() calls per repeat
+
+DEFAULT_THRESHOLD = 0.25
+
+
+def _measure(
+    setup: Callable[[], object], run: Callable[[object], int], repeats: int
+) -> Tuple[float, float]:
+    """
+    Time a benchmark body.
+
+    Args:
+        setup: Builds fresh state for one repeat (not timed)
+        run: Benchmark body; gets the state and returns the number of
+            operations it performed
+        repeats: Number of timed repeats
+
+    Returns:
+        Tuple of (median, best) seconds per operation
+    """
+    per_op = []
+    for _ in range(repeats):
+        state = setup()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            operations = run(state)
+            per_op.append((time.perf_counter() - start) / operations)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return statistics.median(per_op), min(per_op)
+
+
+def _walk_path(level, count: int) -> List[Tuple[float, float]]:
+    """
+    Pixel positions of the chicken walking along open tiles.
+
+    Args:
+        level: Generated level
+        count: Number of positions
+
+    Returns:
+        Tile centers in reading order starting at the player spawn
+    """
+    maze = level.maze
+    tiles = sorted(level.reachable_tiles, key=lambda tile: (tile[1], tile[0]))
+    start = tiles.index(level.player_spawn)
+    tiles = (tiles[start:] + tiles[:start])[:count]
+    return [maze.get_tile_center(*tile) for tile in tiles]
+
+
+def bench_scale(width: int, height: int, repeats: int) -> Dict[str, Dict[str, float]]:
+    """
+    Run every case on one maze size.
+
+    Args:
+        width: Maze width in tiles
+        height: Maze height in tiles
+        repeats: Timed repeats per case
+
+    Returns:
+        Case name -> {"median_us", "best_us"}
+    """
+    grid = generate_grid(width, height, MAZE_SEED)
+    level = generate_level(width, height, MAZE_SEED)
+    maze = level.maze
+    # Pathfinding tables are built on first use; keep that out of the timings
+    maze.precompute()
+    spawn_x, spawn_y = level.player_spawn
+    cases: Dict[str, Tuple[Callable, Callable]] = {}
+
+    def run_maze(fresh_grid):
+        Maze(fresh_grid)
+        return 1
+
+    def run_walls(state):
+        state._build_wall_rectangles()
+        return 1
+
+    def run_flood_fill(manager):
+        manager._flood_fill_reachable(maze, spawn_x, spawn_y)
+        return 1
+
+    def run_create_seeds(manager):
+        manager.create_seeds_for_maze(maze, spawn_x, spawn_y)
+        return 1
+
+    cases["maze_construction"] = (lambda: [row[:] for row in grid], run_maze)
+    cases["build_wall_rectangles"] = (lambda: maze, run_walls)
+    cases["flood_fill_reachable"] = (SeedManager, run_flood_fill)
+    cases["create_seeds_for_maze"] = (SeedManager, run_create_seeds)
+
+    path = _walk_path(level, COLLISION_CHECKS)
+    chicken_radius = CHICKEN_SIZE // 2
+
+    def seeded_manager():
+        manager = SeedManager()
+        manager.create_seeds_for_maze(
+            maze, spawn_x, spawn_y, reachable_tiles=level.reachable_tiles
+        )
+        return manager
+
+    def run_collisions(manager):
+        check = manager.check_collisions
+        for chicken_x, chicken_y in path:
+            check(chicken_x, chicken_y, chicken_radius)
+        return len(path)
+
+    cases["check_collisions"] = (seeded_manager, run_collisions)
+
+    chicken_x, chicken_y = maze.get_tile_center(spawn_x, spawn_y)
+
+    def spawned_foxes():
+        manager = FoxManager(random.Random(SIM_SEED))
+        manager.create_foxes(maze, level.fox_spawns)
+        return manager
+
+    def run_foxes(manager):
+        for _ in range(FOX_TICKS):
+            manager.update(maze, chicken_x, chicken_y)
+        return FOX_TICKS
+
+    cases["fox_update"] = (spawned_foxes, run_foxes)
+
+    def run_simulation(simulation):
+        step = simulation.step
+        for tick in range(SIM_TICKS):
+            step((tick // INPUT_HOLD_TICKS) % 4)
+        return SIM_TICKS
+
+    cases["simulation_tick"] = (
+        lambda: Simulation(level=level, seed=SIM_SEED),
+        run_simulation,
+    )
+
+    if maze.distance_table is not None:
+        # Mazes without a pathfinding table can't be vectorized
+        actions = [
+            [(tick // INPUT_HOLD_TICKS + env) % 4 for env in range(VECTOR_ENVS)]
+            for tick in range(VECTOR_TICKS)
+        ]
+
+        def run_vector_env(env):
+            step = env.step
+            for tick_actions in actions:
+                step(tick_actions)
+            return VECTOR_TICKS * VECTOR_ENVS
+
+        cases["vector_env_step"] = (
+            lambda: VectorEnv(
+                VECTOR_ENVS, level=level, seed=SIM_SEED, end_on_catch=False
+            ),
+            run_vector_env,
+        )
+
+    results = {}
+    for name, (setup, run) in cases.items():
+        median, best = _measure(setup, run, repeats)
+        results[name] = {
+            "median_us": round(median * 1e6, 3),
+            "best_us": round(best * 1e6, 3),
+        }
+    return results
+
+
+def run_suite(scales) -> Dict[str, object]:
+    """
+    Run the benchmark suite.
+
+    Args:
+        scales: (width, height, repeats) tuples
+
+    Returns:
+        Results document (see --save)
+    """
+    results = {}
+    for width, height, repeats in scales:
+        scale = f"{width}x{height}"
+        print(f"{scale}...", file=sys.stderr, flush=True)
+        results[scale] = bench_scale(width, height, repeats)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, object], baseline: Dict[str, object]
+) -> List[Tuple[str, str, float, float, float]]:
+    """
+    Compare a run against a baseline.
+
+    Args:
+        current: Results document of this run
+        baseline: Results document loaded from the baseline file
+
+    Returns:
+        (scale, case, baseline best µs, current best µs, ratio) for every
+        case present in both, slowest ratio first
+    """
+    rows = []
+    baseline_results = baseline.get("results", {})
+    for scale, cases in current["results"].items():
+        for name, timing in cases.items():
+            reference = baseline_results.get(scale, {}).get(name)
+            if not reference:
+                continue
+            ratio = timing["best_us"] / reference["best_us"]
+            rows.append((scale, name, reference["best_us"], timing["best_us"], ratio))
+    rows.sort(key=lambda row: row[4], reverse=True)
+    return rows
+
+
+def _parse_scales(text: Optional[str]):
+    """
+    Pick the scales named on the command line.
+
+    Args:
+        text: Comma separated WIDTHxHEIGHT list, or None for all
+
+    Returns:
+        (width, height, repeats) tuples
+    """
+    if not text:
+        return SCALES
+    known = {(width, height): repeats for width, height, repeats in SCALES}
+    scales = []
+    for item in text.split(","):
+        width, height = (int(part) for part in item.lower().split("x"))
+        scales.append((width, height, known.get((width, height), 5)))
+    return scales
+
+
+def main():
+    """Run the suite, print the results and optionally save/compare them."""
+    parser = argparse.ArgumentParser(description="Chickman benchmark suite (headless)")
+    parser.add_argument(
+        "--scales",
+        help="Comma separated maze sizes, e.g. 24x18,100x100 " "(default: all)",
+    )
+    parser.add_argument(
+        "--save", metavar="PATH", help="Write the results as baseline JSON"
+    )
+    parser.add_argument(
+        "--compare", metavar="PATH", help="Compare against a baseline JSON file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown of the best time before a case counts as a "
+        "regression (default: 0.25 = 25%%)",
+    )
+    args = parser.parse_args()
+
+    current = run_suite(_parse_scales(args.scales))
+
+    print(f"{'scale':>10} {'case':<24} {'median µs':>12} {'best µs':>12}")
+    for scale, cases in current["results"].items():
+        for name, timing in cases.items():
+            median_us, best_us = timing["median_us"], timing["best_us"]
+            print(f"{scale:>10} {name:<24} {median_us:>12.1f} {best_us:>12.1f}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+        print(f"Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get("platform") != current["platform"]:
+            print(f"Note: baseline was recorded on {baseline.get('platform')}")
+
+        regressions = 0
+        print()
+        print(
+            f"{'scale':>10} {'case':<24} {'base best':>12} {'now best':>12} "
+            f"{'change':>8}"
+        )
+        for scale, name, reference, now, ratio in compare(current, baseline):
+            flag = ""
+            if ratio > 1 + args.threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(
+                f"{scale:>10} {name:<24} {reference:>12.1f} {now:>12.1f} "
+                f"{(ratio - 1) * 100:>+7.1f}%{flag}"
+            )
+        if regressions:
+            print(f"{regressions} regression(s) over {args.threshold:.0%}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
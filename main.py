@@ -14,13 +14,12 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from pacman.game import ChickmanGame
+from pacman import game
 
 
 def main():
-    """Main entry point for the game."""
-    game = ChickmanGame()
-    game.run()
+    """Main entry point for the game (accepts the same options as chickman)."""
+    game.main()
 
 
 if __name__ == "__main__":
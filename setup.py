@@ -6,8 +6,9 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     install_requires=[
-        "arcade>=2.6.17",
+        "arcade>=3.0",
         "pytmx>=3.31",
+        "numpy>=1.21",
     ],
     extras_require={
         "dev": [
@@ -24,6 +25,8 @@ setup(
     entry_points={
         "console_scripts": [
             "chickman=pacman.game:main",
+            "chickman-replay=pacman.replay:main",
+            "chickman-batch=pacman.batch:main",
         ],
     },
     python_requires=">=3.9",
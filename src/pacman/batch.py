@@ -0,0 +1,418 @@
+"""
+Headless batch runner.
+
+Plays many games without a window, spread over a process pool, to tune
+fox behaviour and maze layouts. Game i uses seed base_seed + i for both
+the simulation and its chicken controller, so every game can be re-run
+on its own. Each worker process loads the maze once and reuses it for
+all of its games; only seeds go to the workers and only a small stats
+row comes back, so throughput scales with the number of cores.
+
+Results are written column by column:
+    {"config": {...}, "columns": {"seed": [...], "score": [...], ...}}
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from pacman.entities.collectibles import SEED_NONE
+from pacman.entities.fox import FoxState
+from pacman.maps.generator import generate_level
+from pacman.maps.level_loader import Level, load_level
+from pacman.simulation import Simulation
+from pacman.utils.constants import DIRECTION_VECTORS
+
+DEFAULT_GAMES = 100
+DEFAULT_MAX_TICKS = 60 * 60 * 3  # Three minutes of game time
+SCRIPT_HOLD_TICKS = 30  # Scripted chicken: change direction this often
+BOT_SEARCH_LIMIT = 4096  # Tiles the bot searches before giving up
+
+# Per-game statistics, in column order
+COLUMNS = (
+    "seed",
+    "score",
+    "ticks",
+    "ticks_survived",
+    "seeds_eaten",
+    "seeds_total",
+    "fox_catches",
+    "foxes_eaten",
+    "level_complete",
+)
+
+
+class ScriptedController:
+    """Chicken input that cycles right, up, left, down at a fixed rate."""
+
+    def __init__(self, rng: random.Random):
+        """
+        Initialize the controller.
+
+        Args:
+            rng: Random source (picks the first direction)
+        """
+        self._first = rng.randrange(4)
+
+    def __call__(self, simulation: Simulation) -> Optional[int]:
+        """
+        Get the direction to hold this tick.
+
+        Args:
+            simulation: Game being played
+
+        Returns:
+            Direction (0=right, 1=up, 2=left, 3=down)
+        """
+        return (self._first + simulation.tick // SCRIPT_HOLD_TICKS) % 4
+
+
+class SeedBot:
+    """
+    Greedy chicken: heads for the nearest seed, around chasing foxes.
+
+    A breadth-first search runs each time the chicken enters a new tile;
+    tiles holding or next to a dangerous fox are avoided. When the chicken
+    is wedged against a wall (it did not move last tick) a random other
+    direction is tried.
+    """
+
+    def __init__(self, rng: random.Random):
+        """
+        Initialize the bot.
+
+        Args:
+            rng: Random source for moves when no seed can be reached
+        """
+        self.rng = rng
+        self._tile = None
+        self._direction: Optional[int] = None
+
+    def __call__(self, simulation: Simulation) -> Optional[int]:
+        """
+        Get the direction to hold this tick.
+
+        Args:
+            simulation: Game being played
+
+        Returns:
+            Direction (0=right, 1=up, 2=left, 3=down)
+        """
+        player = simulation.player
+        tile = player.get_tile_position()
+        if tile != self._tile or self._direction is None:
+            self._tile = tile
+            self._direction = self._choose(simulation, tile)
+        elif player.center_x == player.prev_x and player.center_y == player.prev_y:
+            self._direction = self.rng.choice(
+                [direction for direction in range(4) if direction != self._direction]
+            )
+        return self._direction
+
+    def _choose(self, simulation: Simulation, start) -> Optional[int]:
+        """
+        Pick the first step towards the nearest safe seed.
+
+        Args:
+            simulation: Game being played
+            start: Chicken tile (x, y)
+
+        Returns:
+            Direction, a random open direction if no seed is in reach, or
+            None if the chicken is boxed in
+        """
+        maze = simulation.maze
+        field = simulation.seed_manager.field
+
+        danger = set()
+        for fox in simulation.fox_manager.foxes:
+            if fox.state in (FoxState.FRIGHTENED, FoxState.EATEN):
+                continue
+            fox_x, fox_y = fox.get_tile_position()
+            danger.add((fox_x, fox_y))
+            for dx, dy in DIRECTION_VECTORS:
+                danger.add((fox_x + dx, fox_y + dy))
+
+        # First direction taken to reach each tile
+        first_step = {start: None}
+        queue = deque([start])
+        while queue and len(first_step) < BOT_SEARCH_LIMIT:
+            tile_x, tile_y = queue.popleft()
+            step = first_step[(tile_x, tile_y)]
+            if step is not None and field.kind_at(tile_x, tile_y) != SEED_NONE:
+                return step
+            open_mask = maze.open_directions(tile_x, tile_y)
+            for direction, (dx, dy) in enumerate(DIRECTION_VECTORS):
+                neighbour = (tile_x + dx, tile_y + dy)
+                if (
+                    open_mask & (1 << direction)
+                    and neighbour not in first_step
+                    and neighbour not in danger
+                ):
+                    first_step[neighbour] = direction if step is None else step
+                    queue.append(neighbour)
+
+        open_mask = maze.open_directions(*start)
+        options = [direction for direction in range(4) if open_mask & (1 << direction)]
+        return self.rng.choice(options) if options else None
+
+
+# Builds a chicken controller (simulation -> held direction) from a seeded rng
+ControllerFactory = Callable[[random.Random], Callable[[Simulation], Optional[int]]]
+
+CONTROLLERS: Dict[str, ControllerFactory] = {
+    "bot": SeedBot,
+    "scripted": ScriptedController,
+}
+
+
+def play_game(
+    level: Optional[Level],
+    seed: int,
+    controller: str = "bot",
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    stop_on_catch: bool = False,
+) -> Dict[str, object]:
+    """
+    Play one headless game.
+
+    Args:
+        level: Level to play (None = built-in maze)
+        seed: Seed for the simulation and the controller
+        controller: Name of the chicken controller (see CONTROLLERS)
+        max_ticks: Longest game in ticks
+        stop_on_catch: End the game the first time a fox catches the
+            chicken (the game itself has no game over yet, so by default
+            catches are only counted)
+
+    Returns:
+        Stats row, one value per name in COLUMNS
+    """
+    simulation = Simulation(level=level, seed=seed)
+    control = CONTROLLERS[controller](random.Random(seed))
+    seeds_total = simulation.seed_manager.get_remaining_seeds()
+
+    step = simulation.step
+    while simulation.tick < max_ticks and not simulation.level_complete:
+        step(control(simulation))
+        if stop_on_catch and simulation.fox_catches:
+            break
+
+    survived = simulation.first_caught_tick
+    return {
+        "seed": seed,
+        "score": simulation.score,
+        "ticks": simulation.tick,
+        "ticks_survived": simulation.tick if survived is None else survived,
+        "seeds_eaten": seeds_total - simulation.seed_manager.get_remaining_seeds(),
+        "seeds_total": seeds_total,
+        "fox_catches": simulation.fox_catches,
+        "foxes_eaten": simulation.foxes_eaten,
+        "level_complete": simulation.level_complete,
+    }
+
+
+# Level of the current worker process (loaded once by _init_worker)
+_worker_level: Optional[Level] = None
+
+
+def _load_batch_level(
+    map_path: Optional[str], generate: Optional[str], layout_seed: int
+) -> Optional[Level]:
+    """
+    Load or generate the level every game is played on.
+
+    Args:
+        map_path: Tiled map to play
+        generate: Generated maze size as "WIDTHxHEIGHT"
+        layout_seed: Seed for the generated maze
+
+    Returns:
+        The Level, or None for the built-in maze
+    """
+    if map_path:
+        return load_level(map_path)
+    if generate:
+        width, height = (int(part) for part in generate.lower().split("x"))
+        return generate_level(width, height, layout_seed)
+    return None
+
+
+def _init_worker(map_path: Optional[str], generate: Optional[str], layout_seed: int):
+    """Process pool initializer: build the shared level once per worker."""
+    global _worker_level
+    _worker_level = _load_batch_level(map_path, generate, layout_seed)
+
+
+def _play_in_worker(seed: int, **options) -> Dict[str, object]:
+    """Play one game on the worker's level."""
+    return play_game(_worker_level, seed, **options)
+
+
+def run_batch(
+    games: int,
+    base_seed: int = 0,
+    workers: Optional[int] = None,
+    map_path: Optional[str] = None,
+    generate: Optional[str] = None,
+    layout_seed: int = 0,
+    **options,
+) -> Dict[str, List]:
+    """
+    Play many games, in parallel.
+
+    Args:
+        games: Number of games
+        base_seed: Seed of the first game (game i uses base_seed + i)
+        workers: Worker processes (default: one per core; 1 = no pool)
+        map_path: Tiled map to play
+        generate: Generated maze size as "WIDTHxHEIGHT"
+        layout_seed: Seed for the generated maze
+        **options: Passed on to play_game (controller, max_ticks, ...)
+
+    Returns:
+        Column name -> one value per game, in seed order
+    """
+    seeds = range(base_seed, base_seed + games)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(map_path, generate, layout_seed)
+        rows = [_play_in_worker(seed, **options) for seed in seeds]
+    else:
+        # Big chunks keep inter-process traffic low; a few per worker
+        # still balance games of different lengths
+        chunksize = max(1, games // (workers * 4))
+        with ProcessPoolExecutor(
+            workers,
+            initializer=_init_worker,
+            initargs=(map_path, generate, layout_seed),
+        ) as executor:
+            rows = list(
+                executor.map(
+                    partial(_play_in_worker, **options), seeds, chunksize=chunksize
+                )
+            )
+
+    return {name: [row[name] for row in rows] for name in COLUMNS}
+
+
+def _positive_int(text: str) -> int:
+    """
+    Parse a command line count that must be at least 1.
+
+    Args:
+        text: Command line value
+
+    Returns:
+        The count
+
+    Raises:
+        argparse.ArgumentTypeError: If it is not an integer of 1 or more
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Command line batch runner.
+
+    Args:
+        argv: Arguments (default: sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Play many headless Chickman games in parallel"
+    )
+    parser.add_argument(
+        "--games", type=_positive_int, default=DEFAULT_GAMES, help="Number of games"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game")
+    parser.add_argument(
+        "--workers", type=_positive_int, help="Worker processes (default: one per core)"
+    )
+    parser.add_argument(
+        "--controller",
+        choices=sorted(CONTROLLERS),
+        default="bot",
+        help="Chicken controller",
+    )
+    parser.add_argument(
+        "--max-ticks",
+        type=_positive_int,
+        default=DEFAULT_MAX_TICKS,
+        help="Longest game in ticks",
+    )
+    parser.add_argument(
+        "--stop-on-catch",
+        action="store_true",
+        help="End a game the first time a fox catches the chicken",
+    )
+    parser.add_argument(
+        "--map", help="Tiled (.tmx) map to play instead of the built-in maze"
+    )
+    parser.add_argument(
+        "--generate", metavar="WxH", help="Play a generated maze of this size"
+    )
+    parser.add_argument(
+        "--layout-seed", type=int, default=0, help="Seed of the generated maze"
+    )
+    parser.add_argument(
+        "--out", default="batch_results.json", help="Results file (JSON)"
+    )
+    args = parser.parse_args(argv)
+
+    options = {
+        "controller": args.controller,
+        "max_ticks": args.max_ticks,
+        "stop_on_catch": args.stop_on_catch,
+    }
+    start = time.perf_counter()
+    columns = run_batch(
+        args.games,
+        args.seed,
+        args.workers,
+        args.map,
+        args.generate,
+        args.layout_seed,
+        **options,
+    )
+    elapsed = time.perf_counter() - start
+
+    config = dict(
+        options,
+        games=args.games,
+        base_seed=args.seed,
+        map=args.map,
+        generate=args.generate,
+        layout_seed=args.layout_seed,
+    )
+    with open(args.out, "w", encoding="utf-8") as results_file:
+        json.dump({"config": config, "columns": columns}, results_file)
+
+    ticks = sum(columns["ticks"])
+    scores = columns["score"]
+    print(
+        f"{args.games} games in {elapsed:.1f}s ({args.games / elapsed:.1f} games/s, "
+        f"{ticks / elapsed:.0f} ticks/s)"
+    )
+    print(
+        f"score mean {sum(scores) / len(scores):.1f}, max {max(scores)}; "
+        f"caught in {sum(1 for catches in columns['fox_catches'] if catches)} games"
+    )
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
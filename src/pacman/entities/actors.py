@@ -0,0 +1,595 @@
+"""
+Array-backed actor storage.
+
+Positions, velocities, directions, AI states, speeds and spawn points of
+all foxes live in NumPy arrays, one element per actor, and are changed by
+batch kernels (movement, state transitions, collisions) that work on the
+whole array at once. A tick therefore costs a fixed number of array
+operations, however many foxes there are. FoxManager and Fox are views
+over one store.
+"""
+
+from enum import Enum
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pacman.utils.constants import (
+    DIRECTION_VECTORS,
+    FOX_SCARED_SPEED,
+    FOX_SIZE,
+    FOX_SPEED,
+    TILE_SIZE,
+)
+from pacman.utils.pathfinding import (
+    FIELD_UNREACHABLE,
+    NO_DIRECTION,
+    UNREACHABLE,
+    FlowField,
+)
+
+
+class FoxState(Enum):
+    """Fox AI states."""
+
+    CHASE = "chase"  # Actively hunting chicken
+    SCATTER = "scatter"  # Moving to home corner
+    FRIGHTENED = "frightened"  # Running away (blue)
+    EATEN = "eaten"  # Returning to spawn after being eaten
+
+
+# FoxState <-> code stored in ActorStore.state
+STATES = (FoxState.CHASE, FoxState.SCATTER, FoxState.FRIGHTENED, FoxState.EATEN)
+CHASE, SCATTER, FRIGHTENED, EATEN = range(len(STATES))
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+# Chance that a wandering actor turns at a junction, per tick
+WANDER_TURN_CHANCE = 0.1
+
+# Low 4 bits of a Maze.neighbours byte: open directions
+_OPEN_BITS = 0x0F
+
+_DX = np.array([dx for dx, _dy in DIRECTION_VECTORS], dtype=np.int64)
+_DY = np.array([dy for _dx, dy in DIRECTION_VECTORS], dtype=np.int64)
+
+# Open directions per 4-bit mask in the order right, left, up, down,
+# padded with the first one, and their count; a random open direction is
+# _CHOICES[mask, draw % count]
+_CHOICES = np.zeros((16, 4), dtype=np.int8)
+_CHOICE_COUNTS = np.ones(16, dtype=np.int64)
+for _mask in range(1, 16):
+    _open = [direction for direction in (0, 2, 1, 3) if _mask & (1 << direction)]
+    _CHOICES[_mask] = _open + [_open[0]] * (4 - len(_open))
+    _CHOICE_COUNTS[_mask] = len(_open)
+
+# Open-direction masks with more than two directions (junctions)
+_JUNCTION = np.array([bin(mask).count("1") > 2 for mask in range(16)])
+
+
+class ActorStore:
+    """
+    Struct-of-arrays storage for a group of foxes.
+
+    Attributes:
+        count: Number of actors
+        x, y: Centre positions in pixels
+        prev_x, prev_y: Positions before the last update (for render
+            interpolation)
+        change_x, change_y: Velocities in pixels per tick
+        direction: Directions (0=right, 1=up, 2=left, 3=down)
+        state: AI state codes (index into STATES)
+        speed: Current speeds (scared speed while frightened)
+        spawn_x, spawn_y: Spawn positions in pixels (home when eaten)
+        scatter_x, scatter_y: Home corner tiles used in SCATTER
+        radius: Collision radius shared by all actors
+        rng: NumPy random source for wandering
+    """
+
+    def __init__(
+        self,
+        spawn_x: Sequence[float],
+        spawn_y: Sequence[float],
+        rng: Optional[np.random.Generator] = None,
+        radius: float = FOX_SIZE // 2,
+        speed: float = FOX_SPEED,
+        scared_speed: float = FOX_SCARED_SPEED,
+    ):
+        """
+        Initialize actors at their spawn points, in SCATTER state.
+
+        Args:
+            spawn_x: Spawn X positions in pixels
+            spawn_y: Spawn Y positions in pixels
+            rng: Random source (defaults to a new unseeded one)
+            radius: Collision radius in pixels
+            speed: Normal speed in pixels per tick
+            scared_speed: Speed while frightened
+        """
+        self.count = len(spawn_x)
+        self.spawn_x = np.array(spawn_x, dtype=np.float64)
+        self.spawn_y = np.array(spawn_y, dtype=np.float64)
+        self.x = self.spawn_x.copy()
+        self.y = self.spawn_y.copy()
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.change_x = np.zeros(self.count)
+        self.change_y = np.zeros(self.count)
+        self.direction = np.zeros(self.count, dtype=np.int8)
+        self.state = np.full(self.count, SCATTER, dtype=np.int8)
+        self.speed = np.full(self.count, float(speed))
+        self.radius = radius
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self._normal_speed = speed
+        self._probe_x = (
+            np.array([[radius], [0], [-radius], [0]], dtype=np.float64) + TILE_SIZE
+        )
+        self._probe_y = (
+            np.array([[0], [radius], [0], [-radius]], dtype=np.float64) + TILE_SIZE
+        )
+        self._scared_speed = scared_speed
+
+        # Home corner defaults to the spawn tile until assigned
+        self._spawn_tile_x = (self.spawn_x // TILE_SIZE).astype(np.int64)
+        self._spawn_tile_y = (self.spawn_y // TILE_SIZE).astype(np.int64)
+        self.scatter_x = self._spawn_tile_x.copy()
+        self.scatter_y = self._spawn_tile_y.copy()
+
+        # Tile index (y * width + x) of the last direction decision
+        self._decision_tile = np.full(self.count, -1, dtype=np.int64)
+        self._everyone = np.ones(self.count, dtype=bool)
+
+        # Maze arrays, rebuilt when the maze or its layout changes
+        self._maze = None
+        self._maze_revision = -1
+        self._open = None
+        self._padded_walls = None
+        self._tile_ids = None
+        self._distances = None
+        self._next_hops = None
+        # Flow fields per home tile (x, y), used when there is no table
+        self._home_fields: Dict[Tuple[int, int], FlowField] = {}
+
+    def set_state(self, actors, state: int):
+        """
+        State transition kernel: move actors to a new state.
+
+        Args:
+            actors: Index array, boolean mask or single index
+            state: New state code
+        """
+        self.state[actors] = state
+        self.speed[actors] = (
+            self._scared_speed if state == FRIGHTENED else self._normal_speed
+        )
+
+    def respawn(self, actors):
+        """
+        Reset kernel: put actors back on their spawn points, in SCATTER.
+
+        Args:
+            actors: Index array, boolean mask or single index
+        """
+        self.x[actors] = self.spawn_x[actors]
+        self.y[actors] = self.spawn_y[actors]
+        self.prev_x[actors] = self.spawn_x[actors]
+        self.prev_y[actors] = self.spawn_y[actors]
+        self.change_x[actors] = 0
+        self.change_y[actors] = 0
+        self.direction[actors] = 0
+        self._decision_tile[actors] = -1
+        self.set_state(actors, SCATTER)
+
+    def frighten(self, frightened: bool):
+        """
+        Start or end power mode for every actor.
+
+        Eaten actors keep heading home either way; when power mode ends,
+        frightened actors go back to chasing.
+
+        Args:
+            frightened: True to frighten, False to calm down
+        """
+        if frightened:
+            self.set_state(self.state != EATEN, FRIGHTENED)
+        else:
+            self.set_state(self.state == FRIGHTENED, CHASE)
+
+    def colliding(self, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        Collision kernel: actors overlapping a circle.
+
+        Args:
+            x: Circle centre X in pixels
+            y: Circle centre Y in pixels
+            radius: Circle radius in pixels
+
+        Returns:
+            Indices of the overlapping actors, in order
+        """
+        dx = self.x - x
+        dy = self.y - y
+        reach = self.radius + radius
+        return np.flatnonzero(dx * dx + dy * dy < reach * reach)
+
+    def _sync_maze(self, maze):
+        """Refresh the cached maze arrays if the maze changed."""
+        if maze is self._maze and maze.revision == self._maze_revision:
+            return
+        self._maze = maze
+        self._maze_revision = maze.revision
+        self._home_fields.clear()
+        neighbours = np.frombuffer(maze.neighbours, dtype=np.uint8)
+        self._open = neighbours & _OPEN_BITS
+        # Walls have a zero byte; one tile of wall around the maze
+        self._padded_walls = np.pad(
+            (neighbours == 0).reshape(maze.height, maze.width), 1, constant_values=True
+        ).ravel()
+        table = maze.distance_table
+        if table is None:
+            self._tile_ids = self._distances = self._next_hops = None
+        else:
+            count = table.count
+            self._tile_ids = np.frombuffer(table.tile_ids, dtype=np.int32)
+            self._distances = np.frombuffer(table.distances, dtype=np.uint16).reshape(
+                count, count
+            )
+            self._next_hops = np.frombuffer(table.next_hops, dtype=np.uint8).reshape(
+                count, count
+            )
+
+    def _tiles(
+        self, maze, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Tiles under actor centres (always inside the maze).
+
+        Returns:
+            Tuple of (tile_x, tile_y, tile index y * width + x)
+        """
+        # Positions are not negative, so truncating is flooring (and much
+        # faster than // on floats)
+        tile_x = (x / TILE_SIZE).astype(np.int64)
+        tile_y = (y / TILE_SIZE).astype(np.int64)
+        return tile_x, tile_y, tile_y * maze.width + tile_x
+
+    def _can_move_to(self, maze, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Check the 4 points at the actors' radius around new positions.
+
+        The radius is less than a tile, so a point is at most one tile
+        outside the maze, which the padded wall grid covers.
+        """
+        # Probe offsets right, up, left, down; shifted by one tile into
+        # padded grid coordinates, which are never negative
+        probe_x = x + self._probe_x
+        probe_y = y + self._probe_y
+        index = (probe_y / TILE_SIZE).astype(np.int64) * (maze.width + 2) + (
+            probe_x / TILE_SIZE
+        ).astype(np.int64)
+        return ~self._padded_walls[index].any(axis=0)
+
+    def _random_turn(
+        self, actors: np.ndarray, open_mask: np.ndarray, speed: np.ndarray
+    ):
+        """
+        Send actors in a random open direction (boxed-in ones keep theirs).
+
+        Args:
+            actors: Actor indices
+            open_mask: Open-direction masks of their tiles
+            speed: Their speeds
+        """
+        has_exit = open_mask != 0
+        actors, open_mask, speed = (
+            actors[has_exit],
+            open_mask[has_exit],
+            speed[has_exit],
+        )
+        # 12 is a multiple of every count, so each option is equally likely
+        draw = self.rng.integers(0, 12, size=len(actors))
+        self._head(actors, _CHOICES[open_mask, draw % _CHOICE_COUNTS[open_mask]], speed)
+
+    def _head(self, actors: np.ndarray, direction: np.ndarray, speed: np.ndarray):
+        """Set direction and velocity of actors."""
+        self.direction[actors] = direction
+        self.change_x[actors] = _DX[direction] * speed
+        self.change_y[actors] = _DY[direction] * speed
+
+    def update(
+        self, maze, chicken_x, chicken_y, chicken_field: Optional[FlowField] = None
+    ):
+        """
+        Movement kernel: advance every actor by one tick.
+
+        Actors with a pathfinding source for their state pick a direction
+        once per tile, at the tile centre: chase the chicken, flee to the
+        neighbour furthest from it, or head for their home corner / spawn.
+        The chicken's flow field and the maze's distance table give the
+        same directions (both come from a BFS rooted at the target), so
+        either can serve chasing and fleeing. Going home uses the table,
+        or on mazes too big for one a flow field per home tile. Actors
+        without a source wander, turning at walls and now and then at
+        junctions.
+
+        Args:
+            maze: The Maze object
+            chicken_x: Chicken X position, or one per actor (e.g. actors
+                of several games, each with its own chicken)
+            chicken_y: Chicken Y position, or one per actor
+            chicken_field: Shared flow field rooted at the chicken's tile
+                (single chicken only)
+        """
+        if not self.count:
+            return
+        self._sync_maze(maze)
+        x, y = self.x, self.y
+        self.prev_x[:] = x
+        self.prev_y[:] = y
+        speed = self.speed.copy()
+
+        # The table serves every state, the chicken's field chasing and
+        # fleeing; home tiles always have a table or field of their own
+        if self._next_hops is not None or chicken_field is not None:
+            guided = self._everyone
+        else:
+            state = self.state
+            guided = (state == SCATTER) | (state == EATEN)
+
+        self._decide(maze, guided, speed, chicken_x, chicken_y, chicken_field)
+
+        new_x = x + self.change_x
+        new_y = y + self.change_y
+        movable = self._can_move_to(maze, new_x, new_y)
+        np.copyto(x, new_x, where=movable)
+        np.copyto(y, new_y, where=movable)
+
+        wandering = ~guided
+        if np.count_nonzero(wandering):
+            self._wander(maze, wandering, movable, speed)
+
+    def _decide(
+        self,
+        maze,
+        guided: np.ndarray,
+        speed: np.ndarray,
+        chicken_x,
+        chicken_y,
+        chicken_field: Optional[FlowField],
+    ):
+        """
+        Pick new directions for guided actors that reached a tile centre.
+
+        Args:
+            maze: The Maze object
+            guided: Mask of the actors with a pathfinding source
+            speed: Actor speeds
+            chicken_x: Chicken X position, or one per actor
+            chicken_y: Chicken Y position, or one per actor
+            chicken_field: Shared flow field rooted at the chicken's tile
+        """
+        x, y = self.x, self.y
+        tile_x, tile_y, index = self._tiles(maze, x, y)
+        centre_x = tile_x * TILE_SIZE + TILE_SIZE // 2
+        centre_y = tile_y * TILE_SIZE + TILE_SIZE // 2
+        deciding = (
+            guided
+            & (index != self._decision_tile)
+            & (np.abs(x - centre_x) <= speed)
+            & (np.abs(y - centre_y) <= speed)
+        )
+        # count_nonzero is much cheaper than any() on small arrays
+        if not np.count_nonzero(deciding):
+            return
+
+        actors = np.flatnonzero(deciding)
+        speed = speed[deciding]
+        tile_x, tile_y, index = tile_x[deciding], tile_y[deciding], index[deciding]
+        # Snap to the centre so the actor fits the corridor after turning
+        self.x[actors] = centre_x[deciding]
+        self.y[actors] = centre_y[deciding]
+        self._decision_tile[actors] = index
+
+        # Home corner visited / back at spawn - start hunting
+        state = self.state[actors]
+        scatter = state == SCATTER
+        eaten = state == EATEN
+        home_x = np.where(scatter, self.scatter_x[actors], self._spawn_tile_x[actors])
+        home_y = np.where(scatter, self.scatter_y[actors], self._spawn_tile_y[actors])
+        arrived = (scatter | eaten) & (tile_x == home_x) & (tile_y == home_y)
+        if arrived.any():
+            self.set_state(actors[arrived], CHASE)
+            state = self.state[actors]
+        going_home = (state == SCATTER) | (state == EATEN)
+        chasing = state == CHASE
+        fleeing = state == FRIGHTENED
+
+        # Chicken tile index per deciding actor
+        chicken_index = np.floor_divide(chicken_y, TILE_SIZE).astype(
+            np.int64
+        ) * maze.width + np.floor_divide(chicken_x, TILE_SIZE).astype(np.int64)
+        if chicken_index.ndim:
+            chicken_index = chicken_index[actors]
+        else:
+            chicken_index = np.full(len(actors), chicken_index, dtype=np.int64)
+
+        direction = np.full(len(actors), NO_DIRECTION, dtype=np.int64)
+        open_mask = self._open[index]
+        if chicken_field is not None:
+            toward = np.frombuffer(chicken_field.toward, dtype=np.uint8)
+            direction[chasing] = toward[index[chasing]]
+            if fleeing.any():
+                direction[fleeing] = self._flee_field(
+                    maze, chicken_field, index[fleeing], open_mask[fleeing]
+                )
+            by_table = going_home
+        else:
+            if fleeing.any():
+                direction[fleeing] = self._flee_table(
+                    maze, index[fleeing], chicken_index[fleeing], open_mask[fleeing]
+                )
+            by_table = ~fleeing
+
+        if self._next_hops is None:
+            if going_home.any():
+                direction[going_home] = self._head_home(
+                    maze, index[going_home], home_x[going_home], home_y[going_home]
+                )
+        elif by_table.any():
+            goal_index = np.where(
+                going_home, home_y * maze.width + home_x, chicken_index
+            )[by_table]
+            tile_ids = self._tile_ids
+            start = tile_ids[index[by_table]]
+            goal = tile_ids[goal_index]
+            hops = np.full(len(start), NO_DIRECTION, dtype=np.int64)
+            known = (start >= 0) & (goal >= 0)
+            hops[known] = self._next_hops[start[known], goal[known]]
+            direction[by_table] = hops
+
+        # Standing on the target or it can't be reached
+        lost = direction == NO_DIRECTION
+        if lost.any():
+            self._random_turn(actors[lost], open_mask[lost], speed[lost])
+        found = ~lost
+        self._head(actors[found], direction[found], speed[found])
+
+    def _head_home(
+        self, maze, index: np.ndarray, home_x: np.ndarray, home_y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Directions towards home tiles from their flow fields.
+
+        A field is built the first time a home tile is needed and kept
+        until the maze changes; foxes share few home tiles (their corners
+        and spawn points), so there are only a few fields.
+
+        Args:
+            maze: The Maze object
+            index: Tile indices of the actors
+            home_x: Home tile X per actor
+            home_y: Home tile Y per actor
+
+        Returns:
+            Direction per actor, NO_DIRECTION at home and where home
+            can't be reached
+        """
+        direction = np.full(len(index), NO_DIRECTION, dtype=np.int64)
+        homes = np.stack((home_x, home_y), axis=1)
+        for home in np.unique(homes, axis=0):
+            tile = (int(home[0]), int(home[1]))
+            field = self._home_fields.get(tile)
+            if field is None:
+                field = FlowField(maze, *tile)
+                self._home_fields[tile] = field
+            toward = np.frombuffer(field.toward, dtype=np.uint8)
+            same = (homes == home).all(axis=1)
+            direction[same] = toward[index[same]]
+        return direction
+
+    @staticmethod
+    def _furthest(neighbour_distance: np.ndarray, stuck: np.ndarray) -> np.ndarray:
+        """
+        Directions towards the open neighbour furthest from the chicken.
+
+        Like FlowField.flee_direction: ties go to the lowest direction.
+
+        Args:
+            neighbour_distance: Distance to the chicken per actor and
+                direction, -1 for walls and unreachable neighbours
+            stuck: Actors that can't reach the chicken (nothing to flee)
+
+        Returns:
+            Direction per actor, NO_DIRECTION where there is none
+        """
+        best = np.argmax(neighbour_distance, axis=1)
+        best[stuck | (neighbour_distance.max(axis=1) < 0)] = NO_DIRECTION
+        return best
+
+    def _flee_field(
+        self, maze, chicken_field: FlowField, index: np.ndarray, open_mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Flee directions from the chicken's flow field.
+
+        Args:
+            maze: The Maze object
+            chicken_field: Flow field rooted at the chicken's tile
+            index: Tile indices of the fleeing actors
+            open_mask: Open-direction masks of those tiles
+
+        Returns:
+            Direction per actor
+        """
+        distances = np.frombuffer(chicken_field.distances, dtype=np.uint32)
+        offsets = _DX + _DY * maze.width
+        neighbour_distance = np.full((len(index), 4), -1, dtype=np.int64)
+        for direction in range(4):
+            is_open = ((open_mask >> direction) & 1).astype(bool)
+            distance = distances[index[is_open] + offsets[direction]].astype(np.int64)
+            neighbour_distance[is_open, direction] = np.where(
+                distance == FIELD_UNREACHABLE, -1, distance
+            )
+        return self._furthest(neighbour_distance, distances[index] == FIELD_UNREACHABLE)
+
+    def _flee_table(
+        self, maze, index: np.ndarray, chicken_index: np.ndarray, open_mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Flee directions from the distance table (each actor its own chicken).
+
+        Args:
+            maze: The Maze object
+            index: Tile indices of the fleeing actors
+            chicken_index: Tile indices of their chickens
+            open_mask: Open-direction masks of the actor tiles
+
+        Returns:
+            Direction per actor
+        """
+        tile_ids = self._tile_ids
+        distances = self._distances
+        chicken = tile_ids[chicken_index]
+        offsets = _DX + _DY * maze.width
+        neighbour_distance = np.full((len(index), 4), -1, dtype=np.int64)
+        for direction in range(4):
+            is_open = ((open_mask >> direction) & 1).astype(bool)
+            neighbour = tile_ids[index[is_open] + offsets[direction]]
+            distance = distances[neighbour, chicken[is_open]].astype(np.int64)
+            neighbour_distance[is_open, direction] = np.where(
+                distance == UNREACHABLE, -1, distance
+            )
+        return self._furthest(
+            neighbour_distance, distances[tile_ids[index], chicken] == UNREACHABLE
+        )
+
+    def _wander(
+        self, maze, wandering: np.ndarray, moved: np.ndarray, speed: np.ndarray
+    ):
+        """
+        Turn unguided actors that hit a wall, and now and then at junctions.
+
+        Args:
+            maze: The Maze object
+            wandering: Mask of the actors without a pathfinding source
+            moved: Mask of the actors that moved this tick
+            speed: Actor speeds
+        """
+        _tile_x, _tile_y, index = self._tiles(maze, self.x, self.y)
+        open_mask = self._open[index]
+
+        blocked = wandering & ~moved
+        if np.count_nonzero(blocked):
+            self._random_turn(
+                np.flatnonzero(blocked), open_mask[blocked], speed[blocked]
+            )
+
+        turning = (
+            wandering
+            & _JUNCTION[open_mask]
+            & (self.rng.random(self.count) < WANDER_TURN_CHANCE)
+        )
+        if np.count_nonzero(turning):
+            self._random_turn(
+                np.flatnonzero(turning), open_mask[turning], speed[turning]
+            )
@@ -2,17 +2,30 @@
 Collectible items (seeds, super seeds, bonuses).
 """
 
-import arcade
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 from pacman.utils.constants import (
     TILE_SIZE,
-    COLOR_SEED,
-    COLOR_SUPER_SEED,
     SEED_POINTS,
-    SUPER_SEED_POINTS
+    SUPER_SEED_POINTS,
+    SEED_RADIUS,
+    SUPER_SEED_RADIUS
 )
+from pacman.utils.event_log import get_logger
 
 
+log = get_logger(__name__)
+
+
+# Seed types stored in the SeedField type plane
+SEED_NONE = 0
+SEED_REGULAR = 1
+SEED_SUPER = 2
+
+SEED_TYPE_POINTS = {SEED_REGULAR: SEED_POINTS, SEED_SUPER: SUPER_SEED_POINTS}
+
+# Number of set bits for every byte value, used with bytes.translate()
+_POPCOUNT_TABLE = bytes(bin(value).count("1") for value in range(256))
+
 class Seed:
     """
     Represents a small seed to collect.
@@ -36,19 +49,10 @@ class Seed:
         self.y = y
         self.collected = False
         self.points = SEED_POINTS
-        self.radius = 3  # Small seed
-        
-    def draw(self):
-        """Draw the seed if not collected."""
-        if not self.collected:
-            arcade.draw_circle_filled(
-                self.x,
-                self.y,
-                self.radius,
-                COLOR_SEED
-            )
-    
-    def check_collision(self, chicken_x: float, chicken_y: float, chicken_radius: float) -> bool:
+        self.radius = SEED_RADIUS  # Small seed
+        
+    def check_collision(self, chicken_x: float, chicken_y: float,
+                        chicken_radius: float) -> bool:
         """
         Check if chicken collides with this seed.
         
@@ -63,12 +67,11 @@ class Seed:
         if self.collected:
             return False
         
-        # Simple distance check
+        # Simple distance check (squared, no square root needed)
         dx = self.x - chicken_x
         dy = self.y - chicken_y
-        distance = (dx * dx + dy * dy) ** 0.5
         
-        if distance < chicken_radius:
+        if dx * dx + dy * dy < chicken_radius * chicken_radius:
             self.collected = True
             return True
         
@@ -90,39 +93,221 @@ class SuperSeed(Seed):
         """
         super().__init__(x, y)
         self.points = SUPER_SEED_POINTS
-        self.radius = 8  # Larger than normal seed
-        self.blink_timer = 0
-        
-    def draw(self):
-        """Draw the super seed with blinking effect."""
-        if not self.collected:
-            # Blink effect - visible/invisible based on timer
-            import time
-            self.blink_timer = time.time()
+        self.radius = SUPER_SEED_RADIUS  # Larger than normal seed
+        
+class SeedField:
+    """
+    Compact per-tile seed storage.
+    
+    Instead of one Python object per seed, the field keeps a seed-type
+    plane (one byte per tile) and a presence bitmask (one bit per tile).
+    Tile (x, y) has index y * width + x; pixel positions are computed
+    from the index, so nothing else is stored per seed.
+    
+    Attributes:
+        width: Width in tiles
+        height: Height in tiles
+        kinds: Seed type per tile (SEED_NONE, SEED_REGULAR, SEED_SUPER)
+        present: Bitmask of uncollected seeds
+    """
+    
+    def __init__(self, width: int, height: int):
+        """
+        Initialize an empty seed field.
+        
+        Args:
+            width: Width in tiles
+            height: Height in tiles
+        """
+        self.width = width
+        self.height = height
+        
+        size = width * height
+        self.kinds = bytearray(size)
+        self.present = bytearray((size + 7) // 8)
+        
+        # Presence bits per seed type, used for reset() and count()
+        self._type_bits = {
+            SEED_REGULAR: bytearray(len(self.present)),
+            SEED_SUPER: bytearray(len(self.present)),
+        }
+    
+    def place(self, tile_x: int, tile_y: int, kind: int):
+        """
+        Put an uncollected seed on a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            kind: SEED_REGULAR or SEED_SUPER
+        """
+        index = tile_y * self.width + tile_x
+        self.kinds[index] = kind
+        self.present[index >> 3] |= 1 << (index & 7)
+        self._type_bits[kind][index >> 3] |= 1 << (index & 7)
+    
+    def kind_at(self, tile_x: int, tile_y: int) -> int:
+        """
+        Get the type of the uncollected seed on a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
             
-            # Blink every 0.3 seconds (visible for 0.15s, hidden for 0.15s)
-            if int(self.blink_timer * 3) % 2 == 0:
-                arcade.draw_circle_filled(
-                    self.x,
-                    self.y,
-                    self.radius,
-                    COLOR_SUPER_SEED
-                )
+        Returns:
+            Seed type, or SEED_NONE if there is no uncollected seed
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return SEED_NONE
+        
+        index = tile_y * self.width + tile_x
+        if self.present[index >> 3] & (1 << (index & 7)):
+            return self.kinds[index]
+        return SEED_NONE
+    
+    def collect(self, tile_x: int, tile_y: int) -> int:
+        """
+        Collect the seed on a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            Type of the collected seed, or SEED_NONE if nothing was there
+        """
+        kind = self.kind_at(tile_x, tile_y)
+        if kind != SEED_NONE:
+            index = tile_y * self.width + tile_x
+            self.present[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+        return kind
+    
+    def reset(self):
+        """Mark every placed seed as uncollected again."""
+        self.present[:] = self._placed_bits()
+    
+    def count(self, kind: Optional[int] = None) -> int:
+        """
+        Count uncollected seeds.
+        
+        Args:
+            kind: Only count this seed type (default: all types)
+            
+        Returns:
+            Number of uncollected seeds
+        """
+        if kind is None:
+            return sum(self.present.translate(_POPCOUNT_TABLE))
+        
+        bits = (
+            int.from_bytes(self.present, "little")
+            & int.from_bytes(self._type_bits[kind], "little")
+        )
+        return bin(bits).count("1")
+    
+    def count_placed(self, kind: int) -> int:
+        """
+        Count placed seeds of one type, collected or not.
+        
+        Args:
+            kind: SEED_REGULAR or SEED_SUPER
+            
+        Returns:
+            Number of seeds of that type in the field
+        """
+        return self.kinds.count(kind)
+    
+    def iter_tiles(self, kind: Optional[int] = None,
+                   only_present: bool = True) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over tiles holding a seed.
+        
+        Args:
+            kind: Only yield tiles with this seed type (default: all types)
+            only_present: Skip collected seeds
+            
+        Yields:
+            (tile_x, tile_y) tuples
+        """
+        bits = self.present if only_present else self._placed_bits()
+        width = self.width
+        
+        for byte_index, byte in enumerate(bits):
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    index = base + bit
+                    if kind is None or self.kinds[index] == kind:
+                        yield index % width, index // width
+    
+    def _placed_bits(self) -> bytes:
+        """Presence bitmask with every placed seed set."""
+        placed = (
+            int.from_bytes(self._type_bits[SEED_REGULAR], "little")
+            | int.from_bytes(self._type_bits[SEED_SUPER], "little")
+        )
+        return placed.to_bytes(len(self.present), "little")
+    
+    @staticmethod
+    def tile_center(tile_x: int, tile_y: int) -> Tuple[int, int]:
+        """
+        Get the pixel position of the seed on a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            Tuple of (pixel_x, pixel_y)
+        """
+        return (
+            tile_x * TILE_SIZE + TILE_SIZE // 2,
+            tile_y * TILE_SIZE + TILE_SIZE // 2
+        )
 
 
 class SeedManager:
     """
     Manages all collectible seeds in the maze.
+    
+    Seeds always sit at tile centres, so they are stored in a tile-indexed
+    SeedField; collision checks only look at the tiles under the chicken
+    instead of scanning every seed.
+    
+    Attributes:
+        field: Compact seed storage (None until create_seeds_for_maze)
+        seeds_remaining: Number of uncollected regular seeds
+        super_seeds_remaining: Number of uncollected super seeds
+        on_level_complete: Optional callback fired once, when the last
+            seed is collected
+        super_seed_tiles: Tiles that got a super seed (collected or not)
+        collected_tiles: Tiles collected since the seeds were laid out, in
+            collection order (lets cached renderings erase just those tiles)
+        layout_revision: Bumped whenever the seeds are laid out again
+            (create_seeds_for_maze, reset_seeds)
     """
     
     def __init__(self):
         """Initialize the seed manager."""
-        self.seeds: List[Seed] = []
-        self.super_seeds: List[SuperSeed] = []
+        self.field: Optional[SeedField] = None
+        self.super_seed_tiles: List[Tuple[int, int]] = []
+        self.collected_tiles: List[Tuple[int, int]] = []
+        self.layout_revision = 0
+        
+        # Live counters, updated only when a seed is collected
+        self.seeds_remaining = 0
+        self.super_seeds_remaining = 0
+        
+        self.on_level_complete: Optional[Callable[[], None]] = None
         
     def _flood_fill_reachable(self, maze, start_x: int, start_y: int) -> set:
         """
-        Use flood fill algorithm to find all reachable tiles from start position.
+        Find all tiles reachable from the start position.
+        
+        Uses the maze's precomputed connected regions, so no flood fill
+        runs here.
         
         Args:
             maze: The Maze object
@@ -132,57 +317,19 @@ class SeedManager:
         Returns:
             Set of (x, y) tuples representing reachable tiles
         """
-        reachable = set()
-        to_visit = [(start_x, start_y)]
-        
-        while to_visit:
-            x, y = to_visit.pop()
-            
-            # Skip if already visited or out of bounds
-            if (x, y) in reachable:
-                continue
-            if x < 0 or x >= maze.width or y < 0 or y >= maze.height:
-                continue
-            
-            # Skip if wall
-            if maze.grid[y][x] == 1:
-                continue
-            
-            # Mark as reachable
-            reachable.add((x, y))
-            
-            # Add neighbors to visit (4-directional)
-            to_visit.append((x + 1, y))  # Right
-            to_visit.append((x - 1, y))  # Left
-            to_visit.append((x, y + 1))  # Up
-            to_visit.append((x, y - 1))  # Down
-        
-        return reachable
+        return set(maze.component_tiles(start_x, start_y))
         
-    def create_seeds_for_maze(self, maze, start_x: int = None, start_y: int = None):
+    def _find_corner_tiles(self, maze, reachable_tiles: set) -> set:
         """
-        Create seeds only for reachable spaces in the maze.
-        Uses flood fill algorithm to detect reachable areas.
+        Pick one super seed tile per quadrant, as far out as possible.
         
         Args:
             maze: The Maze object
-            start_x: Starting tile X (defaults to center)
-            start_y: Starting tile Y (defaults to center)
+            reachable_tiles: Set of reachable (x, y) tiles
+            
+        Returns:
+            Set of (x, y) tiles for super seeds
         """
-        self.seeds.clear()
-        self.super_seeds.clear()
-        
-        # Default start position is center of maze
-        if start_x is None:
-            start_x = maze.width // 2
-        if start_y is None:
-            start_y = maze.height // 2
-        
-        # Find all reachable tiles using flood fill
-        print(f"🧠 Running flood fill from tile ({start_x}, {start_y})...")
-        reachable_tiles = self._flood_fill_reachable(maze, start_x, start_y)
-        print(f"✓ Found {len(reachable_tiles)} reachable tiles")
-        
         # Find corner tiles for super seeds (furthest from center in each quadrant)
         corner_candidates = {
             'bottom_left': None,
@@ -238,30 +385,116 @@ class SeedManager:
         for corner_name, corner_pos in corner_candidates.items():
             if corner_pos is not None:
                 corner_positions.add(corner_pos)
-                print(f"  🌟 Super seed at {corner_name}: {corner_pos}")
+                log.debug("  🌟 Super seed at %s: %s", corner_name, corner_pos)
+        
+        return corner_positions
+    
+    def create_seeds_for_maze(
+            self, maze, start_x: int = None, start_y: int = None,
+            reachable_tiles: Optional[Iterable[Tuple[int, int]]] = None,
+            super_seed_tiles: Optional[Iterable[Tuple[int, int]]] = None):
+        """
+        Create seeds only for reachable spaces in the maze.
+        Uses the maze's connected regions to detect reachable areas.
+        
+        Args:
+            maze: The Maze object
+            start_x: Starting tile X (defaults to center)
+            start_y: Starting tile Y (defaults to center)
+            reachable_tiles: Precomputed reachable tiles (e.g. from a
+                compiled level), skips the flood fill
+            super_seed_tiles: Super seed positions set by the level,
+                skips picking the quadrant corners
+        """
+        self.field = SeedField(maze.width, maze.height)
+        self.collected_tiles.clear()
+        self.layout_revision += 1
+        
+        # Default start position is center of maze
+        if start_x is None:
+            start_x = maze.width // 2
+        if start_y is None:
+            start_y = maze.height // 2
+        
+        if reachable_tiles is None:
+            # Find all reachable tiles using flood fill
+            log.debug("🧠 Finding tiles reachable from (%d, %d)...", start_x, start_y)
+            reachable_tiles = self._flood_fill_reachable(maze, start_x, start_y)
+            log.debug("✓ Found %d reachable tiles", len(reachable_tiles))
+        else:
+            reachable_tiles = set(reachable_tiles)
+        
+        if super_seed_tiles is None:
+            corner_positions = self._find_corner_tiles(maze, reachable_tiles)
+        else:
+            corner_positions = set(super_seed_tiles)
         
         # Create seeds only on reachable tiles
         for tile_x, tile_y in reachable_tiles:
-            # Calculate center of tile
-            pixel_x = tile_x * TILE_SIZE + TILE_SIZE // 2
-            pixel_y = tile_y * TILE_SIZE + TILE_SIZE // 2
-            
             # Check if this is a corner position for super seed
             if (tile_x, tile_y) in corner_positions:
-                self.super_seeds.append(SuperSeed(pixel_x, pixel_y))
+                self.field.place(tile_x, tile_y, SEED_SUPER)
             else:
-                self.seeds.append(Seed(pixel_x, pixel_y))
+                self.field.place(tile_x, tile_y, SEED_REGULAR)
         
-        print(f"🌾 Created {len(self.seeds)} seeds and {len(self.super_seeds)} super seeds (only on reachable tiles)")
+        self.super_seed_tiles = sorted(self.field.iter_tiles(SEED_SUPER))
+        self.seeds_remaining = self.field.count_placed(SEED_REGULAR)
+        self.super_seeds_remaining = self.field.count_placed(SEED_SUPER)
+        
+        log.info("🌾 Created %d seeds and %d super seeds (only on reachable tiles)",
+                 self.seeds_remaining, self.super_seeds_remaining)
+    
+    def reset_seeds(self):
+        """Put every collected seed back (e.g. to replay the same level)."""
+        self.field.reset()
+        self.collected_tiles.clear()
+        self.layout_revision += 1
+        self.seeds_remaining = self.field.count(SEED_REGULAR)
+        self.super_seeds_remaining = self.field.count(SEED_SUPER)
     
-    def draw(self):
-        """Draw all seeds and super seeds."""
-        for seed in self.seeds:
-            seed.draw()
-        for super_seed in self.super_seeds:
-            super_seed.draw()
+    @property
+    def seeds(self) -> List[Seed]:
+        """
+        Regular seeds as Seed objects (snapshot, not for per-frame use).
+        
+        Returns:
+            List of Seed objects, collected ones included
+        """
+        return self._build_seed_objects(SEED_REGULAR, Seed)
     
-    def check_collisions(self, chicken_x: float, chicken_y: float, chicken_radius: float) -> tuple[int, bool]:
+    @property
+    def super_seeds(self) -> List[SuperSeed]:
+        """
+        Super seeds as SuperSeed objects (snapshot, not for per-frame use).
+        
+        Returns:
+            List of SuperSeed objects, collected ones included
+        """
+        return self._build_seed_objects(SEED_SUPER, SuperSeed)
+    
+    def _build_seed_objects(self, kind: int, seed_class) -> list:
+        """
+        Materialize seeds of one type from the field.
+        
+        Args:
+            kind: SEED_REGULAR or SEED_SUPER
+            seed_class: Seed or SuperSeed
+            
+        Returns:
+            List of seed objects
+        """
+        if self.field is None:
+            return []
+        
+        seeds = []
+        for tile_x, tile_y in self.field.iter_tiles(kind, only_present=False):
+            seed = seed_class(*self.field.tile_center(tile_x, tile_y))
+            seed.collected = self.field.kind_at(tile_x, tile_y) == SEED_NONE
+            seeds.append(seed)
+        return seeds
+    
+    def check_collisions(self, chicken_x: float, chicken_y: float,
+                         chicken_radius: float) -> tuple[int, bool]:
         """
         Check collisions with chicken and return points earned.
         
@@ -276,16 +509,41 @@ class SeedManager:
         points = 0
         ate_super_seed = False
         
-        # Check regular seeds
-        for seed in self.seeds:
-            if seed.check_collision(chicken_x, chicken_y, chicken_radius):
-                points += seed.points
+        if self.field is None:
+            return points, ate_super_seed
+        
+        # Only tiles overlapped by the chicken's bounding box can hold a
+        # seed within its radius
+        min_tile_x = int((chicken_x - chicken_radius) // TILE_SIZE)
+        max_tile_x = int((chicken_x + chicken_radius) // TILE_SIZE)
+        min_tile_y = int((chicken_y - chicken_radius) // TILE_SIZE)
+        max_tile_y = int((chicken_y + chicken_radius) // TILE_SIZE)
+        
+        radius_squared = chicken_radius * chicken_radius
+        
+        for tile_y in range(min_tile_y, max_tile_y + 1):
+            for tile_x in range(min_tile_x, max_tile_x + 1):
+                if self.field.kind_at(tile_x, tile_y) == SEED_NONE:
+                    continue
+                
+                # Simple distance check (squared, no square root needed)
+                seed_x, seed_y = self.field.tile_center(tile_x, tile_y)
+                dx = seed_x - chicken_x
+                dy = seed_y - chicken_y
+                if dx * dx + dy * dy >= radius_squared:
+                    continue
+                
+                kind = self.field.collect(tile_x, tile_y)
+                self.collected_tiles.append((tile_x, tile_y))
+                points += SEED_TYPE_POINTS[kind]
+                if kind == SEED_SUPER:
+                    ate_super_seed = True
+                    self.super_seeds_remaining -= 1
+                else:
+                    self.seeds_remaining -= 1
         
-        # Check super seeds
-        for super_seed in self.super_seeds:
-            if super_seed.check_collision(chicken_x, chicken_y, chicken_radius):
-                points += super_seed.points
-                ate_super_seed = True
+        if points > 0 and self.all_seeds_collected() and self.on_level_complete:
+            self.on_level_complete()
         
         return points, ate_super_seed
     
@@ -296,9 +554,7 @@ class SeedManager:
         Returns:
             Number of seeds not yet collected
         """
-        count = sum(1 for seed in self.seeds if not seed.collected)
-        count += sum(1 for super_seed in self.super_seeds if not super_seed.collected)
-        return count
+        return self.seeds_remaining + self.super_seeds_remaining
     
     def all_seeds_collected(self) -> bool:
         """
@@ -307,4 +563,4 @@ class SeedManager:
         Returns:
             True if all seeds collected
         """
-        return self.get_remaining_seeds() == 0
+        return self.seeds_remaining == 0 and self.super_seeds_remaining == 0
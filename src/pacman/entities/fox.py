@@ -1,18 +1,17 @@
 """
 Fox entities and AI.
-Handles fox behavior, pathfinding, and states.
+Foxes live in an array-backed ActorStore (see pacman.entities.actors);
+FoxManager and Fox are views over it.
 """
 
-import arcade
 import random
-from enum import Enum
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+import numpy as np
+from pacman.entities.actors import ActorStore, FoxState, STATES, STATE_CODES
+from pacman.utils.pathfinding import FlowField
+from pacman.utils.event_log import get_logger
 from pacman.utils.constants import (
     TILE_SIZE,
-    FOX_SPEED,
-    FOX_SCARED_SPEED,
-    FOX_SIZE,
-    COLOR_FOX_SCARED,
     COLOR_FOX_RUSTY,
     COLOR_FOX_GINGER,
     COLOR_FOX_COPPER,
@@ -20,261 +19,142 @@ from pacman.utils.constants import (
 )
 
 
-class FoxState(Enum):
-    """Fox AI states."""
-    CHASE = "chase"       # Actively hunting chicken
-    SCATTER = "scatter"   # Moving to home corner
-    FRIGHTENED = "frightened"  # Running away (blue)
-    EATEN = "eaten"       # Returning to spawn after being eaten
+log = get_logger(__name__)
 
 
 class Fox:
     """
-    Base fox class with AI and pathfinding.
+    One fox: a view of its row in the FoxManager's ActorStore.
     
     Attributes:
+        store: The ActorStore holding the fox's data
+        index: The fox's row in the store
+        name: Fox name (Rusty, Ginger, Copper, Amber)
+        base_color: Fox color
         center_x: X position in pixels
         center_y: Y position in pixels
-        name: Fox name (Rusty, Ginger, Copper, Amber)
-        color: Fox color
         state: Current AI state
+        scatter_tile_x: Home corner tile X used in SCATTER state
+        scatter_tile_y: Home corner tile Y used in SCATTER state
     """
     
-    def __init__(self, x: float, y: float, name: str, color: Tuple[int, int, int]):
+    def __init__(self, store: ActorStore, index: int, name: str,
+                 color: Tuple[int, int, int]):
         """
-        Initialize a fox.
+        Initialize a fox view.
         
         Args:
-            x: Starting x position in pixels
-            y: Starting y position in pixels
+            store: The ActorStore holding the fox
+            index: The fox's row in the store
             name: Fox name
             color: RGB color tuple
         """
-        # Position
-        self.center_x = x
-        self.center_y = y
-        
-        # Identity
+        self.store = store
+        self.index = index
         self.name = name
         self.base_color = color
-        self.color = color
-        
-        # Movement
-        self.speed = FOX_SPEED
-        self.change_x = 0
-        self.change_y = 0
-        self.direction = 0  # 0=right, 1=up, 2=left, 3=down
-        
-        # AI State
-        self.state = FoxState.SCATTER
-        
-        # Size
-        self.radius = FOX_SIZE // 2
-        
-        # Spawn point (for returning after eaten)
-        self.spawn_x = x
-        self.spawn_y = y
-        
-        # Target tile for pathfinding
-        self.target_tile_x = 0
-        self.target_tile_y = 0
-        
-    def draw(self):
-        """Draw the fox."""
-        # Use scared color if frightened, otherwise base color
-        if self.state == FoxState.FRIGHTENED:
-            draw_color = COLOR_FOX_SCARED
-        elif self.state == FoxState.EATEN:
-            # Draw as eyes only (white circles)
-            arcade.draw_circle_filled(
-                self.center_x - 5,
-                self.center_y + 3,
-                3,
-                arcade.color.WHITE
-            )
-            arcade.draw_circle_filled(
-                self.center_x + 5,
-                self.center_y + 3,
-                3,
-                arcade.color.WHITE
-            )
-            return
-        else:
-            draw_color = self.base_color
-        
-        # Draw fox body (circle for now)
-        arcade.draw_circle_filled(
-            self.center_x,
-            self.center_y,
-            self.radius,
-            draw_color
-        )
-        
-        # Draw eyes
-        arcade.draw_circle_filled(
-            self.center_x - 5,
-            self.center_y + 3,
-            3,
-            arcade.color.WHITE
-        )
-        arcade.draw_circle_filled(
-            self.center_x + 5,
-            self.center_y + 3,
-            3,
-            arcade.color.WHITE
-        )
-        
-        # Draw pupils based on direction
-        pupil_offset = 2
-        if self.direction == 0:  # Right
-            pupil_x_offset = pupil_offset
-            pupil_y_offset = 0
-        elif self.direction == 1:  # Up
-            pupil_x_offset = 0
-            pupil_y_offset = pupil_offset
-        elif self.direction == 2:  # Left
-            pupil_x_offset = -pupil_offset
-            pupil_y_offset = 0
-        else:  # Down
-            pupil_x_offset = 0
-            pupil_y_offset = -pupil_offset
-        
-        arcade.draw_circle_filled(
-            self.center_x - 5 + pupil_x_offset,
-            self.center_y + 3 + pupil_y_offset,
-            2,
-            arcade.color.BLACK
-        )
-        arcade.draw_circle_filled(
-            self.center_x + 5 + pupil_x_offset,
-            self.center_y + 3 + pupil_y_offset,
-            2,
-            arcade.color.BLACK
-        )
     
-    def update(self, maze, chicken_x: float, chicken_y: float):
-        """
-        Update fox AI and position.
-        
-        Args:
-            maze: The Maze object
-            chicken_x: Chicken X position
-            chicken_y: Chicken Y position
-        """
-        # Adjust speed based on state
-        if self.state == FoxState.FRIGHTENED:
-            current_speed = FOX_SCARED_SPEED
-        else:
-            current_speed = self.speed
-        
-        # Simple AI for now - just move randomly at intersections
-        # TODO: Implement proper pathfinding
-        self._simple_movement(maze, current_speed)
-        
-    def _simple_movement(self, maze, speed: float):
-        """
-        Simple movement AI - changes direction randomly at intersections.
-        
-        Args:
-            maze: The Maze object
-            speed: Current movement speed
-        """
-        # Calculate new position
-        new_x = self.center_x + self.change_x
-        new_y = self.center_y + self.change_y
-        
-        # Check if we can continue in current direction
-        if self._can_move_to(new_x, new_y, maze):
-            self.center_x = new_x
-            self.center_y = new_y
-        else:
-            # Hit a wall, choose new direction
-            self._choose_new_direction(maze, speed)
-        
-        # At intersections, randomly change direction
-        if self._is_at_intersection(maze) and random.random() < 0.1:
-            self._choose_new_direction(maze, speed)
+    @property
+    def center_x(self) -> float:
+        """X position in pixels."""
+        return float(self.store.x[self.index])
     
-    def _can_move_to(self, x: float, y: float, maze) -> bool:
-        """
-        Check if fox can move to position.
-        
-        Args:
-            x: Target x position
-            y: Target y position
-            maze: Maze object
-            
-        Returns:
-            True if movement is possible
-        """
-        import math
-        
-        # Check 4 points around the circle
-        num_points = 4
-        for i in range(num_points):
-            angle = (2 * math.pi / num_points) * i
-            point_x = x + self.radius * math.cos(angle)
-            point_y = y + self.radius * math.sin(angle)
-            
-            if maze.is_wall_at_pixel(point_x, point_y):
-                return False
-        
-        return True
+    @center_x.setter
+    def center_x(self, value: float):
+        self.store.x[self.index] = value
+    
+    @property
+    def center_y(self) -> float:
+        """Y position in pixels."""
+        return float(self.store.y[self.index])
+    
+    @center_y.setter
+    def center_y(self, value: float):
+        self.store.y[self.index] = value
     
-    def _is_at_intersection(self, maze) -> bool:
+    @property
+    def prev_x(self) -> float:
+        """X position before the last update."""
+        return float(self.store.prev_x[self.index])
+    
+    @property
+    def prev_y(self) -> float:
+        """Y position before the last update."""
+        return float(self.store.prev_y[self.index])
+    
+    @property
+    def change_x(self) -> float:
+        """X velocity in pixels per tick."""
+        return float(self.store.change_x[self.index])
+    
+    @property
+    def change_y(self) -> float:
+        """Y velocity in pixels per tick."""
+        return float(self.store.change_y[self.index])
+    
+    @property
+    def direction(self) -> int:
+        """Direction (0=right, 1=up, 2=left, 3=down)."""
+        return int(self.store.direction[self.index])
+    
+    @property
+    def speed(self) -> float:
+        """Current speed in pixels per tick."""
+        return float(self.store.speed[self.index])
+    
+    @property
+    def radius(self) -> float:
+        """Collision radius in pixels."""
+        return self.store.radius
+    
+    @property
+    def state(self) -> FoxState:
+        """Current AI state."""
+        return STATES[self.store.state[self.index]]
+    
+    @property
+    def spawn_x(self) -> float:
+        """Spawn X in pixels."""
+        return float(self.store.spawn_x[self.index])
+    
+    @property
+    def spawn_y(self) -> float:
+        """Spawn Y in pixels."""
+        return float(self.store.spawn_y[self.index])
+    
+    @property
+    def scatter_tile_x(self) -> int:
+        """Home corner tile X."""
+        return int(self.store.scatter_x[self.index])
+    
+    @scatter_tile_x.setter
+    def scatter_tile_x(self, value: int):
+        self.store.scatter_x[self.index] = value
+    
+    @property
+    def scatter_tile_y(self) -> int:
+        """Home corner tile Y."""
+        return int(self.store.scatter_y[self.index])
+    
+    @scatter_tile_y.setter
+    def scatter_tile_y(self, value: int):
+        self.store.scatter_y[self.index] = value
+        
+    def interpolated_position(self, alpha: float) -> Tuple[float, float]:
         """
-        Check if fox is at an intersection (can turn).
+        Get the render position between the last two simulation ticks.
         
         Args:
-            maze: Maze object
+            alpha: 0.0 = position before the last update, 1.0 = current
             
         Returns:
-            True if at intersection
-        """
-        tile_x = int(self.center_x // TILE_SIZE)
-        tile_y = int(self.center_y // TILE_SIZE)
-        
-        # Check how many directions are open
-        open_directions = 0
-        
-        # Check all 4 directions
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            if not maze.is_wall(tile_x + dx, tile_y + dy):
-                open_directions += 1
-        
-        # Intersection if more than 2 directions are open
-        return open_directions > 2
-    
-    def _choose_new_direction(self, maze, speed: float):
-        """
-        Choose a new valid direction to move.
-        
-        Args:
-            maze: Maze object
-            speed: Movement speed
+            Tuple of (pixel_x, pixel_y)
         """
-        tile_x = int(self.center_x // TILE_SIZE)
-        tile_y = int(self.center_y // TILE_SIZE)
-        
-        # Get all valid directions
-        valid_directions = []
-        
-        # Right
-        if not maze.is_wall(tile_x + 1, tile_y):
-            valid_directions.append((speed, 0, 0))
-        # Left
-        if not maze.is_wall(tile_x - 1, tile_y):
-            valid_directions.append((-speed, 0, 2))
-        # Up
-        if not maze.is_wall(tile_x, tile_y + 1):
-            valid_directions.append((0, speed, 1))
-        # Down
-        if not maze.is_wall(tile_x, tile_y - 1):
-            valid_directions.append((0, -speed, 3))
-        
-        # Choose random valid direction
-        if valid_directions:
-            self.change_x, self.change_y, self.direction = random.choice(valid_directions)
+        prev_x, prev_y = self.prev_x, self.prev_y
+        return (
+            prev_x + (self.center_x - prev_x) * alpha,
+            prev_y + (self.center_y - prev_y) * alpha
+        )
     
     def set_state(self, new_state: FoxState):
         """
@@ -283,15 +163,10 @@ class Fox:
         Args:
             new_state: New FoxState
         """
-        self.state = new_state
-        
-        # Adjust speed based on new state
-        if new_state == FoxState.FRIGHTENED:
-            self.speed = FOX_SCARED_SPEED
-        else:
-            self.speed = FOX_SPEED
+        self.store.set_state(self.index, STATE_CODES[new_state])
     
-    def check_collision_with_chicken(self, chicken_x: float, chicken_y: float, chicken_radius: float) -> bool:
+    def check_collision_with_chicken(self, chicken_x: float, chicken_y: float,
+                                     chicken_radius: float) -> bool:
         """
         Check if fox collides with chicken.
         
@@ -303,11 +178,12 @@ class Fox:
         Returns:
             True if collision detected
         """
+        # Squared distance check (no square root needed)
         dx = self.center_x - chicken_x
         dy = self.center_y - chicken_y
-        distance = (dx * dx + dy * dy) ** 0.5
+        reach = self.radius + chicken_radius
         
-        return distance < (self.radius + chicken_radius)
+        return dx * dx + dy * dy < reach * reach
     
     def get_tile_position(self) -> Tuple[int, int]:
         """
@@ -321,35 +197,96 @@ class Fox:
         return tile_x, tile_y
 
 
+# Fox names and colors, assigned to spawn points in order
+FOX_IDENTITIES = [
+    ("Rusty", COLOR_FOX_RUSTY),
+    ("Ginger", COLOR_FOX_GINGER),
+    ("Copper", COLOR_FOX_COPPER),
+    ("Amber", COLOR_FOX_AMBER),
+]
+
+
 class FoxManager:
     """
     Manages all foxes in the game.
+    
+    Attributes:
+        store: Array-backed data of every fox (updated in batch)
+        foxes: One Fox view per store row
+        chicken_field: Flow field rooted at the chicken's tile, shared by
+            every chasing and fleeing fox; rebuilt only when the chicken
+            changes tile (or the maze changes)
+        rng: Random source the foxes' NumPy generator is seeded from
     """
     
-    def __init__(self):
-        """Initialize the fox manager."""
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize the fox manager.
+        
+        Args:
+            rng: Random source for the foxes (defaults to a new unseeded one)
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.store = ActorStore([], [])
         self.foxes: List[Fox] = []
+        self.chicken_field: Optional[FlowField] = None
+        
+        # Reused by check_collisions_with_chicken()
+        self._colliding: List[Fox] = []
     
-    def create_foxes(self, maze):
+    def create_foxes(self, maze, spawn_tiles: Optional[List[Tuple[int, int]]] = None):
         """
-        Create all 4 foxes at spawn points.
+        Create one fox per spawn tile.
         
         Args:
             maze: The Maze object
+            spawn_tiles: Spawn tiles from the level (one fox per tile);
+                defaults to the 4 tiles around the maze centre
         """
-        self.foxes.clear()
-        
-        # Calculate center spawn position
-        spawn_x = maze.width // 2 * TILE_SIZE + TILE_SIZE // 2
-        spawn_y = maze.height // 2 * TILE_SIZE + TILE_SIZE // 2
+        self.chicken_field = None
+        
+        if spawn_tiles is None:
+            # Calculate center spawn position
+            center_x = maze.width // 2
+            center_y = maze.height // 2
+            spawn_tiles = [
+                (center_x, center_y + 2),
+                (center_x - 1, center_y),
+                (center_x + 1, center_y),
+                (center_x, center_y - 1),
+            ]
+        
+        spawns = [maze.get_tile_center(*tile) for tile in spawn_tiles]
+        # Same session seed -> same wandering
+        self.store = ActorStore(
+            [spawn_x for spawn_x, _spawn_y in spawns],
+            [spawn_y for _spawn_x, spawn_y in spawns],
+            np.random.default_rng(self.rng.getrandbits(64))
+        )
         
-        # Create 4 foxes with different colors and names
-        self.foxes.append(Fox(spawn_x, spawn_y + TILE_SIZE * 2, "Rusty", COLOR_FOX_RUSTY))
-        self.foxes.append(Fox(spawn_x - TILE_SIZE, spawn_y, "Ginger", COLOR_FOX_GINGER))
-        self.foxes.append(Fox(spawn_x + TILE_SIZE, spawn_y, "Copper", COLOR_FOX_COPPER))
-        self.foxes.append(Fox(spawn_x, spawn_y - TILE_SIZE, "Amber", COLOR_FOX_AMBER))
+        # Create fox views with different colors and names
+        self.foxes = [
+            Fox(self.store, index, *FOX_IDENTITIES[index % len(FOX_IDENTITIES)])
+            for index in range(len(spawns))
+        ]
+        
+        # Each fox scatters to its own corner: top-right, top-left,
+        # bottom-right, bottom-left
+        corners = [
+            (maze.width - 2, maze.height - 2),
+            (1, maze.height - 2),
+            (maze.width - 2, 1),
+            (1, 1),
+        ]
+        for index, fox in enumerate(self.foxes):
+            corner_x, corner_y = corners[index % len(corners)]
+            corner = maze.nearest_reachable_tile(
+                fox.get_tile_position(), corner_x, corner_y
+            )
+            if corner is not None:
+                fox.scatter_tile_x, fox.scatter_tile_y = corner
         
-        print(f"🦊 Created {len(self.foxes)} foxes at spawn")
+        log.info("🦊 Created %d foxes at spawn", len(self.foxes))
     
     def update(self, maze, chicken_x: float, chicken_y: float):
         """
@@ -360,29 +297,28 @@ class FoxManager:
             chicken_x: Chicken X position
             chicken_y: Chicken Y position
         """
-        for fox in self.foxes:
-            fox.update(maze, chicken_x, chicken_y)
-    
-    def draw(self):
-        """Draw all foxes."""
-        for fox in self.foxes:
-            fox.draw()
+        chicken_tile = (int(chicken_x // TILE_SIZE), int(chicken_y // TILE_SIZE))
+        field = self.chicken_field
+        if (field is None or field.root != chicken_tile
+                or field.revision != maze.revision):
+            self.chicken_field = FlowField(maze, *chicken_tile)
+        
+        self.store.update(maze, chicken_x, chicken_y, self.chicken_field)
     
     def set_all_frightened(self, frightened: bool):
         """
         Set all foxes to frightened or normal state.
         
+        Eaten foxes keep heading home, whatever the power mode does;
+        frightened foxes return to chasing when it ends.
+        
         Args:
             frightened: True to frighten all foxes
         """
-        for fox in self.foxes:
-            if frightened:
-                fox.set_state(FoxState.FRIGHTENED)
-            else:
-                # Return to chase or scatter (for now just chase)
-                fox.set_state(FoxState.CHASE)
+        self.store.frighten(frightened)
     
-    def check_collisions_with_chicken(self, chicken_x: float, chicken_y: float, chicken_radius: float) -> List[Fox]:
+    def check_collisions_with_chicken(self, chicken_x: float, chicken_y: float,
+                                      chicken_radius: float) -> List[Fox]:
         """
         Check which foxes collide with chicken.
         
@@ -392,12 +328,11 @@ class FoxManager:
             chicken_radius: Chicken collision radius
             
         Returns:
-            List of foxes that collided
+            List of foxes that collided (reused, valid until the next call)
         """
-        colliding_foxes = []
-        
-        for fox in self.foxes:
-            if fox.check_collision_with_chicken(chicken_x, chicken_y, chicken_radius):
-                colliding_foxes.append(fox)
-        
+        colliding_foxes = self._colliding
+        colliding_foxes.clear()
+        foxes = self.foxes
+        for index in self.store.colliding(chicken_x, chicken_y, chicken_radius):
+            colliding_foxes.append(foxes[index])
         return colliding_foxes
@@ -3,7 +3,7 @@ Player entity (Chickman - the chicken).
 Handles player movement, animation, and state.
 """
 
-import arcade
+import math
 from typing import Tuple
 from pacman.utils.constants import (
     CHICKEN_SIZE,
@@ -14,6 +14,15 @@ from pacman.utils.constants import (
 )
 
 
+# Points around the chicken's outline checked against walls, as unit
+# vectors (x, y) from its centre
+PROBE_POINTS = 8
+PROBE_DIRECTIONS = tuple(
+    (math.cos(angle), math.sin(angle))
+    for angle in ((2 * math.pi / PROBE_POINTS) * i for i in range(PROBE_POINTS))
+)
+
+
 class Player:
     """
     Represents the player character (Chickman - the brave chicken).
@@ -21,7 +30,7 @@ class Player:
     Attributes:
         center_x: X position in pixels
         center_y: Y position in pixels
-        speed: Movement speed in pixels per frame
+        speed: Movement speed in pixels per tick
         direction: Current movement direction (0-3: right, up, left, down)
     """
     
@@ -37,6 +46,10 @@ class Player:
         self.center_x = x
         self.center_y = y
         
+        # Position before the last update (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
+        
         # Movement
         self.speed = CHICKEN_SPEED
         self.change_x = 0
@@ -53,13 +66,19 @@ class Player:
         # Size
         self.radius = CHICKEN_SIZE // 2
         
-    def draw(self):
-        """Draw the chicken as a yellow circle (placeholder for sprite)."""
-        arcade.draw_circle_filled(
-            self.center_x,
-            self.center_y,
-            self.radius,
-            arcade.color.YELLOW
+    def interpolated_position(self, alpha: float) -> Tuple[float, float]:
+        """
+        Get the render position between the last two simulation ticks.
+        
+        Args:
+            alpha: 0.0 = position before the last update, 1.0 = current
+            
+        Returns:
+            Tuple of (pixel_x, pixel_y)
+        """
+        return (
+            self.prev_x + (self.center_x - self.prev_x) * alpha,
+            self.prev_y + (self.center_y - self.prev_y) * alpha
         )
         
     def update(self, maze=None):
@@ -70,9 +89,14 @@ class Player:
         Args:
             maze: Optional Maze object for collision detection
         """
+        self.prev_x = self.center_x
+        self.prev_y = self.center_y
+        
         # Try to apply buffered direction change if one exists
         if self.next_direction is not None and maze:
-            next_change_x, next_change_y = self._direction_to_change(self.next_direction)
+            next_change_x, next_change_y = self._direction_to_change(
+                self.next_direction
+            )
             
             # Test if we can move in the buffered direction
             test_x = self.center_x + next_change_x
@@ -99,16 +123,23 @@ class Player:
             self.center_x = new_x
             self.center_y = new_y
         
-        # Keep player on screen (temporary boundary check)
+        # Keep player inside the maze (or the screen without one)
+        if maze:
+            max_x = maze.width * TILE_SIZE
+            max_y = maze.height * TILE_SIZE
+        else:
+            max_x = SCREEN_WIDTH
+            max_y = SCREEN_HEIGHT
+        
         if self.center_x < self.radius:
             self.center_x = self.radius
-        elif self.center_x > SCREEN_WIDTH - self.radius:
-            self.center_x = SCREEN_WIDTH - self.radius
+        elif self.center_x > max_x - self.radius:
+            self.center_x = max_x - self.radius
             
         if self.center_y < self.radius:
             self.center_y = self.radius
-        elif self.center_y > SCREEN_HEIGHT - self.radius:
-            self.center_y = SCREEN_HEIGHT - self.radius
+        elif self.center_y > max_y - self.radius:
+            self.center_y = max_y - self.radius
     
     def _direction_to_change(self, direction: int) -> Tuple[float, float]:
         """
@@ -142,14 +173,10 @@ class Player:
         Returns:
             True if movement is possible
         """
-        import math
-        
         # Check 8 points around the circle for faster collision detection
-        num_points = 8
-        for i in range(num_points):
-            angle = (2 * math.pi / num_points) * i
-            point_x = x + self.radius * math.cos(angle)
-            point_y = y + self.radius * math.sin(angle)
+        for cos, sin in PROBE_DIRECTIONS:
+            point_x = x + self.radius * cos
+            point_y = y + self.radius * sin
             
             if maze.is_wall_at_pixel(point_x, point_y):
                 return False
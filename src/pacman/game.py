@@ -3,31 +3,93 @@ Main game module.
 Handles game initialization, main loop, and window management.
 """
 
+import argparse
+import logging
+from typing import Optional
 import arcade
 from pacman.utils.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     SCREEN_TITLE,
-    FPS,
     TILE_SIZE,
-    FOX_SCARED_TIME
+    FPS
 )
-from pacman.entities.player import Player
+from pacman.simulation import Simulation
+from pacman.maps.level_loader import Level, load_level
 from pacman.maps.maze import Maze
-from pacman.entities.collectibles import SeedManager
-from pacman.entities.fox import FoxManager
+from pacman.ui.camera import FollowCamera
+from pacman.utils.timestep import FixedTimestep
+from pacman.utils.animation import AnimationClock
+from pacman.replay import MAX_SEED, Replay, ReplayRecorder, map_digest
+from pacman.utils.event_log import get_logger, configure_logging
+from pacman.utils.profiler import (
+    FrameProfiler,
+    NULL_PROFILER,
+    STAGE_MAZE_DRAW,
+    STAGE_SEED_DRAW,
+    STAGE_FOX_DRAW,
+    STAGE_HUD_TEXT
+)
+from pacman.ui.profiler_overlay import ProfilerOverlay
+from pacman.ui.hud import Hud
+from pacman.ui.static_layer import StaticLayer
+from pacman.ui.renderers import draw_player, draw_foxes, draw_super_seeds
+
+
+# Movement keys mapped to simulation directions (0=right, 1=up, 2=left, 3=down)
+KEY_DIRECTIONS = {
+    arcade.key.RIGHT: 0,
+    arcade.key.D: 0,
+    arcade.key.UP: 1,
+    arcade.key.W: 1,
+    arcade.key.LEFT: 2,
+    arcade.key.A: 2,
+    arcade.key.DOWN: 3,
+    arcade.key.S: 3,
+}
+
+DIRECTION_NAMES = {0: "➡️ RIGHT", 1: "⬆️ UP", 2: "⬅️ LEFT", 3: "⬇️ DOWN"}
+
+log = get_logger(__name__)
 
 
 class ChickmanGame(arcade.Window):
     """
     Main game class that manages the game window and states.
     
+    All game logic lives in Simulation; this class only feeds it keyboard
+    input and draws its state.
+    
     Attributes:
-        current_view: The currently active game view (menu, gameplay, etc.)
+        simulation: The headless game simulation being rendered
+        level: Level loaded from a Tiled map (None = built-in maze)
+        seed: Random seed for the session (None = random)
+        record_path: Where to save a replay of the session on exit
+        replay: Replay driving the inputs instead of the keyboard
+        profiler: Per-stage frame timings (NULL_PROFILER until F3 is
+            pressed or a profile path is given)
+        profile_path: Where to dump the profiler statistics on exit
+        show_profiler: True while the F3 overlay is visible
+        profiler_overlay: Cached F3 overlay text
+        hud: Cached HUD and title screen text
+        static_layer: Walls and regular seeds rendered into chunk textures
+        animation_clock: Animation phases (super seed blink), sampled from
+            simulation time once per frame
     """
     
-    def __init__(self):
-        """Initialize the game window."""
+    def __init__(self, level: Optional[Level] = None, seed: Optional[int] = None,
+                 record_path: Optional[str] = None, replay: Optional[Replay] = None,
+                 profile_path: Optional[str] = None):
+        """
+        Initialize the game window.
+        
+        Args:
+            level: Level loaded from a Tiled map (None = built-in maze)
+            seed: Random seed for the session (None = random)
+            record_path: Where to save a replay of the session on exit
+            replay: Replay to watch instead of playing
+            profile_path: Dump per-stage frame timings as JSON here on exit
+        """
         super().__init__(
             SCREEN_WIDTH,
             SCREEN_HEIGHT,
@@ -44,55 +106,70 @@ class ChickmanGame(arcade.Window):
         # Track pressed keys for smooth multi-key handling
         self.keys_pressed = set()
         
-        # Chicken (player)
-        self.player = None
+        # Direction currently requested by the keyboard (None = stop)
+        self.held_direction = None
         
-        # Maze
-        self.maze = None
+        # Game logic (maze, chicken, seeds, foxes, score, power mode)
+        self.simulation = None
+        self.level = level
         
-        # Collectibles
-        self.seed_manager = None
+        # Reproducible sessions
+        self.seed = replay.seed if replay else seed
+        self.record_path = record_path
+        self.replay = replay
+        self._replay_inputs = None
         
-        # Foxes
-        self.fox_manager = None
+        # Scrolling view over the maze (follows the chicken)
+        self.camera = FollowCamera(SCREEN_WIDTH, SCREEN_HEIGHT)
         
-        # Score
-        self.score = 0
+        # Frame time -> fixed simulation ticks
+        self.timestep = FixedTimestep()
         
-        # Power mode (frightened foxes)
-        self.power_mode = False
-        self.power_timer = 0.0
+        # Game-time animations; frozen whenever the simulation is
+        self.animation_clock = AnimationClock()
         
-    def setup(self):
-        """Set up the game. Called to initialize or restart the game."""
-        print("🐔 Chickman Game initialized!")
-        print(f"📐 Window size: {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
-        print(f"⚡ Target FPS: {FPS}")
+        # Frame-time instrumentation (F3 overlay, JSON dump)
+        self.profile_path = profile_path
+        self.profiler = FrameProfiler() if profile_path else NULL_PROFILER
+        self.show_profiler = False
+        self.profiler_overlay = ProfilerOverlay(SCREEN_WIDTH - 10, SCREEN_HEIGHT - 30)
         
-        # Create maze
-        self.maze = Maze()
-        print(f"🧱 Maze created: {self.maze.width}x{self.maze.height} tiles")
+        # Score, FPS and help labels (text objects are created in setup())
+        self.hud = Hud()
         
-        # Create chicken (player) in center of screen
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
-        print(f"� Chicken created at ({self.player.center_x}, {self.player.center_y})")
+        # Pre-rendered walls + seeds (created with the simulation)
+        self.static_layer: Optional[StaticLayer] = None
         
-        # Create seeds (using flood fill from chicken's starting position)
-        self.seed_manager = SeedManager()
-        player_tile_x = int(self.player.center_x // TILE_SIZE)
-        player_tile_y = int(self.player.center_y // TILE_SIZE)
-        self.seed_manager.create_seeds_for_maze(self.maze, player_tile_x, player_tile_y)
+    def setup(self):
+        """Set up the game. Called to initialize or restart the game."""
+        log.info("🐔 Chickman Game initialized!")
+        log.info("📐 Window size: %dx%d", SCREEN_WIDTH, SCREEN_HEIGHT)
+        log.info("⚡ Target FPS: %d", FPS)
         
-        # Create foxes
-        self.fox_manager = FoxManager()
-        self.fox_manager.create_foxes(self.maze)
+        # Create maze, chicken, seeds and foxes
+        self.simulation = Simulation(level=self.level, seed=self.seed)
+        # Build pathfinding tables while the level loads, not mid-game
+        self.simulation.maze.precompute()
+        log.info("🎲 Seed: %d", self.simulation.seed)
+        self.simulation.profiler = self.profiler
+        if self.record_path:
+            self.simulation.recorder = ReplayRecorder(
+                self.simulation.seed, map_digest(self.simulation.maze, self.level)
+            )
+        if self.replay:
+            self._replay_inputs = self.replay.iter_inputs()
+        self.static_layer = StaticLayer(
+            self.simulation.maze, self.simulation.seed_manager
+        )
         
-        # Reset score
-        self.score = 0
+        self.keys_pressed.clear()
+        self.held_direction = None
+        self.timestep.reset()
+        self.animation_clock.reset()
         
-        # Reset power mode
-        self.power_mode = False
-        self.power_timer = 0.0
+        # Lay out every label once; values are updated only when they change
+        self.hud.setup()
+        self.profiler_overlay.setup()
         
     def on_draw(self):
         """
@@ -102,103 +179,70 @@ class ChickmanGame(arcade.Window):
         # Clear the screen
         self.clear()
         
+        hud = self.hud
+        hud.set_fps(int(arcade.get_fps()))
+        
         if not self.game_started:
             # Draw welcome screen
-            arcade.draw_text(
-                "CHICKMAN - Junior.guru Challenge",
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2 + 50,
-                arcade.color.YELLOW,
-                20,
-                anchor_x="center"
-            )
+            self.profiler.count_draw_calls(hud.draw_title())
+        else:
+            sim = self.simulation
+            
+            # Draw between the last two simulation ticks
+            alpha = self.timestep.alpha
+            player_x, player_y = sim.player.interpolated_position(alpha)
             
-            arcade.draw_text(
-                "Press SPACE to start...",
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2 - 50,
-                arcade.color.WHITE,
-                16,
-                anchor_x="center"
+            # Scroll the world so the chicken stays in view
+            self.camera.follow(
+                player_x,
+                player_y,
+                sim.maze.width * TILE_SIZE,
+                sim.maze.height * TILE_SIZE
             )
-        else:
-            # Draw maze first (background)
-            if self.maze:
-                self.maze.draw()
+            self.camera.use()
+            view = self.camera.view
             
-            # Draw seeds
-            if self.seed_manager:
-                self.seed_manager.draw()
+            profiler = self.profiler
+            
+            # Draw walls and regular seeds first (background), one
+            # pre-rendered texture per chunk in view
+            with profiler.stage(STAGE_MAZE_DRAW):
+                profiler.count_draw_calls(self.static_layer.draw(view))
+            
+            # Animation phases for this frame, from simulation time
+            self.animation_clock.update(sim.tick * self.timestep.step)
+            
+            # Blinking super seeds on top of the static layer
+            with profiler.stage(STAGE_SEED_DRAW):
+                profiler.count_draw_calls(
+                    draw_super_seeds(sim.seed_manager, self.animation_clock, view)
+                )
             
             # Draw foxes
-            if self.fox_manager:
-                self.fox_manager.draw()
+            with profiler.stage(STAGE_FOX_DRAW):
+                profiler.count_draw_calls(draw_foxes(sim.fox_manager, view, alpha))
             
             # Draw chicken on top
-            if self.player:
-                self.player.draw()
+            profiler.count_draw_calls(draw_player(sim.player, alpha))
             
-            # Draw score (top-left)
-            arcade.draw_text(
-                f"SCORE: {self.score}",
-                10,
-                SCREEN_HEIGHT - 70,
-                arcade.color.YELLOW,
-                18,
-                bold=True
-            )
+            # HUD is drawn in screen coordinates
+            self.default_camera.use()
             
-            # Draw remaining seeds count
-            if self.seed_manager:
-                remaining = self.seed_manager.get_remaining_seeds()
-                arcade.draw_text(
-                    f"Seeds: {remaining}",
-                    10,
-                    SCREEN_HEIGHT - 100,
-                    arcade.color.WHITE,
-                    14
+            with profiler.stage(STAGE_HUD_TEXT):
+                hud.update(
+                    sim.score,
+                    sim.seed_manager.get_remaining_seeds(),
+                    sim.power_timer if sim.power_mode else None,
+                    sim.player.center_x,
+                    sim.player.center_y
                 )
-            
-            # Draw power mode indicator
-            if self.power_mode:
-                arcade.draw_text(
-                    f"💪 POWER MODE: {self.power_timer:.1f}s",
-                    SCREEN_WIDTH // 2,
-                    SCREEN_HEIGHT - 50,
-                    arcade.color.YELLOW,
-                    20,
-                    bold=True,
-                    anchor_x="center"
-                )
-            
-            # Draw instructions
-            arcade.draw_text(
-                "Use Arrow Keys or WASD to move | ESC to quit",
-                SCREEN_WIDTH // 2,
-                20,
-                arcade.color.WHITE,
-                12,
-                anchor_x="center"
-            )
+                profiler.count_draw_calls(hud.draw())
         
-        # Draw FPS counter for debugging (top-left corner)
-        arcade.draw_text(
-            f"FPS: {int(arcade.get_fps())}",
-            10,
-            SCREEN_HEIGHT - 30,
-            arcade.color.WHITE,
-            14
-        )
+        if self.show_profiler:
+            self.profiler_overlay.update(self.profiler)
+            self.profiler_overlay.draw()
         
-        # Draw player position for debugging
-        if self.player and self.game_started:
-            arcade.draw_text(
-                f"Position: ({int(self.player.center_x)}, {int(self.player.center_y)})",
-                10,
-                SCREEN_HEIGHT - 60,
-                arcade.color.WHITE,
-                12
-            )
+        self.profiler.end_frame()
     
     def on_update(self, delta_time: float):
         """
@@ -210,72 +254,18 @@ class ChickmanGame(arcade.Window):
         """
         self.frame_count += 1
         
-        # Update power mode timer
-        if self.power_mode:
-            self.power_timer -= delta_time
-            if self.power_timer <= 0:
-                self.power_mode = False
-                self.power_timer = 0.0
-                print("⚡ Power mode ended!")
-                # Set foxes back to normal
-                if self.fox_manager:
-                    self.fox_manager.set_all_frightened(False)
+        # Advance the simulation in fixed ticks, however long the frame was
+        if self.game_started and self.simulation:
+            for _ in range(self.timestep.advance(delta_time)):
+                direction = self.held_direction
+                if self._replay_inputs is not None:
+                    direction = next(self._replay_inputs, None)
+                self.simulation.step(direction, self.timestep.step)
         
-        # Update player if game started
-        if self.game_started and self.player:
-            self.player.update(self.maze)  # Pass maze for collision detection
-
-            # Update foxes
-            if self.fox_manager:
-                self.fox_manager.update(self.maze, self.player.center_x, self.player.center_y)
-
-                # Check fox collisions
-                colliding_foxes = self.fox_manager.check_collisions_with_chicken(
-                    self.player.center_x,
-                    self.player.center_y,
-                    self.player.radius
-                )
-                
-                for fox in colliding_foxes:
-                    if fox.state.value == "frightened":
-                        # Eat the fox
-                        fox.set_state(fox.state.__class__["EATEN"])
-                        self.score += 200
-                        print(f"🦊 Ate {fox.name}! +200 points")
-                    elif fox.state.value != "eaten":
-                        # Fox caught chicken
-                        print("💀 Game Over! Fox caught the chicken!")
-                        # TODO: Implement lives system
-            
-            # Check seed collisions
-            if self.seed_manager:
-                points_earned, ate_super_seed = self.seed_manager.check_collisions(
-                    self.player.center_x,
-                    self.player.center_y,
-                    self.player.radius
-                )
-                
-                if points_earned > 0:
-                    self.score += points_earned
-                    print(f"� +{points_earned} points! Total: {self.score}")
-                
-                # Activate power mode if ate super seed
-                if ate_super_seed:
-                    self.power_mode = True
-                    self.power_timer = FOX_SCARED_TIME
-                    print(f"💪 SUPER SEED! Foxes frightened! ({FOX_SCARED_TIME}s)")
-                    # Set all foxes to frightened
-                    if self.fox_manager:
-                        self.fox_manager.set_all_frightened(True)
-                
-                # Check if level completed
-                if self.seed_manager.all_seeds_collected():
-                    print("🎉 Level Complete! All seeds collected!")
-                    # TODO: Load next level
-        
-        # DEBUG: Print every 60 frames (roughly 1 second)
-        if self.frame_count % 60 == 0:
-            print(f"✓ Game running... Frame: {self.frame_count}, FPS: {int(arcade.get_fps())}")
+        # Heartbeat every 60 frames (roughly 1 second)
+        if self.frame_count % 60 == 0 and log.isEnabledFor(logging.DEBUG):
+            log.debug("✓ Game running... Frame: %d, FPS: %d",
+                      self.frame_count, arcade.get_fps())
     
     def on_key_press(self, key: int, modifiers: int):
         """
@@ -286,50 +276,19 @@ class ChickmanGame(arcade.Window):
             modifiers: Modifier keys (shift, ctrl, etc.)
         """
         if key == arcade.key.ESCAPE:
-            print("👋 Exiting game...")
+            log.info("👋 Exiting game...")
             self.close()
         elif key == arcade.key.SPACE and not self.game_started:
-            print("🚀 Game started!")
+            log.info("🚀 Game started!")
             self.game_started = True
+        elif key == arcade.key.F3:
+            self.toggle_profiler()
         
         # Movement controls (only if game started)
-        if self.game_started and self.player:
-            # Add key to pressed keys set
-            if key in [
-                arcade.key.UP, arcade.key.DOWN, 
-                arcade.key.LEFT, arcade.key.RIGHT,
-                arcade.key.W, arcade.key.S, 
-                arcade.key.A, arcade.key.D
-            ]:
-                self.keys_pressed.add(key)
-            
-            # Arrow keys
-            if key == arcade.key.UP:
-                self.player.move_up()
-                print("⬆️ Moving UP")
-            elif key == arcade.key.DOWN:
-                self.player.move_down()
-                print("⬇️ Moving DOWN")
-            elif key == arcade.key.LEFT:
-                self.player.move_left()
-                print("⬅️ Moving LEFT")
-            elif key == arcade.key.RIGHT:
-                self.player.move_right()
-                print("➡️ Moving RIGHT")
-            
-            # WASD keys
-            elif key == arcade.key.W:
-                self.player.move_up()
-                print("⬆️ Moving UP (W)")
-            elif key == arcade.key.S:
-                self.player.move_down()
-                print("⬇️ Moving DOWN (S)")
-            elif key == arcade.key.A:
-                self.player.move_left()
-                print("⬅️ Moving LEFT (A)")
-            elif key == arcade.key.D:
-                self.player.move_right()
-                print("➡️ Moving RIGHT (D)")
+        if self.game_started and key in KEY_DIRECTIONS:
+            self.keys_pressed.add(key)
+            self.held_direction = KEY_DIRECTIONS[key]
+            log.debug("Moving %s", DIRECTION_NAMES[self.held_direction])
     
     def on_key_release(self, key: int, modifiers: int):
         """
@@ -340,57 +299,101 @@ class ChickmanGame(arcade.Window):
             modifiers: Modifier keys (shift, ctrl, etc.)
         """
         # Remove key from pressed keys
-        if key in self.keys_pressed:
-            self.keys_pressed.discard(key)
+        self.keys_pressed.discard(key)
         
         # Stop player ONLY if no movement keys are pressed
-        if self.game_started and self.player:
-            if key in [
-                arcade.key.UP, arcade.key.DOWN, 
-                arcade.key.LEFT, arcade.key.RIGHT,
-                arcade.key.W, arcade.key.S, 
-                arcade.key.A, arcade.key.D
-            ]:
-                # Check if any other movement key is still pressed
-                movement_keys = {
-                    arcade.key.UP, arcade.key.DOWN,
-                    arcade.key.LEFT, arcade.key.RIGHT,
-                    arcade.key.W, arcade.key.S,
-                    arcade.key.A, arcade.key.D
-                }
-                
-                still_pressed = self.keys_pressed & movement_keys
-                
-                if not still_pressed:
-                    # No movement keys pressed - stop
-                    self.player.stop()
-                    print("🛑 Stopped")
-                else:
-                    # Another key is still pressed - apply its direction
-                    last_key = list(still_pressed)[-1]  # Get last pressed key
-                    
-                    if last_key == arcade.key.UP or last_key == arcade.key.W:
-                        self.player.move_up()
-                        print("⬆️ Continue UP")
-                    elif last_key == arcade.key.DOWN or last_key == arcade.key.S:
-                        self.player.move_down()
-                        print("⬇️ Continue DOWN")
-                    elif last_key == arcade.key.LEFT or last_key == arcade.key.A:
-                        self.player.move_left()
-                        print("⬅️ Continue LEFT")
-                    elif last_key == arcade.key.RIGHT or last_key == arcade.key.D:
-                        self.player.move_right()
-                        print("➡️ Continue RIGHT")
+        if self.game_started and key in KEY_DIRECTIONS:
+            still_pressed = [k for k in self.keys_pressed if k in KEY_DIRECTIONS]
+            
+            if not still_pressed:
+                # No movement keys pressed - stop
+                self.held_direction = None
+                log.debug("🛑 Stopped")
+            else:
+                # Another key is still pressed - apply its direction
+                self.held_direction = KEY_DIRECTIONS[still_pressed[-1]]
+                log.debug("Continue %s", DIRECTION_NAMES[self.held_direction])
     
     def run(self):
         """Start the game."""
         self.setup()
         arcade.run()
+        self.save_recording()
+        self.save_profile()
+    
+    def toggle_profiler(self):
+        """Show or hide the frame-time overlay (starts profiling if needed)."""
+        if not self.profiler.enabled:
+            self.profiler = FrameProfiler()
+            if self.simulation:
+                self.simulation.profiler = self.profiler
+        self.show_profiler = not self.show_profiler
+    
+    def save_profile(self):
+        """Write the profiler statistics as JSON, if requested."""
+        if self.profile_path and self.profiler.enabled:
+            self.profiler.dump_json(self.profile_path)
+            log.info("📊 Frame profile saved to %s", self.profile_path)
+    
+    def save_recording(self):
+        """Write the replay of the session, if recording."""
+        recorder = self.simulation.recorder if self.simulation else None
+        if self.record_path and recorder:
+            recorder.finish(self.simulation.score).save(self.record_path)
+            log.info("💾 Replay saved to %s (%d ticks)",
+                     self.record_path, recorder.last_tick)
+
+
+def _seed_arg(text: str) -> int:
+    """
+    Parse a --seed value.
+
+    Args:
+        text: Command line value
+
+    Returns:
+        The seed
+
+    Raises:
+        argparse.ArgumentTypeError: If it is not an integer from 0 to MAX_SEED
+    """
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid seed: {text!r}")
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {MAX_SEED}")
+    return seed
 
 
 def main():
     """Entry point for the game."""
-    game = ChickmanGame()
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument("--map",
+                        help="Tiled (.tmx) map to play instead of the built-in maze")
+    parser.add_argument("--seed", type=_seed_arg,
+                        help="Random seed (same seed + same inputs = same game)")
+    parser.add_argument("--record", metavar="PATH",
+                        help="Save a replay of the session on exit")
+    parser.add_argument("--replay", metavar="PATH", help="Watch a recorded replay")
+    parser.add_argument("--log-level",
+                        choices=["debug", "info", "warning", "error", "off"],
+                        help="Event log level (default: $CHICKMAN_LOG or warning)")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Record per-stage frame timings and save them as "
+                             "JSON on exit")
+    args = parser.parse_args()
+    
+    configure_logging(args.log_level)
+    
+    level = load_level(args.map) if args.map else None
+    replay = Replay.load(args.replay) if args.replay else None
+    if replay:
+        try:
+            replay.check_map(level.maze if level else Maze(), level)
+        except ValueError as error:
+            parser.error(f"{args.replay}: {error}")
+    game = ChickmanGame(level, args.seed, args.record, replay, args.profile)
     game.run()
 
 
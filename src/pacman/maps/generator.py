@@ -0,0 +1,126 @@
+"""
+Procedural maze generation.
+Builds random, fully connected mazes of any size (used for benchmarks and
+large-maze testing).
+"""
+
+import random
+from typing import List, Optional
+
+from pacman.maps.level_loader import Level
+from pacman.maps.maze import Maze
+
+# Fraction of dead-end walls knocked out to create loops; Pac-Man style
+# mazes have few dead ends, which also gives foxes alternative routes
+DEFAULT_LOOP_FRACTION = 0.5
+
+
+def generate_grid(
+    width: int,
+    height: int,
+    seed: Optional[int] = None,
+    loop_fraction: float = DEFAULT_LOOP_FRACTION,
+) -> List[List[int]]:
+    """
+    Carve a random maze grid.
+
+    Corridors run between tiles with odd coordinates (randomized
+    depth-first search), so every open tile is reachable from every other;
+    then some dead ends are opened up to create loops. The border is
+    always wall.
+
+    Args:
+        width: Width in tiles (at least 3)
+        height: Height in tiles (at least 3)
+        seed: Random seed (same seed + size = same maze)
+        loop_fraction: Fraction of dead ends opened into loops (0.0-1.0)
+
+    Returns:
+        Tile rows, bottom row first (0=empty, 1=wall)
+    """
+    rng = random.Random(seed)
+    grid = [[1] * width for _ in range(height)]
+
+    # Cells are the tiles with odd coordinates inside the border
+    last_x = width - 2 if (width - 2) % 2 == 1 else width - 3
+    last_y = height - 2 if (height - 2) % 2 == 1 else height - 3
+    steps = ((2, 0), (-2, 0), (0, 2), (0, -2))
+
+    grid[1][1] = 0
+    stack = [(1, 1)]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (dx, dy)
+            for dx, dy in steps
+            if 1 <= x + dx <= last_x
+            and 1 <= y + dy <= last_y
+            and grid[y + dy][x + dx] == 1
+        ]
+        if not options:
+            stack.pop()
+            continue
+        dx, dy = rng.choice(options)
+        grid[y + dy // 2][x + dx // 2] = 0
+        grid[y + dy][x + dx] = 0
+        stack.append((x + dx, y + dy))
+
+    # Knock a wall out of some dead ends so corridors form loops
+    for y in range(1, last_y + 1, 2):
+        for x in range(1, last_x + 1, 2):
+            closed = [
+                (dx, dy) for dx, dy in steps if grid[y + dy // 2][x + dx // 2] == 1
+            ]
+            if len(closed) != 3 or rng.random() >= loop_fraction:
+                continue
+            inner = [
+                (dx, dy)
+                for dx, dy in closed
+                if 1 <= x + dx <= last_x and 1 <= y + dy <= last_y
+            ]
+            if inner:
+                dx, dy = rng.choice(inner)
+                grid[y + dy // 2][x + dx // 2] = 0
+
+    return grid
+
+
+def generate_level(
+    width: int,
+    height: int,
+    seed: Optional[int] = None,
+    fox_count: int = 4,
+    loop_fraction: float = DEFAULT_LOOP_FRACTION,
+) -> Level:
+    """
+    Generate a random playable level.
+
+    The chicken starts on the open tile closest to the maze centre and
+    foxes start on random open tiles.
+
+    Args:
+        width: Width in tiles (at least 3)
+        height: Height in tiles (at least 3)
+        seed: Random seed (same seed + size = same level)
+        fox_count: Number of fox spawn tiles
+        loop_fraction: Fraction of dead ends opened into loops (0.0-1.0)
+
+    Returns:
+        The generated Level (every open tile is reachable)
+    """
+    grid = generate_grid(width, height, seed, loop_fraction)
+    maze = Maze(grid)
+
+    # Cells sit on odd coordinates and are always open
+    player_spawn = ((width // 2) | 1, (height // 2) | 1)
+    player_spawn = (min(player_spawn[0], width - 2), min(player_spawn[1], height - 2))
+    if maze.is_wall(*player_spawn):
+        player_spawn = (1, 1)
+
+    open_tiles = [
+        (x, y) for y in range(height) for x in range(width) if grid[y][x] == 0
+    ]
+    rng = random.Random(seed)
+    fox_spawns = rng.sample(open_tiles, min(fox_count, len(open_tiles)))
+
+    return Level(maze, player_spawn, fox_spawns, [], open_tiles)
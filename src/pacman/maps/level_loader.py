@@ -0,0 +1,402 @@
+"""
+Level loading from Tiled (TMX) map files.
+Parses TMX maps into a Maze plus spawn points and keeps a compiled,
+memory-mapped cache so later loads skip XML parsing entirely.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from pacman.maps.maze import Maze
+from pacman.utils.constants import LEVEL_CACHE_DIR
+from pacman.utils.pathfinding import DistanceTable
+
+# Compiled level file layout (all little-endian, planes 4-byte aligned):
+#   header: magic, version, width, height, player spawn x/y,
+#           fox spawn count, super seed count, region count (label 0
+#           included), walkable tile count N (-1 = no distance table)
+#   fox spawns (x, y pairs), super seeds (x, y pairs)
+#   grid (width * height bytes, bottom row first)
+#   neighbour masks (width * height bytes, see Maze.neighbours)
+#   region labels (width * height uint32), region sizes (uint32 per label)
+#   if N >= 0: tile ids (width * height int32), distances (N * N uint16),
+#              next hops (N * N bytes), see DistanceTable
+CACHE_MAGIC = b"CHKLVL"
+CACHE_VERSION = 2
+CACHE_SUFFIX = ".chklvl"
+_HEADER = struct.Struct("<6sHIIiiIIIi")
+_TILE = struct.Struct("<ii")
+
+# Names (or Tiled object types/classes) recognized in object layers
+PLAYER_OBJECT = "player"
+FOX_OBJECT = "fox"
+SUPER_SEED_OBJECT = "super_seed"
+
+# Tile layer holding the walls (any non-empty tile is a wall)
+WALLS_LAYER = "walls"
+
+
+class Level:
+    """
+    A playable level: maze layout plus where everything starts.
+
+    Attributes:
+        maze: The Maze
+        player_spawn: Chicken start tile (x, y)
+        fox_spawns: Fox start tiles (x, y)
+        super_seed_tiles: Super seed tiles (x, y); empty = pick corners
+        reachable_tiles: Tiles reachable from the player spawn (set)
+    """
+
+    def __init__(
+        self,
+        maze: Maze,
+        player_spawn: Tuple[int, int],
+        fox_spawns: List[Tuple[int, int]],
+        super_seed_tiles: List[Tuple[int, int]],
+        reachable_tiles: Optional[Iterable[Tuple[int, int]]] = None,
+    ):
+        """
+        Initialize a level.
+
+        Args:
+            maze: The Maze
+            player_spawn: Chicken start tile (x, y)
+            fox_spawns: Fox start tiles (x, y)
+            super_seed_tiles: Super seed tiles (x, y)
+            reachable_tiles: Tiles reachable from the player spawn
+                (taken from the maze's connected regions on first use if
+                not given)
+        """
+        self.maze = maze
+        self.player_spawn = player_spawn
+        self.fox_spawns = fox_spawns
+        self.super_seed_tiles = super_seed_tiles
+        self._reachable_tiles = (
+            set(reachable_tiles) if reachable_tiles is not None else None
+        )
+
+    @property
+    def reachable_tiles(self) -> set:
+        """Tiles (x, y) reachable from the player spawn."""
+        if self._reachable_tiles is None:
+            self._reachable_tiles = set(self.maze.component_tiles(*self.player_spawn))
+        return self._reachable_tiles
+
+
+def load_tmx(path: str) -> Level:
+    """
+    Parse a Tiled map into a Level.
+
+    The map needs a tile layer named "walls" (non-empty tile = wall) and
+    an object layer with objects named or typed "player", "fox" and
+    (optionally) "super_seed".
+
+    Args:
+        path: Path to the .tmx file
+
+    Returns:
+        The parsed Level
+
+    Raises:
+        ValueError: If the map has no walls layer or no player spawn, or
+            a spawn cannot be reached from the player spawn
+    """
+    # pytmx is only needed when the compiled cache misses
+    import pytmx
+
+    tiled_map = pytmx.TiledMap(path)
+    height = tiled_map.height
+
+    try:
+        walls_layer = tiled_map.get_layer_by_name(WALLS_LAYER)
+    except ValueError:
+        raise ValueError(f"Map {path} has no '{WALLS_LAYER}' tile layer")
+
+    # Tiled rows go top-down, the maze grid goes bottom-up
+    grid = [
+        [1 if gid else 0 for gid in walls_layer.data[height - 1 - row]]
+        for row in range(height)
+    ]
+
+    player_spawn = None
+    fox_spawns: List[Tuple[int, int]] = []
+    super_seed_tiles: List[Tuple[int, int]] = []
+    for tiled_object in tiled_map.objects:
+        kind = (
+            getattr(tiled_object, "type", None)
+            or getattr(tiled_object, "class", None)
+            or tiled_object.name
+            or ""
+        ).lower()
+        tile = (
+            int(tiled_object.x // tiled_map.tilewidth),
+            height - 1 - int(tiled_object.y // tiled_map.tileheight),
+        )
+        if kind == PLAYER_OBJECT:
+            player_spawn = tile
+        elif kind == FOX_OBJECT:
+            fox_spawns.append(tile)
+        elif kind == SUPER_SEED_OBJECT:
+            super_seed_tiles.append(tile)
+
+    if player_spawn is None:
+        raise ValueError(f"Map {path} has no '{PLAYER_OBJECT}' object")
+
+    maze = Maze(grid)
+    if maze.component_label(*player_spawn) == 0:
+        raise ValueError(f"Map {path}: player spawn {player_spawn} is inside a wall")
+    for kind, tiles in (
+        (FOX_OBJECT, fox_spawns),
+        (SUPER_SEED_OBJECT, super_seed_tiles),
+    ):
+        for tile in tiles:
+            if not maze.is_reachable(player_spawn, tile):
+                raise ValueError(
+                    f"Map {path}: {kind} at {tile} cannot be reached "
+                    f"from the player spawn"
+                )
+
+    return Level(maze, player_spawn, fox_spawns, super_seed_tiles)
+
+
+def compile_level(level: Level, path: str):
+    """
+    Write a level to a compiled cache file.
+
+    The maze's connected regions and distance table are stored too (and
+    built first if needed), so loading never recomputes them.
+
+    Args:
+        level: The Level to store
+        path: Output file path
+    """
+    maze = level.maze
+    maze.precompute()
+    # Private state, but the level cache is the one place that persists it
+    labels = maze._component_labels
+    sizes = maze._component_sizes
+    table = maze.distance_table
+
+    parts = [
+        _HEADER.pack(
+            CACHE_MAGIC,
+            CACHE_VERSION,
+            maze.width,
+            maze.height,
+            level.player_spawn[0],
+            level.player_spawn[1],
+            len(level.fox_spawns),
+            len(level.super_seed_tiles),
+            len(sizes),
+            table.count if table is not None else -1,
+        )
+    ]
+    parts.extend(_TILE.pack(*tile) for tile in level.fox_spawns)
+    parts.extend(_TILE.pack(*tile) for tile in level.super_seed_tiles)
+    parts.append(b"".join(bytes(row) for row in maze.grid))
+    parts.append(bytes(maze.neighbours))
+    _append_plane(parts, "I", labels)
+    _append_plane(parts, "I", sizes)
+    if table is not None:
+        _append_plane(parts, "i", table.tile_ids)
+        _append_plane(parts, "H", table.distances)
+        parts.append(bytes(table.next_hops))
+
+    # Write to a temp file first so a crash never leaves a half-written cache
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as cache_file:
+        cache_file.write(b"".join(parts))
+    os.replace(temp_path, path)
+
+
+def _append_plane(parts: List[bytes], typecode: str, values: Sequence[int]):
+    """
+    Append a little-endian array plane, padded to start 4-byte aligned.
+
+    Args:
+        parts: File contents so far
+        typecode: array typecode of the plane ("I", "i" or "H")
+        values: Plane values
+    """
+    offset = sum(len(part) for part in parts)
+    parts.append(bytes(-offset % 4))
+    plane = array(typecode, values)
+    if sys.byteorder != "little":
+        plane.byteswap()
+    parts.append(plane.tobytes())
+
+
+def load_compiled(path: str) -> Level:
+    """
+    Load a level from a compiled cache file.
+
+    The file is memory-mapped copy-on-write and the maze's grid rows,
+    neighbour masks, regions and distance table are views into it;
+    nothing is parsed, copied or recomputed. Editing the maze changes
+    only this process's pages, never the file.
+
+    Args:
+        path: Compiled level file path
+
+    Returns:
+        The stored Level
+
+    Raises:
+        ValueError: If the file is not a compiled level of this version
+    """
+    with open(path, "rb") as cache_file:
+        # The views keep the mapping alive for as long as the maze uses it
+        data = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        return _read_compiled(memoryview(data), path)
+    except struct.error:
+        raise ValueError(f"{path} is not a compiled level") from None
+
+
+class _PlaneReader:
+    """Cuts consecutive planes out of a compiled level buffer."""
+
+    def __init__(self, view: memoryview, offset: int, path: str):
+        """
+        Initialize the reader.
+
+        Args:
+            view: Buffer with the whole file
+            offset: Where the first plane starts
+            path: File path (for error messages)
+        """
+        self.view = view
+        self.offset = offset
+        self.path = path
+
+    def take(self, typecode: str, count: int) -> Sequence[int]:
+        """
+        Read the next plane.
+
+        Args:
+            typecode: Item type ("B", "I", "i" or "H")
+            count: Number of items
+
+        Returns:
+            A view into the buffer (a copy on big-endian hosts)
+
+        Raises:
+            ValueError: If the buffer ends before the plane does
+        """
+        itemsize = array(typecode).itemsize
+        if itemsize > 1:
+            self.offset += -self.offset % 4
+        end = self.offset + count * itemsize
+        if end > len(self.view):
+            raise ValueError(f"{self.path} is truncated")
+        plane = self.view[self.offset : end]
+        self.offset = end
+        if itemsize > 1 and sys.byteorder != "little":
+            values = array(typecode, plane.tobytes())
+            values.byteswap()
+            return values
+        return plane.cast(typecode)
+
+
+def _read_compiled(view: memoryview, path: str) -> Level:
+    """
+    Decode a compiled level from a buffer.
+
+    Args:
+        view: Buffer with the whole file
+        path: File path (for error messages)
+
+    Returns:
+        The stored Level
+    """
+    (
+        magic,
+        version,
+        width,
+        height,
+        player_x,
+        player_y,
+        fox_count,
+        super_seed_count,
+        region_count,
+        table_count,
+    ) = _HEADER.unpack_from(view, 0)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ValueError(f"{path} is not a compiled level (version {CACHE_VERSION})")
+
+    offset = _HEADER.size
+    tiles = []
+    for _ in range(fox_count + super_seed_count):
+        tiles.append(_TILE.unpack_from(view, offset))
+        offset += _TILE.size
+    fox_spawns = tiles[:fox_count]
+    super_seed_tiles = tiles[fox_count:]
+
+    size = width * height
+    planes = _PlaneReader(view, offset, path)
+    grid_plane = planes.take("B", size)
+    neighbours = planes.take("B", size)
+    labels = planes.take("I", size)
+    sizes = planes.take("I", region_count)
+    table = None
+    if table_count >= 0:
+        table = DistanceTable.from_planes(
+            width,
+            height,
+            table_count,
+            planes.take("i", size),
+            planes.take("H", table_count * table_count),
+            planes.take("B", table_count * table_count),
+        )
+    if planes.offset != len(view):
+        raise ValueError(f"{path} is truncated")
+
+    grid = [grid_plane[row * width : (row + 1) * width] for row in range(height)]
+    maze = Maze(
+        grid,
+        neighbours=neighbours,
+        component_labels=labels,
+        component_sizes=sizes,
+        distance_table=table,
+    )
+
+    return Level(maze, (player_x, player_y), fox_spawns, super_seed_tiles)
+
+
+def load_level(path: str, cache_dir: Optional[str] = None) -> Level:
+    """
+    Load a TMX level, using the compiled cache when possible.
+
+    The cache is keyed by the SHA-256 of the TMX file contents, so editing
+    the map in Tiled automatically invalidates it.
+
+    Args:
+        path: Path to the .tmx file
+        cache_dir: Directory for compiled levels (default: LEVEL_CACHE_DIR)
+
+    Returns:
+        The Level
+    """
+    with open(path, "rb") as tmx_file:
+        digest = hashlib.sha256(tmx_file.read()).hexdigest()
+
+    cache_dir = os.path.expanduser(cache_dir or LEVEL_CACHE_DIR)
+    cache_path = os.path.join(cache_dir, digest + CACHE_SUFFIX)
+
+    if os.path.exists(cache_path):
+        try:
+            return load_compiled(cache_path)
+        except ValueError:
+            # Stale format or damaged file - rebuild it below
+            pass
+
+    level = load_tmx(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    compile_level(level, cache_path)
+    return level
@@ -3,14 +3,26 @@ Maze/Map module.
 Handles maze layout, walls, and tile management.
 """
 
-import arcade
-from typing import List, Tuple
+from array import array
+from typing import List, MutableSequence, Optional, Sequence, Tuple
 from pacman.utils.constants import (
     TILE_SIZE,
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
-    COLOR_WALL
+    DIRECTION_VECTORS,
+    PATHFINDING_TABLE_MAX_TILES
 )
+from pacman.utils.pathfinding import DistanceTable
+
+
+# Maze.neighbours layout: low 4 bits = open-direction mask
+# (bit N set = direction N is open), high bits = tile class
+OPEN_MASK = 0x0F
+TILE_CLASS_MASK = 0x30
+TILE_CLASS_WALL = 0x00      # Wall tile
+TILE_CLASS_DEAD_END = 0x10  # At most one open direction
+TILE_CLASS_CORRIDOR = 0x20  # Two open directions (straight or corner)
+TILE_CLASS_JUNCTION = 0x30  # Three or four open directions
 
 
 class Maze:
@@ -22,22 +34,86 @@ class Maze:
         height: Height in tiles
         grid: 2D array representing the maze (0=empty, 1=wall)
         walls: List of wall rectangles for collision detection
+        neighbours: Per-tile byte (index y * width + x) holding the
+            open-direction mask and tile class, see OPEN_MASK
+        distance_table: All-pairs BFS table for fox pathfinding, built on
+            first use or by precompute() (None for mazes too large for it)
+        component_label(), is_reachable(), component_size(): Connected
+            walkable regions, labelled once per layout (O(1) queries)
+        revision: Counter bumped on every tile change, lets caches
+            built from the maze notice that they are stale
     """
     
-    def __init__(self):
-        """Initialize the maze."""
+    def __init__(self, grid: Optional[List[Sequence[int]]] = None,
+                 neighbours: Optional[MutableSequence[int]] = None,
+                 width: Optional[int] = None, height: Optional[int] = None,
+                 component_labels: Optional[Sequence[int]] = None,
+                 component_sizes: Optional[Sequence[int]] = None,
+                 distance_table: Optional[DistanceTable] = None):
+        """
+        Initialize the maze.
+        
+        The precomputed arguments (e.g. views into a compiled level file)
+        are used as given, so nothing derived from the grid is rebuilt.
+        
+        Args:
+            grid: Tile rows, bottom row first (0=empty, 1=wall); defaults
+                to the built-in maze. Rows may be lists or writable byte
+                views.
+            neighbours: Precomputed neighbour bytes for grid, skips
+                recomputing them
+            width: Built-in maze width in tiles (default: fits the screen)
+            height: Built-in maze height in tiles (default: fits the screen)
+            component_labels: Precomputed region label per tile (with
+                component_sizes), skips labelling
+            component_sizes: Tiles per region label, label 0 first
+            distance_table: Precomputed pathfinding table for grid
+        """
         # Calculate grid dimensions
-        self.width = SCREEN_WIDTH // TILE_SIZE
-        self.height = SCREEN_HEIGHT // TILE_SIZE
+        if grid is not None:
+            self.width = len(grid[0])
+            self.height = len(grid)
+        else:
+            self.width = width or SCREEN_WIDTH // TILE_SIZE
+            self.height = height or SCREEN_HEIGHT // TILE_SIZE
         
         # Create empty grid
-        self.grid: List[List[int]] = []
+        self.grid: List[Sequence[int]] = []
+        
+        # Wall rectangles for collision (listed on first use, see walls)
+        self._walls: Optional[List[Tuple[float, float, float, float]]] = None
+        
+        # Open directions + junction/dead-end class for every tile
+        self.neighbours = bytearray(self.width * self.height)
         
-        # Wall rectangles for collision
-        self.walls: List[Tuple[float, float, float, float]] = []
+        self.revision = 0
         
-        # Create default maze
-        self._create_default_maze()
+        # Pathfinding table (rebuilt lazily after the grid changes)
+        self._distance_table: Optional[DistanceTable] = None
+        self._distance_table_stale = True
+        
+        # Connected walkable regions (relabelled lazily after the grid changes)
+        self._component_labels = array("I")
+        self._component_sizes: List[int] = [0]
+        self._components_stale = True
+        
+        if grid is not None:
+            self.grid = grid
+            if neighbours is not None:
+                self.neighbours = neighbours
+            else:
+                self._build_neighbour_masks()
+        else:
+            # Create default maze
+            self._create_default_maze()
+        
+        if component_labels is not None:
+            self._component_labels = component_labels
+            self._component_sizes = component_sizes
+            self._components_stale = False
+        if distance_table is not None:
+            self._distance_table = distance_table
+            self._distance_table_stale = False
         
     def _create_default_maze(self):
         """Create a simple hardcoded maze layout."""
@@ -64,12 +140,19 @@ class Maze:
                 elif y == self.height - 6 and (x < 8 or x > self.width - 9):
                     self.grid[y][x] = 1
         
-        # Build wall collision rectangles
-        self._build_wall_rectangles()
+        # Build movement lookup table
+        self._build_neighbour_masks()
+    
+    @property
+    def walls(self) -> List[Tuple[float, float, float, float]]:
+        """Collision rectangles (left, bottom, width, height), one per wall."""
+        if self._walls is None:
+            self._build_wall_rectangles()
+        return self._walls
         
     def _build_wall_rectangles(self):
         """Build collision rectangles for all walls."""
-        self.walls.clear()
+        self._walls = []
         
         for y in range(self.height):
             for x in range(self.width):
@@ -79,31 +162,307 @@ class Maze:
                     wall_y = y * TILE_SIZE
                     
                     # Store as (left, bottom, width, height)
-                    self.walls.append((
+                    self._walls.append((
                         wall_x,
                         wall_y,
                         TILE_SIZE,
                         TILE_SIZE
                     ))
     
-    def draw(self):
-        """Draw the maze."""
+    def set_tile(self, tile_x: int, tile_y: int, value: int):
+        """
+        Change a single tile and refresh derived wall data.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            value: New tile value (0=empty, 1=wall)
+        """
+        if self.grid[tile_y][tile_x] == value:
+            return
+        self.grid[tile_y][tile_x] = value
+        self.revision += 1
+        
+        # Update the collision rectangle (if listed yet)
+        if self._walls is not None:
+            wall = (tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            if value == 1:
+                self._walls.append(wall)
+            else:
+                self._walls.remove(wall)
+        
+        # Only this tile and its 4 neighbours can change
+        self._update_neighbour_mask(tile_x, tile_y)
+        for dx, dy in DIRECTION_VECTORS:
+            self._update_neighbour_mask(tile_x + dx, tile_y + dy)
+        
+        self._distance_table_stale = True
+        self._components_stale = True
+    
+    def precompute(self):
+        """
+        Build the derived pathfinding data now instead of on first use.
+        
+        Connected regions and the distance table are otherwise built
+        lazily; level loading calls this so the first game tick doesn't
+        pay for them.
+        """
+        if self._components_stale:
+            self._label_components()
+        self.distance_table
+    
+    @property
+    def distance_table(self) -> Optional[DistanceTable]:
+        """
+        All-pairs shortest path table over walkable tiles.
+        
+        Returns:
+            DistanceTable, or None if the maze has more walkable tiles
+            than PATHFINDING_TABLE_MAX_TILES
+        """
+        if self._distance_table_stale:
+            # Walls are the only tiles with a zero neighbour byte
+            walkable = len(self.neighbours) - bytes(self.neighbours).count(0)
+            if walkable <= PATHFINDING_TABLE_MAX_TILES:
+                self._distance_table = DistanceTable(self)
+            else:
+                self._distance_table = None
+            self._distance_table_stale = False
+        return self._distance_table
+    
+    def _label_components(self):
+        """
+        Label every connected region of walkable tiles in one pass.
+        
+        Each walkable tile gets the label (1, 2, ...) of its region, walls
+        get 0. Every tile is pushed at most once, so this is linear in the
+        maze size.
+        """
+        width = self.width
+        neighbours = self.neighbours
+        labels = array("I", bytes(4 * self.width * self.height))
+        sizes = [0]
+        offsets = [(1 << direction, dx + dy * width)
+                   for direction, (dx, dy) in enumerate(DIRECTION_VECTORS)]
+        
+        for start, tile_byte in enumerate(neighbours):
+            if labels[start] or not tile_byte & TILE_CLASS_MASK:
+                continue
+            label = len(sizes)
+            labels[start] = label
+            size = 0
+            stack = [start]
+            while stack:
+                index = stack.pop()
+                size += 1
+                mask = neighbours[index]
+                for bit, offset in offsets:
+                    if mask & bit and not labels[index + offset]:
+                        labels[index + offset] = label
+                        stack.append(index + offset)
+            sizes.append(size)
+        
+        self._component_labels = labels
+        self._component_sizes = sizes
+        self._components_stale = False
+    
+    def component_label(self, tile_x: int, tile_y: int) -> int:
+        """
+        Get the connected region a tile belongs to.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            Region label (1 or more), 0 for walls and out-of-bounds tiles
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return 0
+        if self._components_stale:
+            self._label_components()
+        return self._component_labels[tile_y * self.width + tile_x]
+    
+    def is_reachable(self, start: Tuple[int, int], end: Tuple[int, int]) -> bool:
+        """
+        Check if one tile can be walked to from another, in O(1).
+        
+        Args:
+            start: Start tile (x, y)
+            end: End tile (x, y)
+            
+        Returns:
+            True if both tiles are walkable and connected
+        """
+        label = self.component_label(*start)
+        return label != 0 and label == self.component_label(*end)
+    
+    def component_size(self, tile_x: int, tile_y: int) -> int:
+        """
+        Get the number of walkable tiles connected to a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            Size of the tile's region (itself included), 0 for walls
+        """
+        # Look the label up first: it relabels a stale maze
+        label = self.component_label(tile_x, tile_y)
+        return self._component_sizes[label]
+    
+    def component_tiles(self, tile_x: int, tile_y: int) -> List[Tuple[int, int]]:
+        """
+        Get every tile connected to a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            (x, y) tiles of the region, row by row from the bottom;
+            empty for walls
+        """
+        label = self.component_label(tile_x, tile_y)
+        if label == 0:
+            return []
+        width = self.width
+        return [
+            (index % width, index // width)
+            for index, value in enumerate(self._component_labels)
+            if value == label
+        ]
+    
+    def nearest_reachable_tile(self, start: Tuple[int, int],
+                               tile_x: int, tile_y: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the tile connected to start that is closest to a position.
+        
+        Searches outward in rings of growing Manhattan distance, so it
+        usually only looks at a handful of tiles.
+        
+        Args:
+            start: Tile (x, y) the search region belongs to
+            tile_x: Preferred tile X
+            tile_y: Preferred tile Y
+            
+        Returns:
+            Closest connected tile (x, y); ties go to the lowest row, then
+            column. None if start is not walkable.
+        """
+        label = self.component_label(*start)
+        if label == 0:
+            return None
+        
+        max_distance = self.width + self.height
+        for distance in range(max_distance + 1):
+            found = []
+            for dy in range(-distance, distance + 1):
+                rest = distance - abs(dy)
+                for dx in {-rest, rest}:
+                    if self.component_label(tile_x + dx, tile_y + dy) == label:
+                        found.append((tile_y + dy, tile_x + dx))
+            if found:
+                found_y, found_x = min(found)
+                return found_x, found_y
+        return None
+    
+    def _build_neighbour_masks(self):
+        """Compute open-direction masks and tile classes for all tiles."""
+        self.neighbours = bytearray(self.width * self.height)
         for y in range(self.height):
             for x in range(self.width):
-                if self.grid[y][x] == 1:  # Wall
-                    # Calculate pixel position (bottom-left corner)
-                    pixel_x = x * TILE_SIZE
-                    pixel_y = y * TILE_SIZE
-                    
-                    # Draw wall as filled rectangle
-                    # arcade.draw_lrbt_rectangle_filled(left, right, bottom, top, color)
-                    arcade.draw_lrbt_rectangle_filled(
-                        pixel_x,
-                        pixel_x + TILE_SIZE,
-                        pixel_y,
-                        pixel_y + TILE_SIZE,
-                        COLOR_WALL
-                    )
+                self._update_neighbour_mask(x, y)
+    
+    def _update_neighbour_mask(self, tile_x: int, tile_y: int):
+        """
+        Recompute the neighbour byte of a single tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return
+        
+        index = tile_y * self.width + tile_x
+        if self.grid[tile_y][tile_x] == 1:
+            self.neighbours[index] = TILE_CLASS_WALL
+            return
+        
+        mask = 0
+        for direction, (dx, dy) in enumerate(DIRECTION_VECTORS):
+            if not self.is_wall(tile_x + dx, tile_y + dy):
+                mask |= 1 << direction
+        
+        open_count = bin(mask).count("1")
+        if open_count <= 1:
+            tile_class = TILE_CLASS_DEAD_END
+        elif open_count == 2:
+            tile_class = TILE_CLASS_CORRIDOR
+        else:
+            tile_class = TILE_CLASS_JUNCTION
+        
+        self.neighbours[index] = mask | tile_class
+    
+    def open_directions(self, tile_x: int, tile_y: int) -> int:
+        """
+        Get the directions that lead from a tile to a non-wall tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            Bit mask, bit N set if direction N (0=right, 1=up, 2=left,
+            3=down) is open; 0 for walls and out-of-bounds tiles
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return 0
+        return self.neighbours[tile_y * self.width + tile_x] & OPEN_MASK
+    
+    def tile_class(self, tile_x: int, tile_y: int) -> int:
+        """
+        Get the classification of a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            One of TILE_CLASS_WALL, TILE_CLASS_DEAD_END,
+            TILE_CLASS_CORRIDOR, TILE_CLASS_JUNCTION
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return TILE_CLASS_WALL
+        return self.neighbours[tile_y * self.width + tile_x] & TILE_CLASS_MASK
+    
+    def is_junction(self, tile_x: int, tile_y: int) -> bool:
+        """
+        Check if more than two directions are open from a tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            True if the tile is a junction
+        """
+        return self.tile_class(tile_x, tile_y) == TILE_CLASS_JUNCTION
+    
+    def is_dead_end(self, tile_x: int, tile_y: int) -> bool:
+        """
+        Check if at most one direction is open from a (non-wall) tile.
+        
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+            
+        Returns:
+            True if the tile is a dead end
+        """
+        return self.tile_class(tile_x, tile_y) == TILE_CLASS_DEAD_END
     
     def is_wall(self, tile_x: int, tile_y: int) -> bool:
         """
@@ -0,0 +1,179 @@
+"""
+Grid observations of a running Simulation.
+
+The board is kept as one uint8 tensor of shape (channels, height, width),
+indexed [channel, tile_y, tile_x] (row 0 is the bottom row, as in
+Maze.grid). Channels that only change with the layout (walls, seeds) are
+built once; after that update() only erases the seeds collected since the
+last call and moves the chicken and fox marks, in place. Consumers get a
+read-only NumPy view of the same memory, so nothing is copied per tick.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from pacman.entities.collectibles import SEED_REGULAR, SEED_SUPER
+from pacman.entities.fox import FoxState
+from pacman.simulation import Simulation
+
+# Channel indices
+CHANNEL_WALLS = 0
+CHANNEL_SEEDS = 1
+CHANNEL_SUPER_SEEDS = 2
+CHANNEL_CHICKEN = 3
+# One fox channel per state
+FOX_STATE_CHANNELS = {
+    FoxState.CHASE: 4,
+    FoxState.SCATTER: 5,
+    FoxState.FRIGHTENED: 6,
+    FoxState.EATEN: 7,
+}
+CHANNEL_COUNT = 8
+
+CHANNEL_NAMES = (
+    "walls",
+    "seeds",
+    "super_seeds",
+    "chicken",
+    "fox_chase",
+    "fox_scatter",
+    "fox_frightened",
+    "fox_eaten",
+)
+
+
+class GridObservation:
+    """
+    Multi-channel grid view of a simulation, updated in place.
+
+    Attributes:
+        simulation: Simulation being observed
+        planes: Read-only view of the board tensor (channels, height, width);
+            the same array object is valid for the simulation's lifetime
+    """
+
+    def __init__(self, simulation: Simulation):
+        """
+        Build the static channels and take the first observation.
+
+        Args:
+            simulation: Simulation to observe
+        """
+        self.simulation = simulation
+        maze = simulation.maze
+        self._planes = np.zeros(
+            (CHANNEL_COUNT, maze.height, maze.width), dtype=np.uint8
+        )
+        self.planes = self._planes.view()
+        self.planes.flags.writeable = False
+
+        # Layout the static channels were built from
+        self._maze = None
+        self._maze_revision = -1
+        self._seed_manager = None
+        self._seed_revision = -1
+        # Entries of seed_manager.collected_tiles already erased
+        self._erased = 0
+        # Cells marked in the dynamic channels: (channel, tile_y, tile_x)
+        self._marked: List[Tuple[int, int, int]] = []
+
+        self.update()
+
+    def channel(self, name: str) -> np.ndarray:
+        """
+        Get one channel by name.
+
+        Args:
+            name: One of CHANNEL_NAMES
+
+        Returns:
+            Read-only (height, width) view
+        """
+        return self.planes[CHANNEL_NAMES.index(name)]
+
+    def _build_walls(self):
+        """Fill the wall channel from Maze.grid."""
+        maze = self.simulation.maze
+        if maze.height != self._planes.shape[1] or maze.width != self._planes.shape[2]:
+            raise ValueError("maze size changed; create a new GridObservation")
+        self._planes[CHANNEL_WALLS] = np.array(maze.grid, dtype=np.uint8)
+        self._maze = maze
+        self._maze_revision = maze.revision
+
+    def _build_seeds(self):
+        """Fill both seed channels from the seed field."""
+        seed_manager = self.simulation.seed_manager
+        self._seed_manager = seed_manager
+        self._seed_revision = seed_manager.layout_revision
+        self._erased = len(seed_manager.collected_tiles)
+
+        field = seed_manager.field
+        if field is None:
+            self._planes[CHANNEL_SEEDS : CHANNEL_SUPER_SEEDS + 1] = 0
+            return
+        shape = (field.height, field.width)
+        present = np.unpackbits(
+            np.frombuffer(field.present, dtype=np.uint8), bitorder="little"
+        )[: field.width * field.height].reshape(shape)
+        kinds = np.frombuffer(field.kinds, dtype=np.uint8).reshape(shape)
+        self._planes[CHANNEL_SEEDS] = present & (kinds == SEED_REGULAR)
+        self._planes[CHANNEL_SUPER_SEEDS] = present & (kinds == SEED_SUPER)
+
+    def update(self) -> np.ndarray:
+        """
+        Bring the dynamic channels up to date (call once per tick).
+
+        Returns:
+            The read-only planes view
+        """
+        simulation = self.simulation
+        planes = self._planes
+
+        maze = simulation.maze
+        if maze is not self._maze or maze.revision != self._maze_revision:
+            self._build_walls()
+
+        seed_manager = simulation.seed_manager
+        if (
+            seed_manager is not self._seed_manager
+            or seed_manager.layout_revision != self._seed_revision
+        ):
+            self._build_seeds()
+        else:
+            collected = seed_manager.collected_tiles
+            for tile_x, tile_y in collected[self._erased :]:
+                planes[CHANNEL_SEEDS, tile_y, tile_x] = 0
+                planes[CHANNEL_SUPER_SEEDS, tile_y, tile_x] = 0
+            self._erased = len(collected)
+
+        for cell in self._marked:
+            planes[cell] = 0
+        marked = [self._cell(CHANNEL_CHICKEN, simulation.player.get_tile_position())]
+        marked.extend(
+            self._cell(FOX_STATE_CHANNELS[fox.state], fox.get_tile_position())
+            for fox in simulation.fox_manager.foxes
+        )
+        self._marked = [cell for cell in marked if cell is not None]
+        for cell in self._marked:
+            planes[cell] = 1
+
+        return self.planes
+
+    def _cell(
+        self, channel: int, tile: Tuple[int, int]
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Get the tensor index of a tile, if it is inside the maze.
+
+        Args:
+            channel: Channel index
+            tile: Tile (x, y)
+
+        Returns:
+            (channel, tile_y, tile_x), or None outside the maze
+        """
+        tile_x, tile_y = tile
+        if 0 <= tile_x < self._planes.shape[2] and 0 <= tile_y < self._planes.shape[1]:
+            return channel, tile_y, tile_x
+        return None
@@ -0,0 +1,388 @@
+"""
+Replay recording and playback.
+
+A replay stores the session seed plus only the ticks where the held
+direction changed, so a whole session takes a few bytes per key press.
+Since the simulation is deterministic for a given seed, maze and inputs,
+replaying re-simulates the exact same game, headless and as fast as the
+CPU allows.
+
+File layout:
+    magic (6 bytes) "CHKRPL", version (1 byte), seed (8 bytes, little-endian),
+    map hash (8 bytes, little-endian, 0 = not recorded; see map_digest)
+    records: varint (tick delta << 3 | input code)
+    end record: varint (tick delta << 3 | END_CODE), varint final score
+
+Input codes 0-3 are directions (0=right, 1=up, 2=left, 3=down),
+NO_INPUT_CODE means no key held.
+"""
+
+import argparse
+import hashlib
+import struct
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from pacman.maps.level_loader import Level, load_level
+from pacman.maps.maze import Maze
+from pacman.simulation import Simulation
+from pacman.utils.constants import SIMULATION_RATE
+
+REPLAY_MAGIC = b"CHKRPL"
+REPLAY_VERSION = 2
+REPLAY_SUFFIX = ".chkrpl"
+_HEADER = struct.Struct("<6sBQQ")
+# Version 1 had no map hash
+_HEADER_V1 = struct.Struct("<6sBQ")
+
+# Largest seed the header can hold
+MAX_SEED = 2**64 - 1
+
+NO_INPUT_CODE = 4
+END_CODE = 7
+_CODE_BITS = 3
+
+
+def _write_varint(out: bytearray, value: int):
+    """
+    Append an unsigned LEB128 varint.
+
+    Args:
+        out: Buffer to append to
+        value: Non-negative integer
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def map_digest(maze: Maze, level: Optional[Level] = None) -> int:
+    """
+    Identify the map a session is played on.
+
+    Args:
+        maze: The session's maze
+        level: The session's level (its spawns are part of the map)
+
+    Returns:
+        Non-zero 64-bit hash of the layout and spawn points
+    """
+    digest = hashlib.sha256(struct.pack("<II", maze.width, maze.height))
+    for row in maze.grid:
+        digest.update(bytes(row))
+    if level:
+        tiles = [level.player_spawn, *level.fox_spawns, *level.super_seed_tiles]
+        digest.update(repr(tiles).encode())
+    return int.from_bytes(digest.digest()[:8], "little") or 1
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """
+    Read an unsigned LEB128 varint.
+
+    Args:
+        data: Buffer to read from
+        offset: Position of the first byte
+
+    Returns:
+        Tuple of (value, offset after the varint)
+
+    Raises:
+        ValueError: If the buffer ends inside the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Replay is truncated")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+class Replay:
+    """
+    A recorded session.
+
+    Attributes:
+        seed: Simulation seed
+        inputs: (tick, direction) pairs, one per change of the held
+            direction (direction None = no key held)
+        length: Number of ticks in the session
+        final_score: Score at the end of the session (for verification)
+        map_hash: map_digest() of the map it was recorded on (None =
+            unknown)
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        inputs: List[Tuple[int, Optional[int]]],
+        length: int,
+        final_score: int = 0,
+        map_hash: Optional[int] = None,
+    ):
+        """
+        Initialize a replay.
+
+        Args:
+            seed: Simulation seed (0 to MAX_SEED)
+            inputs: (tick, direction) input changes in tick order
+            length: Number of ticks in the session
+            final_score: Score at the end of the session
+            map_hash: map_digest() of the map it was recorded on
+        """
+        self.seed = seed
+        self.inputs = inputs
+        self.length = length
+        self.final_score = final_score
+        self.map_hash = map_hash
+
+    def to_bytes(self) -> bytes:
+        """
+        Encode the replay.
+
+        Returns:
+            Binary replay data
+        """
+        out = bytearray(
+            _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.map_hash or 0)
+        )
+        last_tick = 0
+        for tick, direction in self.inputs:
+            code = NO_INPUT_CODE if direction is None else direction
+            _write_varint(out, (tick - last_tick) << _CODE_BITS | code)
+            last_tick = tick
+        _write_varint(out, (self.length - last_tick) << _CODE_BITS | END_CODE)
+        _write_varint(out, self.final_score)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Decode a replay.
+
+        Args:
+            data: Binary replay data
+
+        Returns:
+            The Replay
+
+        Raises:
+            ValueError: If the data is not a replay of this version
+        """
+        if len(data) < _HEADER_V1.size:
+            raise ValueError("Not a replay file")
+        magic, version, seed = _HEADER_V1.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version not in (1, REPLAY_VERSION):
+            raise ValueError(f"Not a replay file (version {REPLAY_VERSION})")
+
+        map_hash = None
+        offset = _HEADER_V1.size
+        if version == REPLAY_VERSION:
+            if len(data) < _HEADER.size:
+                raise ValueError("Replay is truncated")
+            map_hash = _HEADER.unpack_from(data, 0)[3] or None
+            offset = _HEADER.size
+
+        inputs = []
+        tick = 0
+        while True:
+            value, offset = _read_varint(data, offset)
+            tick += value >> _CODE_BITS
+            code = value & ((1 << _CODE_BITS) - 1)
+            if code == END_CODE:
+                final_score, offset = _read_varint(data, offset)
+                return cls(seed, inputs, tick, final_score, map_hash)
+            if code > NO_INPUT_CODE:
+                raise ValueError(f"Bad input code {code} at tick {tick}")
+            inputs.append((tick, None if code == NO_INPUT_CODE else code))
+
+    def save(self, path: str):
+        """
+        Write the replay to a file.
+
+        Args:
+            path: Output file path
+        """
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """
+        Read a replay from a file.
+
+        Args:
+            path: Replay file path
+
+        Returns:
+            The Replay
+        """
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+    def check_map(self, maze: Maze, level: Optional[Level] = None):
+        """
+        Make sure the replay is played on the map it was recorded on.
+
+        Args:
+            maze: Maze about to be played
+            level: Level about to be played
+
+        Raises:
+            ValueError: If the replay was recorded on a different map
+        """
+        if self.map_hash is not None and self.map_hash != map_digest(maze, level):
+            raise ValueError(
+                "Replay was recorded on a different map "
+                "(pass the --map it was recorded with)"
+            )
+
+    def iter_inputs(self) -> Iterator[Optional[int]]:
+        """
+        Expand the recorded changes into one held direction per tick.
+
+        Yields:
+            Direction held on ticks 1 to length (None = no key held)
+        """
+        changes = iter(self.inputs)
+        next_change = next(changes, None)
+        held = None
+        for tick in range(1, self.length + 1):
+            while next_change is not None and next_change[0] <= tick:
+                held = next_change[1]
+                next_change = next(changes, None)
+            yield held
+
+
+class ReplayRecorder:
+    """
+    Collects input changes from Simulation.step().
+
+    Attach with simulation.recorder = ReplayRecorder(simulation.seed,
+    map_digest(simulation.maze, level)) right after the simulation is
+    created or reset.
+
+    Attributes:
+        seed: Seed of the recorded simulation
+        map_hash: map_digest() of the recorded map (None = not stored)
+        inputs: (tick, direction) input changes so far
+        last_tick: Last tick seen
+    """
+
+    def __init__(self, seed: int, map_hash: Optional[int] = None):
+        """
+        Initialize the recorder.
+
+        Args:
+            seed: Seed of the recorded simulation
+            map_hash: map_digest() of the recorded map
+        """
+        self.seed = seed
+        self.map_hash = map_hash
+        self.inputs: List[Tuple[int, Optional[int]]] = []
+        self.last_tick = 0
+        self._held: Optional[int] = None
+
+    def record(self, tick: int, direction: Optional[int]):
+        """
+        Record the input of one tick (only changes are stored).
+
+        Args:
+            tick: Simulation tick
+            direction: Direction held this tick, or None
+        """
+        self.last_tick = tick
+        if direction != self._held:
+            self._held = direction
+            self.inputs.append((tick, direction))
+
+    def finish(self, final_score: int = 0) -> Replay:
+        """
+        Build the replay of everything recorded so far.
+
+        Args:
+            final_score: Score at the end of the session
+
+        Returns:
+            The Replay
+        """
+        return Replay(
+            self.seed, list(self.inputs), self.last_tick, final_score, self.map_hash
+        )
+
+
+def play_replay(
+    replay: Replay, maze: Optional[Maze] = None, level: Optional[Level] = None
+) -> Simulation:
+    """
+    Re-simulate a replay headless, as fast as possible.
+
+    The replay must be played on the same maze or level it was
+    recorded on.
+
+    Args:
+        replay: Replay to play
+        maze: Maze the session was played on (default: built-in maze)
+        level: Level the session was played on (overrides maze)
+
+    Returns:
+        The Simulation after the last recorded tick
+
+    Raises:
+        ValueError: If the replay was recorded on a different map
+    """
+    simulation = Simulation(maze=maze, level=level, seed=replay.seed)
+    replay.check_map(simulation.maze, level)
+    step = simulation.step
+    for direction in replay.iter_inputs():
+        step(direction)
+    return simulation
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Command line replay player (headless).
+
+    Args:
+        argv: Arguments (default: sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-simulate Chickman replays headless"
+    )
+    parser.add_argument("replays", nargs="+", help="Replay files")
+    parser.add_argument("--map", help="Tiled (.tmx) map the replays were recorded on")
+    args = parser.parse_args(argv)
+
+    level = load_level(args.map) if args.map else None
+    mismatches = 0
+    for path in args.replays:
+        try:
+            replay = Replay.load(path)
+            start = time.perf_counter()
+            simulation = play_replay(replay, level=level)
+        except ValueError as error:
+            print(f"{path}: {error}")
+            mismatches += 1
+            continue
+        elapsed = time.perf_counter() - start
+
+        status = "ok" if simulation.score == replay.final_score else "MISMATCH"
+        if status != "ok":
+            mismatches += 1
+        speedup = replay.length / SIMULATION_RATE / elapsed if elapsed else float("inf")
+        print(
+            f"{path}: {replay.length} ticks, score {simulation.score} "
+            f"(recorded {replay.final_score}) {status}, {speedup:.0f}x real time"
+        )
+
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
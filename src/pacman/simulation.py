@@ -0,0 +1,273 @@
+"""
+Headless simulation module.
+Owns the game state and advances it one tick at a time, without any window.
+"""
+
+import random
+from typing import Optional, Set
+
+from pacman.entities.collectibles import SeedManager
+from pacman.entities.fox import Fox, FoxManager, FoxState
+from pacman.entities.player import Player
+from pacman.maps.level_loader import Level
+from pacman.maps.maze import Maze
+from pacman.utils.constants import (
+    FOX_POINTS,
+    FOX_SCARED_TIME,
+    SIMULATION_TICK,
+    TILE_SIZE,
+)
+from pacman.utils.event_log import get_logger
+from pacman.utils.profiler import (
+    NULL_PROFILER,
+    STAGE_FOX_UPDATE,
+    STAGE_PLAYER_UPDATE,
+    STAGE_SEED_COLLISION,
+)
+
+log = get_logger(__name__)
+
+
+class Simulation:
+    """
+    Window-free game logic: maze, chicken, seeds, foxes, score and power mode.
+
+    The renderer (ChickmanGame) only reads this state; everything that
+    changes the game happens inside step().
+
+    Attributes:
+        maze: The Maze being played
+        player: The chicken
+        seed_manager: Seeds and super seeds in the maze
+        fox_manager: All foxes
+        score: Current score
+        power_mode: True while foxes are frightened
+        power_timer: Remaining power mode time in seconds
+        tick: Number of steps simulated since reset()
+        level_complete: True once every seed has been collected
+        fox_catches: Times a fox caught the chicken (one per contact, not
+            per tick of contact)
+        foxes_eaten: Frightened foxes eaten
+        first_caught_tick: Tick of the first catch (None = never caught)
+        seed: Seed of the session's random source; the same seed, maze
+            and inputs always give the same game
+        rng: The session's random source (recreated by reset())
+        recorder: Optional ReplayRecorder receiving the inputs of every step
+        profiler: FrameProfiler timing the update stages (NULL_PROFILER
+            when profiling is off)
+    """
+
+    def __init__(
+        self,
+        maze: Optional[Maze] = None,
+        level: Optional[Level] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the simulation.
+
+        Args:
+            maze: Maze to play in (defaults to the built-in maze)
+            level: Loaded level with spawn points (overrides maze)
+            seed: Random seed (defaults to a random one)
+        """
+        self._initial_maze = maze
+        self._level = level
+
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.recorder = None
+        self.profiler = NULL_PROFILER
+
+        self.maze: Optional[Maze] = None
+        self.player: Optional[Player] = None
+        self.seed_manager: Optional[SeedManager] = None
+        self.fox_manager: Optional[FoxManager] = None
+
+        self.score = 0
+        self.power_mode = False
+        self.power_timer = 0.0
+        self.tick = 0
+        self.level_complete = False
+        self.fox_catches = 0
+        self.foxes_eaten = 0
+        self.first_caught_tick: Optional[int] = None
+
+        # Direction held during the previous step (None = no movement key)
+        self._held_direction: Optional[int] = None
+
+        # Foxes touching the chicken last tick (a catch counts once)
+        self._catching: Set[Fox] = set()
+
+        self.reset()
+
+    def reset(self):
+        """Create a fresh maze, chicken, seeds and foxes."""
+        level = self._level
+        if level:
+            self.maze = level.maze
+        else:
+            self.maze = self._initial_maze if self._initial_maze else Maze()
+        log.info("🧱 Maze created: %dx%d tiles", self.maze.width, self.maze.height)
+
+        if level:
+            # Chicken starts on the level's spawn tile
+            self.player = Player(*self.maze.get_tile_center(*level.player_spawn))
+        else:
+            # Chicken starts in the middle of the maze
+            self.player = Player(
+                self.maze.width * TILE_SIZE // 2, self.maze.height * TILE_SIZE // 2
+            )
+        log.info(
+            "🐔 Chicken created at (%s, %s)", self.player.center_x, self.player.center_y
+        )
+
+        # Create seeds (using flood fill from chicken's starting position)
+        self.seed_manager = SeedManager()
+        self.seed_manager.on_level_complete = self._on_level_complete
+        player_tile_x, player_tile_y = self.player.get_tile_position()
+        if level:
+            self.seed_manager.create_seeds_for_maze(
+                self.maze,
+                player_tile_x,
+                player_tile_y,
+                reachable_tiles=level.reachable_tiles,
+                super_seed_tiles=level.super_seed_tiles or None,
+            )
+        else:
+            self.seed_manager.create_seeds_for_maze(
+                self.maze, player_tile_x, player_tile_y
+            )
+
+        # Same seed -> same fox decisions
+        self.rng = random.Random(self.seed)
+
+        # Create foxes
+        self.fox_manager = FoxManager(self.rng)
+        self.fox_manager.create_foxes(self.maze, level.fox_spawns if level else None)
+
+        self.score = 0
+        self.power_mode = False
+        self.power_timer = 0.0
+        self.tick = 0
+        self.level_complete = False
+        self.fox_catches = 0
+        self.foxes_eaten = 0
+        self.first_caught_tick = None
+        self._held_direction = None
+        self._catching = set()
+
+    def step(self, inputs: Optional[int] = None, delta_time: float = SIMULATION_TICK):
+        """
+        Advance the game by one tick.
+
+        Movement speeds are per tick, so the game should always be stepped
+        with the same delta_time (see FixedTimestep).
+
+        Args:
+            inputs: Movement direction held this tick
+                (0=right, 1=up, 2=left, 3=down, None=no key held)
+            delta_time: Time covered by this tick (in seconds)
+        """
+        self.tick += 1
+
+        if self.recorder:
+            self.recorder.record(self.tick, inputs)
+
+        self._apply_inputs(inputs)
+
+        # Update power mode timer
+        if self.power_mode:
+            self.power_timer -= delta_time
+            if self.power_timer <= 0:
+                self.power_mode = False
+                self.power_timer = 0.0
+                log.info("⚡ Power mode ended!")
+                # Set foxes back to normal
+                self.fox_manager.set_all_frightened(False)
+
+        profiler = self.profiler
+
+        with profiler.stage(STAGE_PLAYER_UPDATE):
+            self.player.update(self.maze)  # Pass maze for collision detection
+
+        # Update foxes
+        with profiler.stage(STAGE_FOX_UPDATE):
+            self.fox_manager.update(
+                self.maze, self.player.center_x, self.player.center_y
+            )
+
+        # Check fox collisions
+        colliding_foxes = self.fox_manager.check_collisions_with_chicken(
+            self.player.center_x, self.player.center_y, self.player.radius
+        )
+
+        catching = set()
+        for fox in colliding_foxes:
+            if fox.state == FoxState.FRIGHTENED:
+                # Eat the fox
+                fox.set_state(FoxState.EATEN)
+                self.score += FOX_POINTS
+                self.foxes_eaten += 1
+                log.info("🦊 Ate %s! +%d points", fox.name, FOX_POINTS)
+            elif fox.state != FoxState.EATEN:
+                # Fox caught chicken
+                catching.add(fox)
+                if fox not in self._catching:
+                    self.fox_catches += 1
+                    if self.first_caught_tick is None:
+                        self.first_caught_tick = self.tick
+                    log.info("💀 Game Over! Fox caught the chicken!")
+                # TODO: Implement lives system
+        self._catching = catching
+
+        # Check seed collisions
+        with profiler.stage(STAGE_SEED_COLLISION):
+            points_earned, ate_super_seed = self.seed_manager.check_collisions(
+                self.player.center_x, self.player.center_y, self.player.radius
+            )
+
+        if points_earned > 0:
+            self.score += points_earned
+            log.debug("🌾 +%d points! Total: %d", points_earned, self.score)
+
+        # Activate power mode if ate super seed
+        if ate_super_seed:
+            self.power_mode = True
+            self.power_timer = FOX_SCARED_TIME
+            log.info("💪 SUPER SEED! Foxes frightened! (%ss)", FOX_SCARED_TIME)
+            # Set all foxes to frightened
+            self.fox_manager.set_all_frightened(True)
+
+    def _on_level_complete(self):
+        """Called by the SeedManager when the last seed is collected."""
+        self.level_complete = True
+        log.info("🎉 Level Complete! All seeds collected!")
+        # TODO: Load next level
+
+    def _apply_inputs(self, direction: Optional[int]):
+        """
+        Turn the held direction into player movement requests.
+
+        Only changes are forwarded, so holding a key behaves like the
+        original key press / key release handling.
+
+        Args:
+            direction: Direction held this tick, or None
+        """
+        if direction == self._held_direction:
+            return
+        self._held_direction = direction
+
+        if direction is None:
+            self.player.stop()
+        elif direction == 0:
+            self.player.move_right()
+        elif direction == 1:
+            self.player.move_up()
+        elif direction == 2:
+            self.player.move_left()
+        elif direction == 3:
+            self.player.move_down()
@@ -0,0 +1,99 @@
+"""
+Scrolling camera module.
+Keeps the chicken in view when the maze is larger than the window.
+"""
+
+from typing import Optional, Tuple
+
+import arcade
+
+
+class FollowCamera:
+    """
+    Camera that follows a target and stays inside the maze.
+
+    The scroll position is plain math (usable without a window); the
+    arcade camera is only created when the view is first applied.
+
+    Attributes:
+        view_width: Visible width in pixels
+        view_height: Visible height in pixels
+        center_x: World X position at the middle of the view
+        center_y: World Y position at the middle of the view
+    """
+
+    def __init__(self, view_width: int, view_height: int):
+        """
+        Initialize the camera.
+
+        Args:
+            view_width: Visible width in pixels (usually the window width)
+            view_height: Visible height in pixels (usually the window height)
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.center_x = view_width / 2
+        self.center_y = view_height / 2
+
+        # Needs a window, so created in use()
+        self._camera: Optional[arcade.camera.Camera2D] = None
+
+    def follow(
+        self, target_x: float, target_y: float, world_width: float, world_height: float
+    ):
+        """
+        Center the view on a target, clamped to the world edges.
+
+        Along an axis where the world is smaller than the view, the world
+        is centered instead.
+
+        Args:
+            target_x: Target X position in pixels
+            target_y: Target Y position in pixels
+            world_width: Maze width in pixels
+            world_height: Maze height in pixels
+        """
+        self.center_x = self._clamp(target_x, self.view_width, world_width)
+        self.center_y = self._clamp(target_y, self.view_height, world_height)
+
+    @staticmethod
+    def _clamp(target: float, view_size: float, world_size: float) -> float:
+        """
+        Clamp a view center along one axis.
+
+        Args:
+            target: Desired center
+            view_size: Visible size along the axis
+            world_size: World size along the axis
+
+        Returns:
+            Center that keeps the view inside the world
+        """
+        half = view_size / 2
+        if world_size <= view_size:
+            return world_size / 2
+        return min(max(target, half), world_size - half)
+
+    @property
+    def view(self) -> Tuple[float, float, float, float]:
+        """
+        Visible world rectangle.
+
+        Returns:
+            Tuple of (left, bottom, right, top) in world pixels
+        """
+        half_width = self.view_width / 2
+        half_height = self.view_height / 2
+        return (
+            self.center_x - half_width,
+            self.center_y - half_height,
+            self.center_x + half_width,
+            self.center_y + half_height,
+        )
+
+    def use(self):
+        """Apply the scroll position to the arcade camera and activate it."""
+        if self._camera is None:
+            self._camera = arcade.camera.Camera2D()
+        self._camera.position = (self.center_x, self.center_y)
+        self._camera.use()
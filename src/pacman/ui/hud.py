@@ -0,0 +1,200 @@
+"""
+Heads-up display: score, seeds, power mode, position, FPS and help text.
+
+Text objects are created once and their contents are only changed when
+the value they show changes, so glyph layout does not run every frame.
+All HUD labels share one batch (one draw), and so do the title screen
+labels.
+"""
+
+from typing import Optional, Tuple
+
+import arcade
+from pyglet.graphics import Batch
+
+from pacman.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+TITLE_TEXT = "CHICKMAN - Junior.guru Challenge"
+START_TEXT = "Press SPACE to start..."
+INSTRUCTIONS_TEXT = "Use Arrow Keys or WASD to move | F3 frame stats | ESC to quit"
+
+
+class Hud:
+    """
+    Cached HUD and title screen text.
+
+    Attributes:
+        title_batch: Title screen labels (static)
+        hud_batch: In-game labels (instructions + live values)
+        fps_text: FPS counter (shown on every screen)
+        score_text: Score label
+        seeds_text: Remaining seeds label
+        power_text: Power mode countdown (hidden outside power mode)
+        position_text: Chicken position label (for debugging)
+    """
+
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT):
+        """
+        Initialize the HUD (text objects are created by setup()).
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+        """
+        self.width = width
+        self.height = height
+
+        self.title_batch: Optional[Batch] = None
+        self.hud_batch: Optional[Batch] = None
+        self.fps_text: Optional[arcade.Text] = None
+        self.score_text: Optional[arcade.Text] = None
+        self.seeds_text: Optional[arcade.Text] = None
+        self.power_text: Optional[arcade.Text] = None
+        self.position_text: Optional[arcade.Text] = None
+
+        self._forget_values()
+
+    def _forget_values(self):
+        """Mark every label as never set, so the next update fills it."""
+        self._score: Optional[int] = None
+        self._seeds: Optional[int] = None
+        self._power: Optional[float] = None
+        self._position: Optional[Tuple[int, int]] = None
+        self._fps: Optional[int] = None
+
+    def setup(self):
+        """Create every text object (needs a window)."""
+        width, height = self.width, self.height
+
+        self.title_batch = Batch()
+        arcade.Text(
+            TITLE_TEXT,
+            width // 2,
+            height // 2 + 50,
+            arcade.color.YELLOW,
+            20,
+            anchor_x="center",
+            batch=self.title_batch,
+        )
+        arcade.Text(
+            START_TEXT,
+            width // 2,
+            height // 2 - 50,
+            arcade.color.WHITE,
+            16,
+            anchor_x="center",
+            batch=self.title_batch,
+        )
+
+        self.hud_batch = Batch()
+        arcade.Text(
+            INSTRUCTIONS_TEXT,
+            width // 2,
+            20,
+            arcade.color.WHITE,
+            12,
+            anchor_x="center",
+            batch=self.hud_batch,
+        )
+        self.score_text = arcade.Text(
+            "",
+            10,
+            height - 70,
+            arcade.color.YELLOW,
+            18,
+            bold=True,
+            batch=self.hud_batch,
+        )
+        self.seeds_text = arcade.Text(
+            "", 10, height - 100, arcade.color.WHITE, 14, batch=self.hud_batch
+        )
+        self.power_text = arcade.Text(
+            "",
+            width // 2,
+            height - 50,
+            arcade.color.YELLOW,
+            20,
+            bold=True,
+            anchor_x="center",
+            batch=self.hud_batch,
+        )
+        self.power_text.visible = False
+        self.position_text = arcade.Text(
+            "", 10, height - 60, arcade.color.WHITE, 12, batch=self.hud_batch
+        )
+
+        self.fps_text = arcade.Text("", 10, height - 30, arcade.color.WHITE, 14)
+
+        self._forget_values()
+
+    def set_fps(self, fps: int):
+        """
+        Update the FPS counter.
+
+        Args:
+            fps: Frames per second
+        """
+        if fps != self._fps:
+            self._fps = fps
+            self.fps_text.text = f"FPS: {fps}"
+
+    def update(
+        self,
+        score: int,
+        seeds: int,
+        power_timer: Optional[float],
+        position_x: float,
+        position_y: float,
+    ):
+        """
+        Update the in-game labels whose values changed.
+
+        Args:
+            score: Current score
+            seeds: Seeds left
+            power_timer: Power mode time left in seconds (None = no power mode)
+            position_x: Chicken X in pixels
+            position_y: Chicken Y in pixels
+        """
+        if score != self._score:
+            self._score = score
+            self.score_text.text = f"SCORE: {score}"
+
+        if seeds != self._seeds:
+            self._seeds = seeds
+            self.seeds_text.text = f"Seeds: {seeds}"
+
+        # Shown with one decimal, so only a change of a tenth matters
+        power = None if power_timer is None else round(power_timer, 1)
+        if power != self._power:
+            self._power = power
+            self.power_text.visible = power is not None
+            if power is not None:
+                self.power_text.text = f"💪 POWER MODE: {power:.1f}s"
+
+        position = (int(position_x), int(position_y))
+        if position != self._position:
+            self._position = position
+            self.position_text.text = f"Position: ({position[0]}, {position[1]})"
+
+    def draw_title(self) -> int:
+        """
+        Draw the title screen labels and the FPS counter.
+
+        Returns:
+            Number of draw calls issued
+        """
+        self.title_batch.draw()
+        self.fps_text.draw()
+        return 2
+
+    def draw(self) -> int:
+        """
+        Draw the in-game labels and the FPS counter.
+
+        Returns:
+            Number of draw calls issued
+        """
+        self.hud_batch.draw()
+        self.fps_text.draw()
+        return 2
@@ -0,0 +1,115 @@
+"""
+Frame-time overlay (toggled with F3).
+Shows rolling p50/p95/p99 per stage and the draw-call count.
+
+Like the HUD, the lines are persistent text objects in one batch; they
+are refreshed a few times per second, not every frame, and only lines
+whose text changed are laid out again.
+"""
+
+from typing import List, Optional
+
+import arcade
+from pyglet.graphics import Batch
+
+from pacman.utils.profiler import STAGES, FrameProfiler
+
+OVERLAY_FONT_SIZE = 11
+OVERLAY_LINE_HEIGHT = 16
+OVERLAY_COLOR = arcade.color.LIGHT_GREEN
+
+# Frames between two refreshes of the numbers
+OVERLAY_REFRESH_FRAMES = 15
+
+
+def format_profiler_lines(profiler: FrameProfiler) -> List[str]:
+    """
+    Build the overlay text.
+
+    Args:
+        profiler: Profiler to show
+
+    Returns:
+        List of text lines (header first)
+    """
+    lines = [f"{'stage':<15}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+    for name in STAGES:
+        p50, p95, p99 = profiler.stage_percentiles(name)
+        lines.append(f"{name:<15}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+
+    draw_calls = profiler.draw_calls[-1] if profiler.draw_calls else 0
+    lines.append(f"draw calls/frame: {draw_calls}")
+    return lines
+
+
+class ProfilerOverlay:
+    """
+    Cached overlay text with its top-right corner at a screen position.
+
+    Attributes:
+        right: Right edge in screen pixels
+        top: Top edge in screen pixels
+        batch: All overlay lines (one draw)
+        lines: One text object per line of format_profiler_lines()
+    """
+
+    def __init__(self, right: float, top: float):
+        """
+        Initialize the overlay (text objects are created by setup()).
+
+        Args:
+            right: Right edge in screen pixels
+            top: Top edge in screen pixels
+        """
+        self.right = right
+        self.top = top
+        self.batch: Optional[Batch] = None
+        self.lines: List[arcade.Text] = []
+        self._refreshed_frame: Optional[int] = None
+
+    def setup(self):
+        """Create the text objects (needs a window)."""
+        self.batch = Batch()
+        self.lines = [
+            arcade.Text(
+                "",
+                self.right,
+                self.top - index * OVERLAY_LINE_HEIGHT,
+                OVERLAY_COLOR,
+                OVERLAY_FONT_SIZE,
+                anchor_x="right",
+                anchor_y="top",
+                font_name="Courier New",
+                batch=self.batch,
+            )
+            for index in range(len(STAGES) + 2)
+        ]
+        self._refreshed_frame = None
+
+    def update(self, profiler: FrameProfiler):
+        """
+        Refresh the numbers if OVERLAY_REFRESH_FRAMES frames have passed.
+
+        Args:
+            profiler: Profiler to show
+        """
+        if (
+            self._refreshed_frame is not None
+            and profiler.frames - self._refreshed_frame < OVERLAY_REFRESH_FRAMES
+        ):
+            return
+        self._refreshed_frame = profiler.frames
+
+        for text, line in zip(self.lines, format_profiler_lines(profiler)):
+            if text.text != line:
+                text.text = line
+
+    def draw(self) -> int:
+        """
+        Draw the overlay.
+
+        Returns:
+            Number of draw calls issued
+        """
+        self.batch.draw()
+        return 1
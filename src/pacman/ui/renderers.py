@@ -0,0 +1,221 @@
+"""
+Arcade renderers for the game entities.
+
+The entity and map modules only hold game state and logic, so they (and
+Simulation, the batch runner, the training environments) import without
+arcade, pyglet or a display. Everything that draws lives here and is
+imported only by the windowed game.
+
+Walls and regular seeds are built per chunk (build_wall_chunk,
+build_seed_chunk) and baked into textures by pacman.ui.static_layer.
+"""
+
+from typing import List, Optional, Tuple
+
+import arcade
+from arcade.shape_list import (
+    ShapeElementList,
+    create_ellipse_filled,
+    create_rectangle_filled,
+)
+
+from pacman.entities.collectibles import SEED_NONE, SEED_SUPER, SeedManager
+from pacman.entities.fox import Fox, FoxManager, FoxState
+from pacman.entities.player import Player
+from pacman.maps.maze import Maze
+from pacman.utils.animation import AnimationClock
+from pacman.utils.constants import (
+    COLOR_FOX_SCARED,
+    COLOR_SEED,
+    COLOR_SUPER_SEED,
+    COLOR_WALL,
+    SEED_RADIUS,
+    SUPER_SEED_RADIUS,
+    TILE_SIZE,
+)
+from pacman.utils.viewport import View, chunk_tiles, is_visible
+
+# Regular seeds are only a few pixels wide, a coarse polygon is enough
+SEED_SEGMENTS = 8
+
+# Pupil offset per direction (0=right, 1=up, 2=left, 3=down)
+_PUPIL_OFFSETS = ((2, 0), (0, 2), (-2, 0), (0, -2))
+
+
+def draw_player(player: Player, alpha: float = 1.0) -> int:
+    """
+    Draw the chicken as a yellow circle (placeholder for sprite).
+
+    Args:
+        player: The chicken
+        alpha: Interpolation between the previous (0.0) and the
+            current (1.0) simulation tick
+
+    Returns:
+        Number of draw calls issued
+    """
+    x, y = player.interpolated_position(alpha)
+    arcade.draw_circle_filled(x, y, player.radius, arcade.color.YELLOW)
+    return 1
+
+
+def draw_fox(fox: Fox, alpha: float = 1.0) -> int:
+    """
+    Draw one fox: body, eyes and pupils looking where it goes.
+
+    Args:
+        fox: The fox
+        alpha: Interpolation between the previous (0.0) and the
+            current (1.0) simulation tick
+
+    Returns:
+        Number of draw calls issued
+    """
+    x, y = fox.interpolated_position(alpha)
+    state = fox.state
+
+    if state == FoxState.EATEN:
+        # Draw as eyes only (white circles)
+        arcade.draw_circle_filled(x - 5, y + 3, 3, arcade.color.WHITE)
+        arcade.draw_circle_filled(x + 5, y + 3, 3, arcade.color.WHITE)
+        return 2
+
+    # Use scared color if frightened, otherwise base color
+    color = COLOR_FOX_SCARED if state == FoxState.FRIGHTENED else fox.base_color
+    arcade.draw_circle_filled(x, y, fox.radius, color)
+
+    arcade.draw_circle_filled(x - 5, y + 3, 3, arcade.color.WHITE)
+    arcade.draw_circle_filled(x + 5, y + 3, 3, arcade.color.WHITE)
+
+    pupil_x, pupil_y = _PUPIL_OFFSETS[fox.direction]
+    arcade.draw_circle_filled(x - 5 + pupil_x, y + 3 + pupil_y, 2, arcade.color.BLACK)
+    arcade.draw_circle_filled(x + 5 + pupil_x, y + 3 + pupil_y, 2, arcade.color.BLACK)
+    return 5
+
+
+def draw_foxes(
+    fox_manager: FoxManager, view: Optional[View] = None, alpha: float = 1.0
+) -> int:
+    """
+    Draw the foxes inside the view.
+
+    Args:
+        fox_manager: Foxes to draw
+        view: Visible world rectangle (left, bottom, right, top);
+            None draws every fox
+        alpha: Interpolation between the previous (0.0) and the
+            current (1.0) simulation tick
+
+    Returns:
+        Number of draw calls issued
+    """
+    draw_calls = 0
+    for fox in fox_manager.foxes:
+        if is_visible(view, fox.center_x, fox.center_y, fox.radius):
+            draw_calls += draw_fox(fox, alpha)
+    return draw_calls
+
+
+def build_wall_chunk(maze: Maze, chunk_x: int, chunk_y: int) -> ShapeElementList:
+    """
+    Build GPU-resident geometry for the walls of one chunk.
+
+    Args:
+        maze: The maze
+        chunk_x: Chunk X index
+        chunk_y: Chunk Y index
+
+    Returns:
+        ShapeElementList with one rectangle per wall tile in the chunk
+    """
+    layer = ShapeElementList()
+    tiles_x, tiles_y = chunk_tiles(chunk_x, chunk_y, maze.width, maze.height)
+    for y in tiles_y:
+        row = maze.grid[y]
+        for x in tiles_x:
+            if row[x] == 1:
+                layer.append(
+                    create_rectangle_filled(
+                        x * TILE_SIZE + TILE_SIZE / 2,
+                        y * TILE_SIZE + TILE_SIZE / 2,
+                        TILE_SIZE,
+                        TILE_SIZE,
+                        COLOR_WALL,
+                    )
+                )
+    return layer
+
+
+def build_seed_chunk(
+    seed_manager: SeedManager, chunk_x: int, chunk_y: int
+) -> Tuple[ShapeElementList, List[Tuple[int, int]]]:
+    """
+    Build render data for the uncollected seeds of one chunk.
+
+    Args:
+        seed_manager: The seeds
+        chunk_x: Chunk X index
+        chunk_y: Chunk Y index
+
+    Returns:
+        Tuple of (regular seed geometry, super seed pixel positions)
+    """
+    field = seed_manager.field
+    layer = ShapeElementList()
+    super_seeds = []
+    tiles_x, tiles_y = chunk_tiles(chunk_x, chunk_y, field.width, field.height)
+    for tile_y in tiles_y:
+        for tile_x in tiles_x:
+            kind = field.kind_at(tile_x, tile_y)
+            if kind == SEED_NONE:
+                continue
+            pixel_x, pixel_y = field.tile_center(tile_x, tile_y)
+            if kind == SEED_SUPER:
+                super_seeds.append((pixel_x, pixel_y))
+            else:
+                layer.append(
+                    create_ellipse_filled(
+                        pixel_x,
+                        pixel_y,
+                        SEED_RADIUS * 2,
+                        SEED_RADIUS * 2,
+                        COLOR_SEED,
+                        num_segments=SEED_SEGMENTS,
+                    )
+                )
+    return layer, super_seeds
+
+
+def draw_super_seeds(
+    seed_manager: SeedManager, clock: AnimationClock, view: Optional[View] = None
+) -> int:
+    """
+    Draw only the (blinking) super seeds inside the view.
+
+    Used on top of a cached static layer that holds the walls and
+    regular seeds.
+
+    Args:
+        seed_manager: The seeds
+        clock: Animation phases of the frame (super seed blink)
+        view: Visible world rectangle (left, bottom, right, top);
+            None draws every super seed
+
+    Returns:
+        Number of draw calls issued
+    """
+    field = seed_manager.field
+    if field is None or not clock.super_seeds_visible:
+        return 0
+
+    draw_calls = 0
+    for tile_x, tile_y in seed_manager.super_seed_tiles:
+        if field.kind_at(tile_x, tile_y) == SEED_NONE:
+            continue
+        pixel_x, pixel_y = field.tile_center(tile_x, tile_y)
+        if is_visible(view, pixel_x, pixel_y, SUPER_SEED_RADIUS):
+            arcade.draw_circle_filled(
+                pixel_x, pixel_y, SUPER_SEED_RADIUS, COLOR_SUPER_SEED
+            )
+            draw_calls += 1
+    return draw_calls
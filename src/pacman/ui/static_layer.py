@@ -0,0 +1,251 @@
+"""
+Render-to-texture static layer.
+
+Walls never move and seeds only disappear, so the walls and regular
+seeds of each chunk are rendered once into an offscreen texture and then
+drawn every frame as a single textured quad. When a seed is collected
+only its tile is cleared in the texture; nothing is re-rendered. Super
+seeds blink, so they are not baked in (see renderers.draw_super_seeds).
+
+Textures are kept for the most recently drawn chunks only, so GPU memory
+stays bounded on large mazes.
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import arcade
+from arcade.gl import BufferDescription
+
+from pacman.entities.collectibles import SeedManager
+from pacman.maps.maze import Maze
+from pacman.ui.renderers import build_seed_chunk, build_wall_chunk
+from pacman.utils.constants import CHUNK_SIZE, STATIC_LAYER_MAX_CHUNKS, TILE_SIZE
+from pacman.utils.viewport import CHUNK_PIXELS, View, tile_chunk, visible_chunks
+
+# Erased tiles become fully transparent (the window background shows)
+_CLEAR_COLOR = (0, 0, 0, 0)
+
+_VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+// Chunk rectangle in world pixels: left, bottom, width, height
+uniform vec4 rect;
+
+in vec2 in_vert;
+out vec2 uv;
+
+void main() {
+    uv = in_vert;
+    vec2 position = rect.xy + in_vert * rect.zw;
+    gl_Position = window.projection * window.view * vec4(position, 0.0, 1.0);
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D layer;
+
+in vec2 uv;
+out vec4 color;
+
+void main() {
+    color = texture(layer, uv);
+}
+"""
+
+
+class StaticLayer:
+    """
+    Cached chunk textures holding the walls and uncollected regular seeds.
+
+    Attributes:
+        maze: Maze whose walls are baked in
+        seed_manager: Seeds baked in (and erased as they are collected)
+        chunks: Framebuffer per (chunk_x, chunk_y), least recently drawn
+            first
+        max_chunks: Number of chunk textures kept
+    """
+
+    def __init__(
+        self,
+        maze: Maze,
+        seed_manager: SeedManager,
+        max_chunks: int = STATIC_LAYER_MAX_CHUNKS,
+    ):
+        """
+        Initialize an empty layer (textures are rendered when first drawn).
+
+        Args:
+            maze: Maze whose walls are baked in
+            seed_manager: Seeds baked in
+            max_chunks: Number of chunk textures kept on the GPU
+        """
+        self.maze = maze
+        self.seed_manager = seed_manager
+        self.max_chunks = max_chunks
+        self.chunks: "OrderedDict[Tuple[int, int], object]" = OrderedDict()
+
+        # Layout the cached textures were rendered from
+        self._maze_revision = maze.revision
+        self._seed_revision = seed_manager.layout_revision
+        # Entries of seed_manager.collected_tiles already erased
+        self._erased = len(seed_manager.collected_tiles)
+
+        # Needs a window, so created in draw()
+        self._program = None
+        self._quad = None
+        self._camera: Optional[arcade.camera.Camera2D] = None
+
+    def _sync(self) -> List[Tuple[int, int]]:
+        """
+        Catch up with changes since the last frame.
+
+        A changed layout (maze edit, seeds laid out again) drops every
+        texture; otherwise the newly collected tiles are returned.
+
+        Returns:
+            Tiles whose seed must be erased from the cached textures
+        """
+        maze_revision = self.maze.revision
+        seed_revision = self.seed_manager.layout_revision
+        collected = self.seed_manager.collected_tiles
+
+        if maze_revision != self._maze_revision or seed_revision != self._seed_revision:
+            self._maze_revision = maze_revision
+            self._seed_revision = seed_revision
+            self.chunks.clear()
+            self._erased = len(collected)
+            return []
+
+        pending = collected[self._erased :]
+        self._erased = len(collected)
+        return pending
+
+    def _create_gl_objects(self):
+        """Create the shader, the unit quad and the offscreen camera."""
+        ctx = arcade.get_window().ctx
+        self._program = ctx.program(
+            vertex_shader=_VERTEX_SHADER, fragment_shader=_FRAGMENT_SHADER
+        )
+        self._program["layer"] = 0
+        self._quad = ctx.geometry(
+            [
+                BufferDescription(
+                    ctx.buffer(data=array("f", [0, 0, 1, 0, 0, 1, 1, 1])),
+                    "2f",
+                    ["in_vert"],
+                )
+            ],
+            mode=ctx.TRIANGLE_STRIP,
+        )
+        self._camera = arcade.camera.Camera2D(
+            viewport=arcade.LBWH(0, 0, CHUNK_PIXELS, CHUNK_PIXELS)
+        )
+
+    def _render_chunk(self, chunk_x: int, chunk_y: int):
+        """
+        Render the walls and regular seeds of one chunk into a new texture.
+
+        Args:
+            chunk_x: Chunk X index
+            chunk_y: Chunk Y index
+
+        Returns:
+            The chunk's framebuffer
+        """
+        ctx = arcade.get_window().ctx
+        texture = ctx.texture((CHUNK_PIXELS, CHUNK_PIXELS), components=4)
+        texture.filter = ctx.NEAREST, ctx.NEAREST
+        framebuffer = ctx.framebuffer(color_attachments=[texture])
+        framebuffer.clear(color=_CLEAR_COLOR)
+
+        camera = self._camera
+        camera.render_target = framebuffer
+        camera.position = (
+            (chunk_x + 0.5) * CHUNK_PIXELS,
+            (chunk_y + 0.5) * CHUNK_PIXELS,
+        )
+        with camera.activate():
+            build_wall_chunk(self.maze, chunk_x, chunk_y).draw()
+            if self.seed_manager.field is not None:
+                seeds, _super_seeds = build_seed_chunk(
+                    self.seed_manager, chunk_x, chunk_y
+                )
+                seeds.draw()
+        return framebuffer
+
+    def _erase_tile(self, tile_x: int, tile_y: int):
+        """
+        Clear one collected seed's tile in its cached chunk texture.
+
+        Args:
+            tile_x: Tile X position
+            tile_y: Tile Y position
+        """
+        framebuffer = self.chunks.get(tile_chunk(tile_x, tile_y))
+        if framebuffer is None:
+            # Not cached; it will be rendered without the seed
+            return
+        framebuffer.clear(
+            color=_CLEAR_COLOR,
+            viewport=(
+                (tile_x % CHUNK_SIZE) * TILE_SIZE,
+                (tile_y % CHUNK_SIZE) * TILE_SIZE,
+                TILE_SIZE,
+                TILE_SIZE,
+            ),
+        )
+
+    def draw(self, view: Optional[View] = None) -> int:
+        """
+        Draw the visible chunks, rendering the missing ones first.
+
+        Must be called with the world camera active.
+
+        Args:
+            view: Visible world rectangle (left, bottom, right, top);
+                None draws the whole maze
+
+        Returns:
+            Number of draw calls issued (one quad per visible chunk)
+        """
+        if self._program is None:
+            self._create_gl_objects()
+
+        for tile_x, tile_y in self._sync():
+            self._erase_tile(tile_x, tile_y)
+
+        chunks = self.chunks
+        program = self._program
+        draw_calls = 0
+        for chunk in visible_chunks(view, self.maze.width, self.maze.height):
+            framebuffer = chunks.get(chunk)
+            if framebuffer is None:
+                framebuffer = self._render_chunk(*chunk)
+                chunks[chunk] = framebuffer
+            else:
+                chunks.move_to_end(chunk)
+
+            framebuffer.color_attachments[0].use(0)
+            program["rect"] = (
+                chunk[0] * CHUNK_PIXELS,
+                chunk[1] * CHUNK_PIXELS,
+                CHUNK_PIXELS,
+                CHUNK_PIXELS,
+            )
+            self._quad.render(program)
+            draw_calls += 1
+
+        # Keep only the most recently drawn chunks on the GPU
+        while len(chunks) > self.max_chunks:
+            chunks.popitem(last=False)
+
+        return draw_calls
@@ -0,0 +1,49 @@
+"""
+Animation clock.
+
+Animations run on game time, not wall-clock time: the game loop samples
+the simulation's time once per frame and every renderer reads the
+phases computed from it. Animations therefore stop whenever the
+simulation does (title screen, pause), look the same in a replay as in
+the recorded game, and can be tested without waiting.
+"""
+
+from pacman.utils.constants import SUPER_SEED_BLINK_RATE
+
+
+class AnimationClock:
+    """
+    Game-time clock with the animation phases of the current frame.
+
+    Attributes:
+        blink_rate: Super seed show/hide switches per second
+        time: Game time of the current frame in seconds
+        super_seeds_visible: Whether super seeds are in the visible half
+            of their blink
+    """
+
+    def __init__(self, blink_rate: float = SUPER_SEED_BLINK_RATE):
+        """
+        Initialize the clock at time zero.
+
+        Args:
+            blink_rate: Super seed show/hide switches per second
+        """
+        self.blink_rate = blink_rate
+        self.time = 0.0
+        self.super_seeds_visible = True
+
+    def update(self, game_time: float):
+        """
+        Move to a new frame and recompute the animation phases.
+
+        Args:
+            game_time: Simulation time of the frame in seconds (ticks
+                simulated times the tick length)
+        """
+        self.time = game_time
+        self.super_seeds_visible = int(game_time * self.blink_rate) % 2 == 0
+
+    def reset(self):
+        """Go back to time zero (e.g. when a new game starts)."""
+        self.update(0.0)
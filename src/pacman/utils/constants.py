@@ -9,11 +9,29 @@ SCREEN_HEIGHT = 900  # Reduced from 1200 to fit screen better
 SCREEN_TITLE = "Chickman - Junior.guru Challenge"
 FPS = 60
 
+# Simulation runs at a fixed rate, independent of the rendering frame rate
+SIMULATION_RATE = 60  # Ticks per second (speeds below are per tick)
+SIMULATION_TICK = 1 / SIMULATION_RATE  # Seconds per tick
+MAX_CATCHUP_STEPS = 5  # Max ticks per frame; slower frames drop time instead
+
 # Game grid settings
 TILE_SIZE = 50  # Increased from 32 to 50 for better sprite visibility
 GRID_WIDTH = SCREEN_WIDTH // TILE_SIZE  # 24 tiles wide
 GRID_HEIGHT = SCREEN_HEIGHT // TILE_SIZE  # 18 tiles tall
 
+# Rendering
+CHUNK_SIZE = 16  # Render chunk edge in tiles (walls/seeds are batched per chunk)
+STATIC_LAYER_MAX_CHUNKS = 24  # Chunk textures kept on the GPU (~2.5 MB each)
+SUPER_SEED_BLINK_RATE = 3  # Super seed show/hide switches per second of game time
+
+# Movement directions (shared by chicken and foxes)
+DIRECTION_RIGHT = 0
+DIRECTION_UP = 1
+DIRECTION_LEFT = 2
+DIRECTION_DOWN = 3
+# (dx, dy) tile step for each direction, indexed by direction
+DIRECTION_VECTORS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
 # Chicken (player) settings
 CHICKEN_SPEED = 5  # Adjusted for larger tiles
 CHICKEN_SIZE = 48  # Increased from 28 to 48 for better visibility
@@ -24,10 +42,17 @@ FOX_SCARED_SPEED = 2.5  # Adjusted for larger tiles
 FOX_SCARED_TIME = 10.0  # seconds
 FOX_SIZE = 48  # Size for fox sprites
 
+# Pathfinding
+# All-pairs distance table is only built for mazes up to this many
+# walkable tiles (memory grows with the square of the tile count)
+PATHFINDING_TABLE_MAX_TILES = 1024
+
 # Game mechanics
 STARTING_LIVES = 3
 SEED_POINTS = 10  # Regular seeds
 SUPER_SEED_POINTS = 50  # Power seeds
+SEED_RADIUS = 3  # Drawn size of regular seeds
+SUPER_SEED_RADIUS = 8  # Drawn size of super seeds
 FOX_POINTS = 200  # Points for catching frightened fox
 BONUS_FRUIT_POINTS = 500
 
@@ -42,8 +67,17 @@ COLOR_FOX_COPPER = (184, 115, 51)  # Brown fox (Copper)
 COLOR_FOX_AMBER = (255, 191, 0)  # Yellow-orange fox (Amber)
 COLOR_FOX_SCARED = (33, 33, 255)  # Blue when scared
 
+# Profiling (see utils/profiler.py)
+PROFILER_WINDOW = 300  # Frames kept for rolling percentiles (5 s at 60 FPS)
+
+# Logging (see utils/event_log.py)
+LOG_LEVEL = "warning"  # Default level; game events are info/debug, so silent
+LOG_BUFFER_SIZE = 4096  # Records buffered before the oldest are dropped
+LOG_FLUSH_INTERVAL = 0.25  # Seconds between background log writes
+
 # Asset paths
 ASSETS_DIR = "src/pacman/assets"
 SPRITES_DIR = f"{ASSETS_DIR}/sprites"
 SOUNDS_DIR = f"{ASSETS_DIR}/sounds"
 MAPS_DIR = f"{ASSETS_DIR}/maps"
+LEVEL_CACHE_DIR = "~/.cache/chickman/levels"  # Compiled TMX levels
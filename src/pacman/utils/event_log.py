@@ -0,0 +1,173 @@
+"""
+Buffered, levelled event logging.
+
+Game modules log through standard `logging` loggers below "chickman"
+(see get_logger). Nothing is printed unless configure_logging() enables a
+level; the handler it installs only appends records to an in-memory ring
+buffer, and a background thread formats and writes them out, so a slow
+terminal or log pipe never stalls a frame.
+"""
+
+import logging
+import os
+import sys
+import threading
+from collections import deque
+from typing import Optional, TextIO
+
+from pacman.utils.constants import LOG_BUFFER_SIZE, LOG_FLUSH_INTERVAL, LOG_LEVEL
+
+LOGGER_NAME = "chickman"
+
+# Environment variable overriding LOG_LEVEL (e.g. CHICKMAN_LOG=debug)
+LOG_LEVEL_ENV = "CHICKMAN_LOG"
+
+_root_logger = logging.getLogger(LOGGER_NAME)
+# Silent until configure_logging() is called (no "no handler" fallback)
+_root_logger.addHandler(logging.NullHandler())
+_root_logger.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get the logger for a game module.
+
+    Args:
+        name: Module name, usually __name__
+
+    Returns:
+        Logger below the "chickman" logger
+    """
+    if name.startswith("pacman."):
+        name = name[len("pacman.") :]
+    return _root_logger.getChild(name)
+
+
+class BufferedHandler(logging.Handler):
+    """
+    Logging handler that never does I/O on the calling thread.
+
+    emit() only appends the record to a bounded deque; a daemon thread
+    formats and writes everything buffered every flush_interval seconds.
+    When the buffer is full the oldest records are dropped (and counted)
+    rather than blocking the game.
+
+    Attributes:
+        stream: Where formatted records are written
+        buffer: Ring buffer of records waiting to be written
+        dropped: Records lost because the buffer was full
+        flush_interval: Seconds between background flushes
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        capacity: int = LOG_BUFFER_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ):
+        """
+        Initialize the handler and start its flush thread.
+
+        Args:
+            stream: Output stream (default: stderr)
+            capacity: Ring buffer size in records
+            flush_interval: Seconds between background flushes
+        """
+        super().__init__()
+        self.stream = stream if stream is not None else sys.stderr
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self.flush_interval = flush_interval
+
+        # Serializes writers (flush thread, explicit flush(), close())
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="chickman-log-flush", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Queue a record (O(1), no formatting, no I/O).
+
+        Args:
+            record: Record to log
+        """
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(record)
+
+    def flush(self):
+        """Format and write every buffered record."""
+        with self._write_lock:
+            lines = []
+            while True:
+                try:
+                    record = self.buffer.popleft()
+                except IndexError:
+                    break
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+
+            if self.dropped:
+                lines.append(f"... {self.dropped} log records dropped (buffer full)")
+                self.dropped = 0
+
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    # Closed pipe or stream - logging must never crash the game
+                    pass
+
+    def _run(self):
+        """Flush thread: write out the buffer until close()."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the flush thread and write whatever is left."""
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+        super().close()
+
+
+def configure_logging(
+    level: Optional[str] = None, stream: Optional[TextIO] = None
+) -> Optional[BufferedHandler]:
+    """
+    Enable game logging at a level.
+
+    Args:
+        level: "debug", "info", "warning", "error" or "off"; defaults to
+            the CHICKMAN_LOG environment variable, then LOG_LEVEL
+        stream: Output stream (default: stderr)
+
+    Returns:
+        The installed BufferedHandler, or None if logging stays off
+    """
+    level = (level or os.environ.get(LOG_LEVEL_ENV) or LOG_LEVEL).upper()
+
+    # Replace a handler from an earlier call
+    for handler in list(_root_logger.handlers):
+        if isinstance(handler, BufferedHandler):
+            _root_logger.removeHandler(handler)
+            handler.close()
+
+    if level == "OFF":
+        _root_logger.setLevel(logging.CRITICAL + 1)
+        return None
+
+    handler = BufferedHandler(stream)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname).1s %(message)s", "%H:%M:%S")
+    )
+    _root_logger.addHandler(handler)
+    _root_logger.setLevel(level)
+    return handler
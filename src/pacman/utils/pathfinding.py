@@ -0,0 +1,326 @@
+"""
+Pathfinding tables for maze navigation.
+Precomputed BFS distances and next hops between walkable tiles.
+"""
+
+from array import array
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+from pacman.utils.constants import DIRECTION_VECTORS
+
+# Distance value for tile pairs with no path between them
+UNREACHABLE = 0xFFFF
+
+# Flow field distance for tiles that can't reach the root (fields are
+# per tile, so paths in big mazes can be longer than 16 bits allow)
+FIELD_UNREACHABLE = 0xFFFFFFFF
+
+# Next-hop value for "no move" (same tile or unreachable target)
+NO_DIRECTION = 0xFF
+
+
+class DistanceTable:
+    """
+    All-pairs shortest paths over the walkable tiles of a maze.
+
+    Walkable tiles get a compact id (0..N-1). The distance and next-hop
+    tables are flat N x N arrays indexed by source_id * N + target_id, so
+    any query is a couple of array lookups.
+
+    Attributes:
+        width: Maze width in tiles
+        height: Maze height in tiles
+        count: Number of walkable tiles (N)
+        tiles: Tile (x, y) for every compact id
+        tile_ids: Compact id per tile (index y * width + x), -1 for walls
+        distances: Shortest path length in tiles (uint16, UNREACHABLE if none)
+        next_hops: First direction to take (0-3, NO_DIRECTION if none)
+    """
+
+    def __init__(self, maze):
+        """
+        Build the tables with one BFS per walkable tile.
+
+        Args:
+            maze: The Maze object (uses its precomputed neighbour masks)
+        """
+        self.width = maze.width
+        self.height = maze.height
+
+        # Assign compact ids to walkable tiles
+        self._tiles: Optional[List[Tuple[int, int]]] = []
+        self.tile_ids = array("i", [-1]) * (self.width * self.height)
+        for y in range(self.height):
+            for x in range(self.width):
+                if not maze.is_wall(x, y):
+                    self.tile_ids[y * self.width + x] = len(self._tiles)
+                    self._tiles.append((x, y))
+
+        count = self.count = len(self._tiles)
+        self.distances = array("H", [UNREACHABLE]) * (count * count)
+        self.next_hops = bytearray([NO_DIRECTION]) * (count * count)
+
+        # Adjacency: for every tile, (neighbour id, direction from the
+        # neighbour back to this tile)
+        adjacency: List[List[Tuple[int, int]]] = []
+        for x, y in self.tiles:
+            links = []
+            mask = maze.open_directions(x, y)
+            for direction, (dx, dy) in enumerate(DIRECTION_VECTORS):
+                if mask & (1 << direction):
+                    neighbour_id = self.tile_ids[(y + dy) * self.width + x + dx]
+                    links.append((neighbour_id, (direction + 2) % 4))
+            adjacency.append(links)
+
+        # The grid is undirected, so a BFS rooted at the target gives every
+        # source's distance to it and the step that leads one tile closer
+        for target in range(count):
+            self._bfs_to(target, count, adjacency)
+
+    @classmethod
+    def from_planes(
+        cls,
+        width: int,
+        height: int,
+        count: int,
+        tile_ids: Sequence[int],
+        distances: Sequence[int],
+        next_hops: Sequence[int],
+    ) -> "DistanceTable":
+        """
+        Wrap tables built earlier (e.g. views into a compiled level file).
+
+        Nothing is copied or searched; the planes are used as given.
+
+        Args:
+            width: Maze width in tiles
+            height: Maze height in tiles
+            count: Number of walkable tiles (N)
+            tile_ids: Compact id per tile (int32), -1 for walls
+            distances: N x N distances (uint16)
+            next_hops: N x N next hops (uint8)
+
+        Returns:
+            The DistanceTable
+        """
+        table = cls.__new__(cls)
+        table.width = width
+        table.height = height
+        table.tile_ids = tile_ids
+        table.distances = distances
+        table.next_hops = next_hops
+        table.count = count
+        table._tiles = None
+        return table
+
+    @property
+    def tiles(self) -> List[Tuple[int, int]]:
+        """Tile (x, y) for every compact id (listed on first use)."""
+        if self._tiles is None:
+            width = self.width
+            self._tiles = [
+                (index % width, index // width)
+                for index, tile_id in enumerate(self.tile_ids)
+                if tile_id >= 0
+            ]
+        return self._tiles
+
+    def _bfs_to(self, target: int, count: int, adjacency: List[List[Tuple[int, int]]]):
+        """
+        Fill the table column for one target tile.
+
+        Args:
+            target: Compact id of the target tile
+            count: Number of walkable tiles
+            adjacency: Neighbour lists built in __init__
+        """
+        distances = self.distances
+        next_hops = self.next_hops
+
+        distances[target * count + target] = 0
+        queue = deque([target])
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current * count + target] + 1
+            for neighbour, direction_back in adjacency[current]:
+                cell = neighbour * count + target
+                if distances[cell] == UNREACHABLE:
+                    distances[cell] = next_distance
+                    next_hops[cell] = direction_back
+                    queue.append(neighbour)
+
+    def tile_id(self, tile_x: int, tile_y: int) -> int:
+        """
+        Get the compact id of a tile.
+
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+
+        Returns:
+            Compact id, or -1 for walls and out-of-bounds tiles
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return -1
+        return self.tile_ids[tile_y * self.width + tile_x]
+
+    def distance(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[int]:
+        """
+        Get the shortest path length between two tiles.
+
+        Args:
+            start: Start tile (x, y)
+            goal: Goal tile (x, y)
+
+        Returns:
+            Number of steps, or None if either tile is a wall or no path exists
+        """
+        start_id = self.tile_id(*start)
+        goal_id = self.tile_id(*goal)
+        if start_id < 0 or goal_id < 0:
+            return None
+
+        distance = self.distances[start_id * self.count + goal_id]
+        return None if distance == UNREACHABLE else distance
+
+    def next_direction(
+        self, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Optional[int]:
+        """
+        Get the first step of a shortest path.
+
+        Args:
+            start: Start tile (x, y)
+            goal: Goal tile (x, y)
+
+        Returns:
+            Direction (0=right, 1=up, 2=left, 3=down), or None if already
+            at the goal or the goal is unreachable
+        """
+        start_id = self.tile_id(*start)
+        goal_id = self.tile_id(*goal)
+        if start_id < 0 or goal_id < 0:
+            return None
+
+        direction = self.next_hops[start_id * self.count + goal_id]
+        return None if direction == NO_DIRECTION else direction
+
+
+class FlowField:
+    """
+    BFS distances from every tile to one root tile.
+
+    One field answers "which way to the root" (chase) and "which way away
+    from the root" (flee) for any number of agents, so foxes sharing a
+    target share a single search.
+
+    Attributes:
+        width: Maze width in tiles
+        height: Maze height in tiles
+        root: Root tile (x, y)
+        revision: Maze revision the field was built from
+        distances: Steps to the root per tile (index y * width + x),
+            FIELD_UNREACHABLE for walls and disconnected tiles
+        toward: Direction one step closer to the root per tile
+            (NO_DIRECTION at the root and on unreachable tiles)
+    """
+
+    def __init__(self, maze, root_x: int, root_y: int):
+        """
+        Run a BFS from the root tile.
+
+        Args:
+            maze: The Maze object (uses its precomputed neighbour masks)
+            root_x: Root tile X
+            root_y: Root tile Y
+        """
+        self.width = maze.width
+        self.height = maze.height
+        self.root = (root_x, root_y)
+        self.revision = maze.revision
+
+        size = self.width * self.height
+        self.distances = array("I", [FIELD_UNREACHABLE]) * size
+        self.toward = bytearray([NO_DIRECTION]) * size
+
+        if maze.is_wall(root_x, root_y):
+            return
+
+        width = self.width
+        distances = self.distances
+        toward = self.toward
+        # Index offset for each direction
+        offsets = [dx + dy * width for dx, dy in DIRECTION_VECTORS]
+
+        root_index = root_y * width + root_x
+        distances[root_index] = 0
+        queue = deque([root_index])
+        while queue:
+            current = queue.popleft()
+            next_distance = distances[current] + 1
+            mask = maze.neighbours[current]
+            for direction in range(4):
+                if mask & (1 << direction):
+                    neighbour = current + offsets[direction]
+                    if distances[neighbour] == FIELD_UNREACHABLE:
+                        distances[neighbour] = next_distance
+                        # Going the opposite way leads back towards the root
+                        toward[neighbour] = (direction + 2) % 4
+                        queue.append(neighbour)
+
+    def distance(self, tile_x: int, tile_y: int) -> Optional[int]:
+        """
+        Get the number of steps from a tile to the root.
+
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+
+        Returns:
+            Number of steps, or None if the root can't be reached
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return None
+        distance = self.distances[tile_y * self.width + tile_x]
+        return None if distance == FIELD_UNREACHABLE else distance
+
+    def chase_direction(self, tile_x: int, tile_y: int) -> Optional[int]:
+        """
+        Get the direction that moves one step closer to the root.
+
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+
+        Returns:
+            Direction (0-3), or None at the root or if it can't be reached
+        """
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return None
+        direction = self.toward[tile_y * self.width + tile_x]
+        return None if direction == NO_DIRECTION else direction
+
+    def flee_direction(self, tile_x: int, tile_y: int) -> Optional[int]:
+        """
+        Get the direction towards the neighbour furthest from the root.
+
+        Args:
+            tile_x: X position in tiles
+            tile_y: Y position in tiles
+
+        Returns:
+            Direction (0-3), or None if the tile can't reach the root
+            (nothing to flee from) or has no open neighbour
+        """
+        if self.distance(tile_x, tile_y) is None:
+            return None
+
+        best_direction = None
+        best_distance = -1
+        for direction, (dx, dy) in enumerate(DIRECTION_VECTORS):
+            distance = self.distance(tile_x + dx, tile_y + dy)
+            if distance is not None and distance > best_distance:
+                best_direction = direction
+                best_distance = distance
+        return best_direction
@@ -0,0 +1,242 @@
+"""
+Per-stage frame profiler.
+
+Stages (maze draw, fox update, ...) are timed with `with profiler.stage(name):`
+and summed per frame; end_frame() pushes the frame's totals into rolling
+windows, from which p50/p95/p99 are computed for the overlay and the JSON
+dump. NULL_PROFILER has the same interface and does nothing, so code can
+always call the profiler without checking whether profiling is on.
+"""
+
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+from pacman.utils.constants import PROFILER_WINDOW
+
+# Stages timed by the game, in overlay order
+STAGE_MAZE_DRAW = "maze_draw"
+STAGE_SEED_DRAW = "seed_draw"
+STAGE_FOX_DRAW = "fox_draw"
+STAGE_PLAYER_UPDATE = "player_update"
+STAGE_FOX_UPDATE = "fox_update"
+STAGE_SEED_COLLISION = "seed_collision"
+STAGE_HUD_TEXT = "hud_text"
+STAGES = (
+    STAGE_MAZE_DRAW,
+    STAGE_SEED_DRAW,
+    STAGE_FOX_DRAW,
+    STAGE_PLAYER_UPDATE,
+    STAGE_FOX_UPDATE,
+    STAGE_SEED_COLLISION,
+    STAGE_HUD_TEXT,
+)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values: Values in ascending order (not empty)
+        fraction: Percentile as a fraction (0.95 = p95)
+
+    Returns:
+        The percentile value
+    """
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class _StageTimer:
+    """Reusable context manager adding its elapsed time to one stage."""
+
+    __slots__ = ("_totals", "_name", "_start")
+
+    def __init__(self, totals: Dict[str, float], name: str):
+        self._totals = totals
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        self._totals[self._name] = self._totals.get(self._name, 0.0) + elapsed
+        return False
+
+
+class _NullStage:
+    """Context manager that does nothing (used by NullProfiler)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FrameProfiler:
+    """
+    Rolling per-stage frame timings and draw-call counts.
+
+    Attributes:
+        window: Number of frames kept for the percentiles
+        samples: Per-stage rolling frame totals in seconds (only frames
+            in which the stage ran)
+        draw_calls: Rolling draw-call count per frame
+        frames: Frames recorded since creation
+    """
+
+    enabled = True
+
+    def __init__(self, window: int = PROFILER_WINDOW):
+        """
+        Initialize the profiler.
+
+        Args:
+            window: Number of frames kept for the percentiles
+        """
+        self.window = window
+        self.samples: Dict[str, Deque[float]] = {}
+        self.draw_calls: Deque[int] = deque(maxlen=window)
+        self.frames = 0
+
+        # Totals of the frame in progress
+        self._frame_totals: Dict[str, float] = {}
+        self._frame_draw_calls = 0
+        self._timers: Dict[str, _StageTimer] = {}
+
+    def stage(self, name: str) -> _StageTimer:
+        """
+        Get a context manager timing one stage.
+
+        Args:
+            name: Stage name (see STAGES)
+
+        Returns:
+            Context manager adding its run time to the current frame
+        """
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = _StageTimer(self._frame_totals, name)
+            self._timers[name] = timer
+        return timer
+
+    def count_draw_calls(self, count: int):
+        """
+        Add draw calls to the current frame.
+
+        Args:
+            count: Number of draw calls issued
+        """
+        self._frame_draw_calls += count
+
+    def end_frame(self):
+        """Close the current frame and add its totals to the windows."""
+        for name, total in self._frame_totals.items():
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self.samples[name] = samples
+            samples.append(total)
+        self._frame_totals.clear()
+
+        self.draw_calls.append(self._frame_draw_calls)
+        self._frame_draw_calls = 0
+        self.frames += 1
+
+    def stage_percentiles(self, name: str) -> Tuple[float, float, float]:
+        """
+        Get p50/p95/p99 of one stage.
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Tuple of (p50, p95, p99) in milliseconds (zeros if no samples)
+        """
+        samples = self.samples.get(name)
+        if not samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        return (
+            percentile(ordered, 0.50) * 1000,
+            percentile(ordered, 0.95) * 1000,
+            percentile(ordered, 0.99) * 1000,
+        )
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Get all statistics as plain data.
+
+        Returns:
+            Dictionary with per-stage p50/p95/p99/mean (ms), draw-call
+            statistics and the frame count
+        """
+        stages = {}
+        for name in list(STAGES) + sorted(set(self.samples) - set(STAGES)):
+            samples = self.samples.get(name)
+            if not samples:
+                continue
+            p50, p95, p99 = self.stage_percentiles(name)
+            stages[name] = {
+                "p50_ms": round(p50, 4),
+                "p95_ms": round(p95, 4),
+                "p99_ms": round(p99, 4),
+                "mean_ms": round(sum(samples) / len(samples) * 1000, 4),
+                "samples": len(samples),
+            }
+
+        draw_calls = {}
+        if self.draw_calls:
+            ordered = sorted(self.draw_calls)
+            draw_calls = {
+                "p50": percentile(ordered, 0.50),
+                "p95": percentile(ordered, 0.95),
+                "max": ordered[-1],
+                "last": self.draw_calls[-1],
+            }
+
+        return {
+            "frames": self.frames,
+            "window": self.window,
+            "stages": stages,
+            "draw_calls": draw_calls,
+        }
+
+    def dump_json(self, path: str):
+        """
+        Write summary() to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump(self.summary(), json_file, indent=2)
+
+
+class NullProfiler:
+    """Profiler stand-in that records nothing."""
+
+    enabled = False
+
+    _NULL_STAGE = _NullStage()
+
+    def stage(self, name: str) -> _NullStage:
+        """Get a context manager that does nothing."""
+        return self._NULL_STAGE
+
+    def count_draw_calls(self, count: int):
+        """Ignore draw calls."""
+
+    def end_frame(self):
+        """Ignore the frame end."""
+
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,79 @@
+"""
+Fixed timestep accumulator.
+Turns variable frame times into a whole number of fixed simulation ticks.
+"""
+
+from pacman.utils.constants import MAX_CATCHUP_STEPS, SIMULATION_TICK
+
+# Frame times summed in floating point drift by a few ulps; without this
+# slack e.g. 144 frames of 1/144 s would give 59 ticks instead of 60
+_EPSILON = 1e-9
+
+
+class FixedTimestep:
+    """
+    Accumulates frame time and hands it out as fixed-size ticks.
+
+    Rendering draws between the last two simulated states using alpha,
+    so motion stays smooth whether the window renders faster or slower
+    than the simulation rate.
+
+    Attributes:
+        step: Tick length in seconds
+        max_steps: Most ticks run for a single frame
+        accumulator: Frame time not yet simulated (always < step after advance)
+        dropped_time: Total time discarded because a frame hit max_steps
+    """
+
+    def __init__(
+        self, step: float = SIMULATION_TICK, max_steps: int = MAX_CATCHUP_STEPS
+    ):
+        """
+        Initialize the timestep.
+
+        Args:
+            step: Tick length in seconds
+            max_steps: Most ticks run for a single frame (stops a slow
+                frame from causing even slower frames)
+        """
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Add frame time and get the number of ticks to simulate.
+
+        Args:
+            elapsed: Time since the previous frame in seconds
+
+        Returns:
+            Number of ticks to run this frame (0 to max_steps)
+        """
+        self.accumulator += elapsed
+        due = int((self.accumulator + _EPSILON) // self.step)
+        self.accumulator = max(0.0, self.accumulator - due * self.step)
+
+        steps = due
+        if steps > self.max_steps:
+            # Too far behind - run what we can and let the game slow down
+            # instead of spiralling
+            self.dropped_time += (steps - self.max_steps) * self.step
+            steps = self.max_steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """
+        How far rendering is between the previous and the current tick.
+
+        Returns:
+            Interpolation factor from 0.0 (previous state) to 1.0 (current)
+        """
+        return self.accumulator / self.step
+
+    def reset(self):
+        """Forget any accumulated time (e.g. after a pause or restart)."""
+        self.accumulator = 0.0
+        self.dropped_time = 0.0
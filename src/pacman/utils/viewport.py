@@ -0,0 +1,107 @@
+"""
+Viewport and render chunk helpers.
+
+Large mazes are split into square chunks of CHUNK_SIZE x CHUNK_SIZE tiles.
+Render data (wall and seed geometry) is built per chunk, and only chunks
+that intersect the camera view are drawn, so frame time depends on the
+window size and not on the maze size.
+
+A view is a (left, bottom, right, top) rectangle in world pixels.
+"""
+
+from typing import Iterator, Optional, Tuple
+
+from pacman.utils.constants import CHUNK_SIZE, TILE_SIZE
+
+View = Tuple[float, float, float, float]
+
+# Chunk edge length in pixels
+CHUNK_PIXELS = CHUNK_SIZE * TILE_SIZE
+
+
+def tile_chunk(tile_x: int, tile_y: int) -> Tuple[int, int]:
+    """
+    Get the chunk a tile belongs to.
+
+    Args:
+        tile_x: X position in tiles
+        tile_y: Y position in tiles
+
+    Returns:
+        Tuple of (chunk_x, chunk_y)
+    """
+    return tile_x // CHUNK_SIZE, tile_y // CHUNK_SIZE
+
+
+def chunk_tiles(
+    chunk_x: int, chunk_y: int, width: int, height: int
+) -> Tuple[range, range]:
+    """
+    Get the tile ranges covered by a chunk, clipped to the maze.
+
+    Args:
+        chunk_x: Chunk X index
+        chunk_y: Chunk Y index
+        width: Maze width in tiles
+        height: Maze height in tiles
+
+    Returns:
+        Tuple of (x range, y range) in tiles
+    """
+    start_x = chunk_x * CHUNK_SIZE
+    start_y = chunk_y * CHUNK_SIZE
+    return (
+        range(start_x, min(start_x + CHUNK_SIZE, width)),
+        range(start_y, min(start_y + CHUNK_SIZE, height)),
+    )
+
+
+def visible_chunks(
+    view: Optional[View], width: int, height: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    Iterate over the chunks of a maze that intersect a view.
+
+    Args:
+        view: Visible world rectangle (None = the whole maze)
+        width: Maze width in tiles
+        height: Maze height in tiles
+
+    Yields:
+        (chunk_x, chunk_y) tuples
+    """
+    chunks_x = (width + CHUNK_SIZE - 1) // CHUNK_SIZE
+    chunks_y = (height + CHUNK_SIZE - 1) // CHUNK_SIZE
+
+    if view is None:
+        first_x, last_x = 0, chunks_x - 1
+        first_y, last_y = 0, chunks_y - 1
+    else:
+        left, bottom, right, top = view
+        first_x = max(0, int(left // CHUNK_PIXELS))
+        last_x = min(chunks_x - 1, int(right // CHUNK_PIXELS))
+        first_y = max(0, int(bottom // CHUNK_PIXELS))
+        last_y = min(chunks_y - 1, int(top // CHUNK_PIXELS))
+
+    for chunk_y in range(first_y, last_y + 1):
+        for chunk_x in range(first_x, last_x + 1):
+            yield chunk_x, chunk_y
+
+
+def is_visible(view: Optional[View], x: float, y: float, margin: float = 0) -> bool:
+    """
+    Check if a point (grown by a margin) is inside a view.
+
+    Args:
+        view: Visible world rectangle (None = everything is visible)
+        x: X position in pixels
+        y: Y position in pixels
+        margin: Extra distance around the point (e.g. sprite half size)
+
+    Returns:
+        True if the point is at least partly visible
+    """
+    if view is None:
+        return True
+    left, bottom, right, top = view
+    return left - margin <= x <= right + margin and bottom - margin <= y <= top + margin
@@ -0,0 +1,454 @@
+"""
+Vectorized training environment.
+
+Steps K independent games of one maze together, for bots and
+reinforcement learning. Every piece of game state (chicken and fox
+positions, directions, fox states, seed bitmasks, score, power mode) is a
+NumPy array with one row per game, and step() advances all games with a
+few array operations instead of one Simulation.step() per game.
+
+The maze, the seed layout, the spawn points and the fox home corners are
+taken from a regular Simulation, and so are the rules:
+    - The foxes of every game live in one ActorStore (game-major, K * F
+      actors) and move with its kernels, each fox chasing or fleeing the
+      chicken of its own game through the maze's DistanceTable.
+    - The chicken moves like Player.update(): a buffered turn is taken
+      as soon as the chicken's outline fits, walls stop it, letting go of
+      the keys stops it.
+    - Seeds, fox catches, eating frightened foxes and power mode work as
+      in Simulation.step().
+A one-game env therefore plays exactly the game a Simulation with the
+same seed plays for the same inputs. With more games the foxes' random
+turns share one random stream, so only the rules are the same.
+
+Actions are directions (0=right, 1=up, 2=left, 3=down) or NO_ACTION
+(let go of the keys, the chicken stops). The maze needs a pathfinding
+table (at most PATHFINDING_TABLE_MAX_TILES walkable tiles).
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from pacman.entities.actors import CHASE, EATEN, FRIGHTENED, ActorStore
+from pacman.entities.collectibles import SEED_SUPER
+from pacman.entities.player import PROBE_DIRECTIONS
+from pacman.maps.level_loader import Level
+from pacman.maps.maze import Maze
+from pacman.simulation import Simulation
+from pacman.utils.constants import (
+    DIRECTION_VECTORS,
+    FOX_POINTS,
+    FOX_SCARED_TIME,
+    SEED_POINTS,
+    SIMULATION_TICK,
+    SUPER_SEED_POINTS,
+    TILE_SIZE,
+)
+
+DEFAULT_MAX_TICKS = 60 * 60 * 3  # Episodes are cut off after three minutes
+
+# Action meaning "no key held" (also marks "no buffered turn")
+NO_ACTION = 4
+
+# Observation row: chicken x, y (in tiles), direction, moving, power time
+# left, seeds left; then x, y, state for every fox
+CHICKEN_FEATURES = 6
+FOX_FEATURES = 3
+
+_DX = np.array([dx for dx, _dy in DIRECTION_VECTORS], dtype=np.int64)
+_DY = np.array([dy for _dx, dy in DIRECTION_VECTORS], dtype=np.int64)
+
+# Points per seed kind (SEED_NONE, SEED_REGULAR, SEED_SUPER)
+_KIND_POINTS = np.array([0, SEED_POINTS, SUPER_SEED_POINTS], dtype=np.int32)
+
+
+class VectorEnv:
+    """
+    K games of the same maze, stepped together.
+
+    All per-game state is public and may be read (or, for testing and
+    curriculum tricks, written) directly.
+
+    Attributes:
+        num_envs: Number of games (K)
+        num_foxes: Foxes per game (F)
+        maze: The shared Maze
+        max_ticks: Episode length limit (episodes are truncated after it)
+        end_on_catch: End an episode when a fox catches the chicken
+        foxes: ActorStore with the foxes of every game (fox f of game g
+            is actor g * F + f)
+        chicken_x, chicken_y: Chicken centre in pixels (K,)
+        chicken_change_x, chicken_change_y: Chicken velocity in pixels
+            per tick (K,)
+        chicken_direction: Chicken direction (K,)
+        chicken_next_direction: Buffered turn, NO_ACTION if none (K,)
+        fox_x, fox_y: Fox centres in pixels, views of the store (K, F)
+        fox_state: Fox state codes, a view of foxes.state (K, F)
+        seed_bits: Uncollected seeds, one SeedField.present bitmask per
+            game (K, bytes)
+        seeds_left: Uncollected seeds and super seeds (K,)
+        score: Score (K,)
+        power_timer: Power mode time left in seconds, 0 = off (K,)
+        tick: Ticks since the game's last reset (K,)
+        fox_catches: Catches this episode, one per contact (K,)
+        foxes_eaten: Frightened foxes eaten this episode (K,)
+        observations: Observation buffer returned by reset() and step(),
+            overwritten on every call (K, CHICKEN_FEATURES + F * FOX_FEATURES)
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        maze: Optional[Maze] = None,
+        level: Optional[Level] = None,
+        seed: Optional[int] = None,
+        max_ticks: int = DEFAULT_MAX_TICKS,
+        end_on_catch: bool = True,
+    ):
+        """
+        Initialize the games (all of them start reset).
+
+        Args:
+            num_envs: Number of games stepped together
+            maze: Maze to play in (defaults to the built-in maze)
+            level: Loaded level with spawn points (overrides maze)
+            seed: Session seed, as for Simulation (defaults to a random one)
+            max_ticks: Episode length limit in ticks
+            end_on_catch: End an episode on the first fox catch
+
+        Raises:
+            ValueError: If the maze is too big for a pathfinding table
+        """
+        # One regular game provides the layout every copy starts from
+        template = Simulation(maze=maze, level=level, seed=seed)
+        self.maze = template.maze
+        if self.maze.distance_table is None:
+            raise ValueError(
+                f"{self.maze.width}x{self.maze.height} maze has too many walkable "
+                "tiles for a pathfinding table"
+            )
+
+        self.num_envs = num_envs
+        self.max_ticks = max_ticks
+        self.end_on_catch = end_on_catch
+
+        width, height = self.maze.width, self.maze.height
+        self._width = width
+        walls = np.frombuffer(self.maze.neighbours, dtype=np.uint8) == 0
+        # One tile of wall around the maze, so outline points stay inside
+        self._padded_walls = np.pad(
+            walls.reshape(height, width), 1, constant_values=True
+        ).ravel()
+
+        player = template.player
+        self._spawn = (player.center_x, player.center_y)
+        self._chicken_speed = player.speed
+        self._chicken_radius = player.radius
+        # Outline point offsets, shifted by one tile into padded grid
+        # coordinates, which are never negative
+        self._probe_x = (
+            np.array([[player.radius * cos] for cos, _sin in PROBE_DIRECTIONS])
+            + TILE_SIZE
+        )
+        self._probe_y = (
+            np.array([[player.radius * sin] for _cos, sin in PROBE_DIRECTIONS])
+            + TILE_SIZE
+        )
+        self._max_x = width * TILE_SIZE - player.radius
+        self._max_y = height * TILE_SIZE - player.radius
+
+        field = template.seed_manager.field
+        self._kinds = np.frombuffer(bytes(field.kinds), dtype=np.uint8)
+        self._initial_bits = np.frombuffer(bytes(field.present), dtype=np.uint8)
+        self._initial_seeds = field.count()
+
+        # The template's foxes, copied once per game; their random source
+        # is the one a Simulation with this seed would use
+        store = template.fox_manager.store
+        self.num_foxes = store.count
+        self.foxes = ActorStore(
+            np.tile(store.spawn_x, num_envs),
+            np.tile(store.spawn_y, num_envs),
+            store.rng,
+            radius=store.radius,
+        )
+        self.foxes.scatter_x[:] = np.tile(store.scatter_x, num_envs)
+        self.foxes.scatter_y[:] = np.tile(store.scatter_y, num_envs)
+
+        shape = (num_envs, self.num_foxes)
+        self.fox_x = self.foxes.x.reshape(shape)
+        self.fox_y = self.foxes.y.reshape(shape)
+        self.fox_state = self.foxes.state.reshape(shape)
+
+        self.chicken_x = np.zeros(num_envs)
+        self.chicken_y = np.zeros(num_envs)
+        self.chicken_change_x = np.zeros(num_envs)
+        self.chicken_change_y = np.zeros(num_envs)
+        self.chicken_direction = np.zeros(num_envs, dtype=np.int8)
+        self.chicken_next_direction = np.zeros(num_envs, dtype=np.int8)
+        self.seed_bits = np.zeros((num_envs, len(self._initial_bits)), dtype=np.uint8)
+        self.seeds_left = np.zeros(num_envs, dtype=np.int32)
+        self.score = np.zeros(num_envs, dtype=np.int32)
+        self.power_timer = np.zeros(num_envs)
+        self.tick = np.zeros(num_envs, dtype=np.int32)
+        self.fox_catches = np.zeros(num_envs, dtype=np.int32)
+        self.foxes_eaten = np.zeros(num_envs, dtype=np.int32)
+        self._held = np.zeros(num_envs, dtype=np.int8)
+        self._catching = np.zeros(shape, dtype=bool)
+
+        self.observations = np.zeros(
+            (num_envs, CHICKEN_FEATURES + self.num_foxes * FOX_FEATURES),
+            dtype=np.float32,
+        )
+        # Per-fox view of the observation columns after the chicken's
+        self._fox_observations = self.observations[:, CHICKEN_FEATURES:].reshape(
+            num_envs, self.num_foxes, FOX_FEATURES
+        )
+        self._envs = np.arange(num_envs)
+
+        self.reset()
+
+    def reset(self, env_ids=None) -> np.ndarray:
+        """
+        Start new episodes.
+
+        Args:
+            env_ids: Indices (or a boolean mask) of the games to reset;
+                None resets all of them
+
+        Returns:
+            The observation buffer
+        """
+        games = np.zeros(self.num_envs, dtype=bool)
+        games[slice(None) if env_ids is None else env_ids] = True
+        self.chicken_x[games] = self._spawn[0]
+        self.chicken_y[games] = self._spawn[1]
+        self.chicken_change_x[games] = 0
+        self.chicken_change_y[games] = 0
+        self.chicken_direction[games] = 0
+        self.chicken_next_direction[games] = NO_ACTION
+        self._held[games] = NO_ACTION
+        self.foxes.respawn(np.repeat(games, self.num_foxes))
+        self.seed_bits[games] = self._initial_bits
+        self.seeds_left[games] = self._initial_seeds
+        self.score[games] = 0
+        self.power_timer[games] = 0
+        self.tick[games] = 0
+        self.fox_catches[games] = 0
+        self.foxes_eaten[games] = 0
+        self._catching[games] = False
+        return self._observe()
+
+    def step(
+        self, actions
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Advance every game by one tick, in Simulation.step() order.
+
+        Finished games are reset before returning (their observation is
+        the first one of the new episode); infos holds the final score
+        and length of every game, valid where an episode ended.
+
+        Args:
+            actions: Direction held per game (0-3, or NO_ACTION)
+
+        Returns:
+            Tuple of (observations, rewards, terminated, truncated, infos)
+        """
+        actions = np.asarray(actions, dtype=np.int8)
+        score_before = self.score.copy()
+        self.tick += 1
+
+        self._apply_actions(actions)
+
+        # Power mode runs out before anything moves
+        powered = self.power_timer > 0
+        self.power_timer[powered] -= SIMULATION_TICK
+        ended = powered & (self.power_timer <= 0)
+        if ended.any():
+            self.power_timer[ended] = 0
+            calmed = np.repeat(ended, self.num_foxes) & (self.foxes.state == FRIGHTENED)
+            self.foxes.set_state(calmed, CHASE)
+
+        self._move_chicken()
+        self.foxes.update(
+            self.maze,
+            np.repeat(self.chicken_x, self.num_foxes),
+            np.repeat(self.chicken_y, self.num_foxes),
+        )
+        caught = self._fox_collisions()
+        self._collect_seeds()
+
+        rewards = (self.score - score_before).astype(np.float32)
+        terminated = self.seeds_left == 0
+        if self.end_on_catch:
+            terminated |= caught
+        truncated = ~terminated & (self.tick >= self.max_ticks)
+
+        infos = {"score": self.score.copy(), "ticks": self.tick.copy()}
+        done = terminated | truncated
+        if done.any():
+            self.reset(done)
+        else:
+            self._observe()
+        return self.observations, rewards, terminated, truncated, infos
+
+    def _apply_actions(self, actions: np.ndarray):
+        """
+        Turn changes of the held direction into movement requests.
+
+        Like Simulation._apply_inputs() and the Player.move_*() methods:
+        letting go stops the chicken, a stopped chicken starts right
+        away, a moving one buffers the turn.
+
+        Args:
+            actions: Direction held per game (0-3, or NO_ACTION)
+        """
+        changed = actions != self._held
+        if not changed.any():
+            return
+        self._held[changed] = actions[changed]
+
+        released = changed & (actions == NO_ACTION)
+        self.chicken_change_x[released] = 0
+        self.chicken_change_y[released] = 0
+
+        pressed = changed & (actions != NO_ACTION)
+        stopped = (self.chicken_change_x == 0) & (self.chicken_change_y == 0)
+        start = pressed & stopped
+        direction = actions[start]
+        self.chicken_change_x[start] = _DX[direction] * self._chicken_speed
+        self.chicken_change_y[start] = _DY[direction] * self._chicken_speed
+        self.chicken_direction[start] = direction
+        buffered = pressed & ~stopped
+        self.chicken_next_direction[buffered] = actions[buffered]
+
+    def _chicken_fits(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Check the chicken's outline points at new positions against walls.
+
+        Args:
+            x: Chicken centre X per game
+            y: Chicken centre Y per game
+
+        Returns:
+            True where no outline point is inside a wall
+        """
+        # Points are never negative, so truncating is flooring (and much
+        # faster than // on floats)
+        tile_x = ((x + self._probe_x) / TILE_SIZE).astype(np.int64)
+        tile_y = ((y + self._probe_y) / TILE_SIZE).astype(np.int64)
+        return ~self._padded_walls[tile_y * (self._width + 2) + tile_x].any(axis=0)
+
+    def _move_chicken(self):
+        """Move every chicken, as Player.update() does."""
+        x, y = self.chicken_x, self.chicken_y
+        change_x, change_y = self.chicken_change_x, self.chicken_change_y
+
+        # Take buffered turns where the chicken fits
+        games = np.flatnonzero(self.chicken_next_direction != NO_ACTION)
+        if len(games):
+            direction = self.chicken_next_direction[games]
+            turn_x = _DX[direction] * self._chicken_speed
+            turn_y = _DY[direction] * self._chicken_speed
+            fits = self._chicken_fits(x[games] + turn_x, y[games] + turn_y)
+            games = games[fits]
+            change_x[games] = turn_x[fits]
+            change_y[games] = turn_y[fits]
+            self.chicken_direction[games] = direction[fits]
+            self.chicken_next_direction[games] = NO_ACTION
+
+        new_x = x + change_x
+        new_y = y + change_y
+        fits = self._chicken_fits(new_x, new_y)
+        np.copyto(x, new_x, where=fits)
+        np.copyto(y, new_y, where=fits)
+
+        # Keep the chicken inside the maze
+        radius = self._chicken_radius
+        np.clip(x, radius, self._max_x, out=x)
+        np.clip(y, radius, self._max_y, out=y)
+
+    def _fox_collisions(self) -> np.ndarray:
+        """
+        Eat frightened foxes and count catches by the others.
+
+        Returns:
+            Games in which a fox caught the chicken this tick (K,)
+        """
+        dx = self.fox_x - self.chicken_x[:, None]
+        dy = self.fox_y - self.chicken_y[:, None]
+        reach = self.foxes.radius + self._chicken_radius
+        touching = dx * dx + dy * dy < reach * reach
+
+        state = self.fox_state
+        eaten = touching & (state == FRIGHTENED)
+        if eaten.any():
+            self.foxes.set_state(eaten.ravel(), EATEN)
+            eaten_count = eaten.sum(axis=1)
+            self.score += eaten_count * FOX_POINTS
+            self.foxes_eaten += eaten_count
+
+        catching = touching & (state != FRIGHTENED) & (state != EATEN)
+        new_catches = catching & ~self._catching
+        self._catching = catching
+        catch_count = new_catches.sum(axis=1)
+        self.fox_catches += catch_count
+        return catch_count > 0
+
+    def _collect_seeds(self):
+        """Collect the seed within reach of every chicken."""
+        x, y = self.chicken_x, self.chicken_y
+        tile_x = (x / TILE_SIZE).astype(np.int64)
+        tile_y = (y / TILE_SIZE).astype(np.int64)
+        # Seeds sit on tile centres, a tile apart, and the chicken's
+        # radius is under half a tile: only the seed of the tile under
+        # the chicken's centre can be within reach
+        dx = tile_x * TILE_SIZE + TILE_SIZE // 2 - x
+        dy = tile_y * TILE_SIZE + TILE_SIZE // 2 - y
+        tile = tile_y * self._width + tile_x
+        byte = tile >> 3
+        bit = (1 << (tile & 7)).astype(np.uint8)
+        present = (self.seed_bits[self._envs, byte] & bit) != 0
+        radius = self._chicken_radius
+        collect = present & (dx * dx + dy * dy < radius * radius)
+        if not collect.any():
+            return
+
+        envs = self._envs[collect]
+        self.seed_bits[envs, byte[collect]] &= ~bit[collect]
+        kinds = self._kinds[tile[collect]]
+        self.score[envs] += _KIND_POINTS[kinds]
+        self.seeds_left[envs] -= 1
+
+        super_seed = np.zeros(self.num_envs, dtype=bool)
+        super_seed[envs[kinds == SEED_SUPER]] = True
+        if super_seed.any():
+            self.power_timer[super_seed] = FOX_SCARED_TIME
+            # Eaten foxes keep heading home
+            frighten = np.repeat(super_seed, self.num_foxes) & (
+                self.foxes.state != EATEN
+            )
+            self.foxes.set_state(frighten, FRIGHTENED)
+
+    def _observe(self) -> np.ndarray:
+        """
+        Fill the observation buffer.
+
+        Returns:
+            The observation buffer
+        """
+        obs = self.observations
+        obs[:, 0] = self.chicken_x / TILE_SIZE
+        obs[:, 1] = self.chicken_y / TILE_SIZE
+        obs[:, 2] = self.chicken_direction
+        obs[:, 3] = (self.chicken_change_x != 0) | (self.chicken_change_y != 0)
+        obs[:, 4] = self.power_timer
+        obs[:, 5] = self.seeds_left
+
+        foxes = self._fox_observations
+        foxes[:, :, 0] = self.fox_x / TILE_SIZE
+        foxes[:, :, 1] = self.fox_y / TILE_SIZE
+        foxes[:, :, 2] = self.fox_state
+        return obs
@@ -0,0 +1,153 @@
+"""
+Tests for the array-backed fox store.
+"""
+
+import random
+
+import numpy as np
+
+from pacman.entities.actors import (
+    CHASE,
+    EATEN,
+    FRIGHTENED,
+    SCATTER,
+    ActorStore,
+    FoxState,
+)
+from pacman.entities.fox import FoxManager
+from pacman.maps.generator import generate_level
+from pacman.utils.constants import CHICKEN_SIZE, FOX_SCARED_SPEED, FOX_SPEED, TILE_SIZE
+
+
+def test_fox_views_share_the_store():
+    """Fox attributes read and write the store arrays."""
+    maze = generate_level(21, 15, seed=2).maze
+    manager = FoxManager(random.Random(1))
+    manager.create_foxes(maze)
+    store = manager.store
+    fox = manager.foxes[2]
+
+    fox.center_x += 7
+    assert store.x[2] == fox.center_x
+    fox.set_state(FoxState.FRIGHTENED)
+    assert store.state[2] == FRIGHTENED
+    assert fox.speed == FOX_SCARED_SPEED
+
+    manager.set_all_frightened(False)
+    assert fox.state == FoxState.CHASE
+    assert fox.speed == FOX_SPEED
+
+    found = manager.check_collisions_with_chicken(fox.center_x, fox.center_y, 1)
+    assert fox in found
+
+
+def test_state_kernels():
+    """Power mode skips eaten actors and ends in CHASE."""
+    store = ActorStore([75.0, 125.0, 175.0], [75.0, 75.0, 75.0])
+    assert (store.state == SCATTER).all()
+    store.set_state(1, EATEN)
+
+    store.frighten(True)
+    assert list(store.state) == [FRIGHTENED, EATEN, FRIGHTENED]
+    store.frighten(False)
+    assert list(store.state) == [CHASE, EATEN, CHASE]
+    assert list(store.colliding(80.0, 75.0, 1)) == [0]
+
+
+def test_many_actors_stay_in_corridors():
+    """Hundreds of actors move every tick without entering walls."""
+    level = generate_level(45, 45, seed=4)
+    maze = level.maze
+    tiles = [
+        (x, y)
+        for y in range(maze.height)
+        for x in range(maze.width)
+        if not maze.is_wall(x, y)
+    ]
+    manager = FoxManager(random.Random(2))
+    manager.create_foxes(maze, random.Random(3).sample(tiles, 300))
+    store = manager.store
+    chicken_x, chicken_y = maze.get_tile_center(*tiles[0])
+
+    moved = np.zeros(store.count, dtype=bool)
+    for _ in range(120):
+        start_x, start_y = store.x.copy(), store.y.copy()
+        manager.update(maze, chicken_x, chicken_y)
+        moved |= (store.x != start_x) | (store.y != start_y)
+        tile_x = (store.x // TILE_SIZE).astype(int)
+        tile_y = (store.y // TILE_SIZE).astype(int)
+        assert not any(maze.is_wall(x, y) for x, y in zip(tile_x, tile_y))
+
+    assert moved.all()
+
+
+def test_collisions_match_every_fox():
+    """The collision kernel finds exactly the foxes touching the chicken."""
+    level = generate_level(45, 45, seed=4)
+    maze = level.maze
+    rng = random.Random(7)
+    tiles = [
+        (x, y)
+        for y in range(maze.height)
+        for x in range(maze.width)
+        if not maze.is_wall(x, y)
+    ]
+    manager = FoxManager(random.Random(1))
+    manager.create_foxes(maze, rng.sample(tiles, 300))
+
+    chicken_radius = CHICKEN_SIZE // 2
+    hits = 0
+    for _ in range(3):
+        manager.update(maze, *maze.get_tile_center(*tiles[0]))
+        for tile in rng.sample(tiles, 50):
+            chicken_x, chicken_y = maze.get_tile_center(*tile)
+            expected = [
+                fox
+                for fox in manager.foxes
+                if fox.check_collision_with_chicken(
+                    chicken_x, chicken_y, chicken_radius
+                )
+            ]
+            found = manager.check_collisions_with_chicken(
+                chicken_x, chicken_y, chicken_radius
+            )
+            assert found == expected
+            hits += len(found)
+    assert hits
+
+
+def test_foxes_go_home_without_a_distance_table():
+    """Above the table cap, scatter and eaten foxes still find their way home."""
+    level = generate_level(61, 61, seed=4)
+    maze = level.maze
+    assert maze.distance_table is None
+    manager = FoxManager(random.Random(1))
+    manager.create_foxes(maze, level.fox_spawns)
+    store = manager.store
+    chicken_x, chicken_y = maze.get_tile_center(1, 1)
+
+    left_scatter = np.zeros(store.count, dtype=bool)
+    for _ in range(3000):
+        manager.update(maze, chicken_x, chicken_y)
+        left_scatter |= store.state != SCATTER
+        if left_scatter.all():
+            break
+    assert left_scatter.all()
+
+    # Ending power mode leaves an eaten fox heading home
+    fox = manager.foxes[0]
+    fox.center_x, fox.center_y = chicken_x, chicken_y
+    fox.set_state(FoxState.EATEN)
+    manager.set_all_frightened(True)
+    manager.set_all_frightened(False)
+    assert fox.state == FoxState.EATEN
+
+    for _ in range(3000):
+        manager.update(maze, chicken_x, chicken_y)
+        if fox.state != FoxState.EATEN:
+            break
+    assert fox.state == FoxState.CHASE
+    assert fox.get_tile_position() == (
+        int(fox.spawn_x // TILE_SIZE),
+        int(fox.spawn_y // TILE_SIZE),
+    )
@@ -0,0 +1,41 @@
+"""
+Tests for the game-time animation clock.
+"""
+
+from pacman.simulation import Simulation
+from pacman.utils.animation import AnimationClock
+from pacman.utils.constants import SIMULATION_TICK
+
+
+def test_blink_follows_game_time():
+    """Super seeds switch every 1/blink_rate seconds of game time."""
+    clock = AnimationClock(blink_rate=3)
+    assert clock.super_seeds_visible
+
+    clock.update(0.3)
+    assert clock.super_seeds_visible
+    clock.update(0.4)
+    assert not clock.super_seeds_visible
+    clock.update(0.7)
+    assert clock.super_seeds_visible
+
+    clock.reset()
+    assert clock.time == 0.0 and clock.super_seeds_visible
+
+
+def test_clock_stands_still_with_the_simulation():
+    """No ticks, no animation; the same tick always gives the same phase."""
+    sim = Simulation(seed=1)
+    clock = AnimationClock()
+    phases = []
+    for _ in range(40):
+        sim.step(None)
+        clock.update(sim.tick * SIMULATION_TICK)
+        phases.append(clock.super_seeds_visible)
+    assert True in phases and False in phases
+
+    # Paused: frames keep being drawn but the simulation doesn't step
+    frozen = (clock.time, clock.super_seeds_visible)
+    for _ in range(40):
+        clock.update(sim.tick * SIMULATION_TICK)
+    assert (clock.time, clock.super_seeds_visible) == frozen
@@ -0,0 +1,39 @@
+"""
+Tests for the headless batch runner.
+"""
+
+import pytest
+
+from pacman.batch import COLUMNS, main, play_game, run_batch
+from pacman.maps.generator import generate_level
+
+
+def test_games_are_reproducible():
+    """The same seed plays the same game."""
+    level = generate_level(21, 15, seed=2)
+    first = play_game(level, seed=5, max_ticks=300)
+    second = play_game(level, seed=5, max_ticks=300)
+
+    assert first == second
+    assert first["ticks"] == 300
+    assert first["seeds_eaten"] * 10 <= first["score"]
+
+
+def test_pool_matches_single_process():
+    """Spreading games over processes gives the same columns."""
+    options = {"generate": "21x15", "controller": "scripted", "max_ticks": 120}
+    single = run_batch(4, base_seed=10, workers=1, **options)
+    pooled = run_batch(4, base_seed=10, workers=2, **options)
+
+    assert list(single) == list(COLUMNS)
+    assert single["seed"] == [10, 11, 12, 13]
+    assert pooled == single
+
+
+def test_zero_games_rejected(capsys):
+    """--games 0 is a usage error, not a ZeroDivisionError."""
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--games", "0"])
+
+    assert exit_info.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
@@ -0,0 +1,63 @@
+"""
+Tests for the scrolling camera and view culling helpers.
+"""
+
+from pacman.entities.player import Player
+from pacman.maps.maze import Maze
+from pacman.ui.camera import FollowCamera
+from pacman.utils.constants import CHUNK_SIZE, TILE_SIZE
+from pacman.utils.viewport import is_visible, tile_chunk, visible_chunks
+
+
+def test_camera_follows_and_clamps():
+    """The view centers on the target but never leaves the maze."""
+    camera = FollowCamera(800, 600)
+    world = 200 * TILE_SIZE
+
+    camera.follow(5000, 5000, world, world)
+    assert (camera.center_x, camera.center_y) == (5000, 5000)
+    assert camera.view == (4600, 4700, 5400, 5300)
+
+    camera.follow(10, world - 10, world, world)
+    assert camera.view[0] == 0
+    assert camera.view[3] == world
+
+
+def test_camera_centers_small_maze():
+    """A maze smaller than the window stays centered."""
+    camera = FollowCamera(1200, 900)
+    camera.follow(100, 100, 600, 400)
+    assert (camera.center_x, camera.center_y) == (300, 200)
+
+
+def test_visible_chunks_only_cover_view():
+    """Only chunks intersecting the view are visited, however big the maze."""
+    chunk_pixels = CHUNK_SIZE * TILE_SIZE
+    view = (chunk_pixels * 3 + 1, 0, chunk_pixels * 4 + 1, chunk_pixels - 1)
+
+    chunks = list(visible_chunks(view, 1000, 1000))
+
+    assert chunks == [(3, 0), (4, 0)]
+    assert len(list(visible_chunks(None, 40, 20))) == 3 * 2
+    assert tile_chunk(CHUNK_SIZE, CHUNK_SIZE - 1) == (1, 0)
+
+
+def test_is_visible_uses_margin():
+    """Sprites just outside the view still count while they overlap it."""
+    view = (0, 0, 100, 100)
+    assert is_visible(view, 110, 50, margin=20)
+    assert not is_visible(view, 130, 50, margin=20)
+    assert is_visible(None, -1000, -1000)
+
+
+def test_player_clamped_to_large_maze():
+    """The chicken can walk past the window size inside a big maze."""
+    maze = Maze(width=60, height=40)
+    player = Player(*maze.get_tile_center(55, 35))
+    player.move_right()
+
+    for _ in range(200):
+        player.update(maze)
+
+    assert player.center_x > 1200
+    assert not maze.is_wall(*player.get_tile_position())
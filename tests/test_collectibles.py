@@ -0,0 +1,148 @@
+"""
+Tests for seeds and the SeedManager.
+"""
+
+import pytest
+
+from pacman.entities.collectibles import (
+    SEED_NONE,
+    SEED_REGULAR,
+    SEED_SUPER,
+    SeedField,
+    SeedManager,
+)
+from pacman.maps.maze import Maze
+from pacman.utils.constants import (
+    CHICKEN_SIZE,
+    SEED_POINTS,
+    SUPER_SEED_POINTS,
+    TILE_SIZE,
+)
+
+
+@pytest.fixture
+def maze():
+    """Default maze."""
+    return Maze()
+
+
+@pytest.fixture
+def seed_manager(maze):
+    """Seed manager filled from the maze centre."""
+    manager = SeedManager()
+    manager.create_seeds_for_maze(maze)
+    return manager
+
+
+def test_seeds_only_on_reachable_tiles(maze, seed_manager):
+    """No seed is placed inside a wall."""
+    for seed in seed_manager.seeds + seed_manager.super_seeds:
+        tile_x = int(seed.x // TILE_SIZE)
+        tile_y = int(seed.y // TILE_SIZE)
+        assert not maze.is_wall(tile_x, tile_y)
+
+
+def test_collision_collects_seed_under_chicken(maze, seed_manager):
+    """A chicken centred on a seed tile collects exactly that seed."""
+    before = seed_manager.get_remaining_seeds()
+    seed_x, seed_y = maze.get_tile_center(10, 3)
+
+    points, ate_super_seed = seed_manager.check_collisions(
+        seed_x, seed_y, CHICKEN_SIZE // 2
+    )
+
+    assert points == SEED_POINTS
+    assert not ate_super_seed
+    assert seed_manager.get_remaining_seeds() == before - 1
+
+    # Same spot again gives nothing
+    assert seed_manager.check_collisions(seed_x, seed_y, CHICKEN_SIZE // 2) == (
+        0,
+        False,
+    )
+
+
+def test_collision_with_super_seed(seed_manager):
+    """Super seeds award their points and report the power-up."""
+    super_seed = seed_manager.super_seeds[0]
+
+    points, ate_super_seed = seed_manager.check_collisions(
+        super_seed.x, super_seed.y, CHICKEN_SIZE // 2
+    )
+
+    assert points == SUPER_SEED_POINTS
+    assert ate_super_seed
+    assert seed_manager.super_seeds[0].collected
+
+
+def test_collision_far_from_seeds(seed_manager):
+    """Nothing is collected outside the chicken's radius."""
+    # Tile corner is half a tile diagonal away from every seed centre
+    points, _ = seed_manager.check_collisions(3 * TILE_SIZE, 3 * TILE_SIZE, 10)
+    assert points == 0
+
+
+def test_counters_split_by_type(seed_manager):
+    """Remaining counters track regular and super seeds separately."""
+    total = seed_manager.get_remaining_seeds()
+    assert seed_manager.seeds_remaining == len(seed_manager.seeds)
+    assert seed_manager.super_seeds_remaining == len(seed_manager.super_seeds)
+
+    super_seed = seed_manager.super_seeds[0]
+    seed_manager.check_collisions(super_seed.x, super_seed.y, CHICKEN_SIZE // 2)
+
+    assert seed_manager.super_seeds_remaining == len(seed_manager.super_seeds) - 1
+    assert seed_manager.get_remaining_seeds() == total - 1
+
+
+def test_level_complete_fires_once(seed_manager):
+    """The level-complete callback fires when the last seed is eaten."""
+    calls = []
+    seed_manager.on_level_complete = lambda: calls.append(True)
+
+    for seed in seed_manager.seeds + seed_manager.super_seeds:
+        assert not calls
+        seed_manager.check_collisions(seed.x, seed.y, CHICKEN_SIZE // 2)
+
+    assert calls == [True]
+    assert seed_manager.all_seeds_collected()
+
+
+def test_reset_seeds_restores_everything(seed_manager):
+    """reset_seeds() puts every collected seed back."""
+    total = seed_manager.get_remaining_seeds()
+    for seed in seed_manager.seeds[:10] + seed_manager.super_seeds[:1]:
+        seed_manager.check_collisions(seed.x, seed.y, CHICKEN_SIZE // 2)
+    assert seed_manager.get_remaining_seeds() == total - 11
+
+    seed_manager.reset_seeds()
+
+    assert seed_manager.get_remaining_seeds() == total
+    assert seed_manager.field.count() == total
+    assert seed_manager.field.count(SEED_SUPER) == seed_manager.super_seeds_remaining
+
+
+def test_seed_field_bits():
+    """SeedField stores one presence bit and one type byte per tile."""
+    field = SeedField(10, 3)
+    field.place(9, 2, SEED_SUPER)
+    field.place(0, 0, SEED_REGULAR)
+
+    assert len(field.present) == 4  # 30 tiles -> 4 bytes
+    assert field.kind_at(9, 2) == SEED_SUPER
+    assert field.kind_at(5, 1) == SEED_NONE
+    assert list(field.iter_tiles()) == [(0, 0), (9, 2)]
+
+    assert field.collect(9, 2) == SEED_SUPER
+    assert field.collect(9, 2) == SEED_NONE
+    assert field.count() == 1
+    assert list(field.iter_tiles(SEED_SUPER, only_present=False)) == [(9, 2)]
+
+
+def test_collecting_records_the_tile(maze, seed_manager):
+    """Collected tiles are listed in order, until the seeds are laid out again."""
+    seed_manager.check_collisions(*maze.get_tile_center(10, 3), CHICKEN_SIZE // 2)
+    assert seed_manager.collected_tiles == [(10, 3)]
+
+    seed_manager.reset_seeds()
+    assert seed_manager.collected_tiles == []
@@ -0,0 +1,78 @@
+"""
+Tests for the buffered event logger.
+"""
+
+import io
+import logging
+
+from pacman.simulation import Simulation
+from pacman.utils.event_log import BufferedHandler, configure_logging, get_logger
+
+
+def test_silent_by_default(capsys):
+    """Without configure_logging nothing reaches stdout or stderr."""
+    sim = Simulation(seed=1)
+    for _ in range(30):
+        sim.step(0)
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_records_are_written_by_flush_not_by_caller():
+    """Logging only buffers; output appears once the handler flushes."""
+    stream = io.StringIO()
+    # Keep the background thread out of the way
+    handler = BufferedHandler(stream, flush_interval=60)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = get_logger("pacman.simulation")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        logger.info("🌾 +%d points!", 10)
+        assert len(handler.buffer) == 1
+
+        handler.flush()
+        assert "🌾 +10 points!" in stream.getvalue()
+        assert not handler.buffer
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+        handler.close()
+
+
+def test_configure_logging_filters_and_flushes_on_off():
+    """Records below the level are dropped; switching off writes the rest."""
+    stream = io.StringIO()
+    handler = configure_logging("warning", stream)
+    try:
+        get_logger("pacman.game").info("hidden")
+        get_logger("pacman.game").warning("shown")
+    finally:
+        configure_logging("off")
+        logging.getLogger("chickman").setLevel(logging.NOTSET)
+
+    assert isinstance(handler, BufferedHandler)
+    assert "shown" in stream.getvalue()
+    assert "hidden" not in stream.getvalue()
+    assert handler not in logging.getLogger("chickman").handlers
+
+
+def test_full_buffer_drops_oldest():
+    """A full ring buffer never blocks, it drops and counts old records."""
+    stream = io.StringIO()
+    handler = BufferedHandler(stream, capacity=3, flush_interval=60)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("chickman.test_ring")
+    logger.addHandler(handler)
+    try:
+        for index in range(5):
+            logger.warning("event %d", index)
+        handler.close()
+    finally:
+        logger.removeHandler(handler)
+
+    lines = stream.getvalue().splitlines()
+    assert lines[:3] == ["event 2", "event 3", "event 4"]
+    assert "2 log records dropped" in lines[3]
@@ -0,0 +1,27 @@
+"""
+Tests for procedural maze generation.
+"""
+
+from pacman.maps.generator import generate_grid, generate_level
+
+
+def test_same_seed_same_maze():
+    """Generation is deterministic for a seed."""
+    assert generate_grid(31, 21, seed=7) == generate_grid(31, 21, seed=7)
+    assert generate_grid(31, 21, seed=7) != generate_grid(31, 21, seed=8)
+
+
+def test_border_is_wall_and_open_tiles_connected():
+    """Every open tile is reachable from the player spawn."""
+    level = generate_level(40, 30, seed=3)
+    grid = level.maze.grid
+
+    assert all(grid[0]) and all(grid[-1])
+    assert all(row[0] and row[-1] for row in grid)
+
+    open_tiles = {
+        (x, y) for y, row in enumerate(grid) for x, tile in enumerate(row) if tile == 0
+    }
+    assert level.reachable_tiles == open_tiles
+    assert set(level.maze.component_tiles(*level.player_spawn)) == open_tiles
+    assert all(tile in open_tiles for tile in level.fox_spawns)
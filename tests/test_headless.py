@@ -0,0 +1,34 @@
+"""
+Tests that the game logic imports without arcade (no display needed).
+"""
+
+import subprocess
+import sys
+
+HEADLESS_MODULES = (
+    "pacman.maps.maze",
+    "pacman.maps.generator",
+    "pacman.maps.level_loader",
+    "pacman.entities.player",
+    "pacman.entities.fox",
+    "pacman.entities.collectibles",
+    "pacman.simulation",
+    "pacman.replay",
+    "pacman.batch",
+    "pacman.vector_env",
+    "pacman.observation",
+)
+
+
+def test_logic_modules_do_not_load_arcade():
+    """Importing the simulation stack leaves arcade and pyglet unloaded."""
+    code = (
+        f"import sys\n"
+        f"for module in {HEADLESS_MODULES!r}:\n"
+        f"    __import__(module)\n"
+        f"print(sorted(name for name in ('arcade', 'pyglet') if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
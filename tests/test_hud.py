@@ -0,0 +1,66 @@
+"""
+Tests for the cached HUD text.
+"""
+
+from pacman.ui.hud import Hud
+
+
+class _CountingText:
+    """Stand-in text object counting how often its contents are set."""
+
+    def __init__(self):
+        self.sets = 0
+        self.visible = True
+        self._text = ""
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self.sets += 1
+        self._text = value
+
+
+def _hud() -> Hud:
+    """HUD with counting text objects (real ones need a window)."""
+    hud = Hud()
+    hud.fps_text = _CountingText()
+    hud.score_text = _CountingText()
+    hud.seeds_text = _CountingText()
+    hud.power_text = _CountingText()
+    hud.position_text = _CountingText()
+    return hud
+
+
+def test_labels_show_values():
+    """Labels show the values passed to update()."""
+    hud = _hud()
+    hud.update(120, 42, 3.46, 250.7, 99.2)
+    hud.set_fps(59)
+
+    assert hud.score_text.text == "SCORE: 120"
+    assert hud.seeds_text.text == "Seeds: 42"
+    assert hud.power_text.text == "💪 POWER MODE: 3.5s"
+    assert hud.power_text.visible
+    assert hud.position_text.text == "Position: (250, 99)"
+    assert hud.fps_text.text == "FPS: 59"
+
+    hud.update(120, 42, None, 250.7, 99.2)
+    assert not hud.power_text.visible
+
+
+def test_text_only_rebuilt_on_change():
+    """Unchanged values do not touch the text objects."""
+    hud = _hud()
+
+    for _ in range(10):
+        hud.update(10, 5, 2.01, 100.0, 100.0)
+    hud.update(10, 5, 1.99, 100.0, 100.0)  # Still shows 2.0s
+    assert hud.score_text.sets == 1
+    assert hud.power_text.sets == 1
+
+    hud.update(20, 5, 1.9, 100.0, 100.0)
+    assert hud.score_text.sets == 2
+    assert hud.power_text.sets == 2
@@ -0,0 +1,134 @@
+"""
+Tests for loading Tiled maps and the compiled level cache.
+"""
+
+import os
+
+import pytest
+
+from pacman.maps import level_loader
+from pacman.maps.level_loader import compile_level, load_compiled, load_level
+from pacman.simulation import Simulation
+
+pytest.importorskip("pytmx")
+
+
+TMX = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" renderorder="right-down"
+     width="5" height="4" tilewidth="50" tileheight="50" infinite="0"
+     nextlayerid="3" nextobjectid="4">
+ <layer id="1" name="walls" width="5" height="4">
+  <data encoding="csv">
+1,1,1,1,1,
+1,0,0,0,1,
+1,0,1,0,1,
+1,1,1,1,1
+</data>
+ </layer>
+ <objectgroup id="2" name="spawns">
+  <object id="1" name="player" type="player" x="60" y="60" width="10" height="10"/>
+  <object id="2" name="Rusty" class="fox" x="160" y="110"/>
+  <object id="3" type="super_seed" x="160" y="60"/>
+ </objectgroup>
+</map>
+"""
+
+
+@pytest.fixture
+def tmx_path(tmp_path):
+    """Small 5x4 Tiled map on disk."""
+    path = tmp_path / "level.tmx"
+    path.write_text(TMX)
+    return str(path)
+
+
+def test_load_tmx_flips_rows_and_reads_spawns(tmx_path):
+    """Tiled's top-down rows become the maze's bottom-up grid."""
+    level = level_loader.load_tmx(tmx_path)
+
+    assert (level.maze.width, level.maze.height) == (5, 4)
+    assert level.maze.grid[1] == [1, 0, 1, 0, 1]
+    assert level.maze.grid[2] == [1, 0, 0, 0, 1]
+    assert level.player_spawn == (1, 2)
+    assert level.fox_spawns == [(3, 1)]
+    assert level.super_seed_tiles == [(3, 2)]
+    assert level.reachable_tiles == {(1, 1), (1, 2), (2, 2), (3, 2), (3, 1)}
+
+
+def test_compiled_round_trip(tmx_path, tmp_path):
+    """A compiled level loads back identical without touching the TMX."""
+    level = level_loader.load_tmx(tmx_path)
+    compiled_path = str(tmp_path / "level.chklvl")
+    compile_level(level, compiled_path)
+
+    loaded = load_compiled(compiled_path)
+
+    assert [list(row) for row in loaded.maze.grid] == level.maze.grid
+    assert loaded.maze.neighbours == level.maze.neighbours
+    assert loaded.maze.distance_table.distance((1, 2), (3, 1)) == 3
+    assert loaded.maze.component_size(3, 1) == 5
+    assert loaded.player_spawn == level.player_spawn
+    assert loaded.fox_spawns == level.fox_spawns
+    assert loaded.super_seed_tiles == level.super_seed_tiles
+    assert loaded.reachable_tiles == level.reachable_tiles
+
+
+def test_compiled_level_is_not_recomputed(tmx_path, tmp_path, monkeypatch):
+    """Regions and the distance table come from the file, not a new search."""
+    level = level_loader.load_tmx(tmx_path)
+    compiled_path = str(tmp_path / "level.chklvl")
+    compile_level(level, compiled_path)
+
+    def fail(*args):
+        raise AssertionError("derived maze data rebuilt on a cache hit")
+
+    monkeypatch.setattr(level_loader.DistanceTable, "__init__", fail)
+    monkeypatch.setattr(level_loader.Maze, "_label_components", fail)
+    monkeypatch.setattr(level_loader.Maze, "_build_neighbour_masks", fail)
+    maze = load_compiled(compiled_path).maze
+
+    assert maze.distance_table.next_direction((1, 2), (3, 1)) is not None
+    assert isinstance(maze.distance_table.distances, memoryview)
+    assert maze.is_reachable((1, 2), (3, 1))
+
+
+def test_load_level_uses_cache(tmx_path, tmp_path, monkeypatch):
+    """The second load comes from the cache, a damaged cache is rebuilt."""
+    cache_dir = str(tmp_path / "cache")
+    load_level(tmx_path, cache_dir)
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1
+
+    def fail(path):
+        raise AssertionError("TMX parsed despite cache hit")
+
+    monkeypatch.setattr(level_loader, "load_tmx", fail)
+    level = load_level(tmx_path, cache_dir)
+    assert level.player_spawn == (1, 2)
+
+    # Truncated cache falls back to parsing the TMX again
+    monkeypatch.undo()
+    cache_path = os.path.join(cache_dir, cache_files[0])
+    with open(cache_path, "r+b") as cache_file:
+        cache_file.truncate(10)
+    assert load_level(tmx_path, cache_dir).fox_spawns == [(3, 1)]
+
+
+def test_simulation_uses_level_spawns(tmx_path, tmp_path):
+    """Simulation places the chicken, foxes and super seeds from the level."""
+    level = load_level(tmx_path, str(tmp_path / "cache"))
+    sim = Simulation(level=level)
+
+    assert sim.player.get_tile_position() == (1, 2)
+    assert [fox.get_tile_position() for fox in sim.fox_manager.foxes] == [(3, 1)]
+    assert sim.seed_manager.super_seeds_remaining == 1
+    assert sim.seed_manager.seeds_remaining == 4
+
+
+def test_unreachable_fox_spawn_is_rejected(tmp_path):
+    """A fox placed where the chicken cannot go fails to load."""
+    path = tmp_path / "bad.tmx"
+    path.write_text(TMX.replace('x="160" y="110"', 'x="110" y="110"'))
+
+    with pytest.raises(ValueError, match="cannot be reached"):
+        level_loader.load_tmx(str(path))
@@ -0,0 +1,120 @@
+"""
+Tests for the Maze class.
+"""
+
+from pacman.maps.maze import (
+    TILE_CLASS_CORRIDOR,
+    TILE_CLASS_DEAD_END,
+    TILE_CLASS_JUNCTION,
+    TILE_CLASS_WALL,
+    Maze,
+)
+from pacman.utils.constants import DIRECTION_UP, DIRECTION_VECTORS, TILE_SIZE
+
+
+def test_default_maze_has_border_walls():
+    """Every border tile of the default maze is a wall."""
+    maze = Maze()
+    for x in range(maze.width):
+        assert maze.is_wall(x, 0)
+        assert maze.is_wall(x, maze.height - 1)
+    for y in range(maze.height):
+        assert maze.is_wall(0, y)
+        assert maze.is_wall(maze.width - 1, y)
+
+
+def test_set_tile_updates_walls():
+    """Changing a tile updates the collision rectangles and the revision."""
+    maze = Maze()
+    wall_count = len(maze.walls)
+
+    maze.set_tile(2, 2, 1)
+
+    assert maze.is_wall(2, 2)
+    assert len(maze.walls) == wall_count + 1
+    assert (2 * TILE_SIZE, 2 * TILE_SIZE, TILE_SIZE, TILE_SIZE) in maze.walls
+    assert maze.revision == 1
+
+    maze.set_tile(2, 2, 0)
+    assert len(maze.walls) == wall_count
+
+
+def test_set_tile_same_value_changes_nothing():
+    """Setting a tile to its current value does not bump the revision."""
+    maze = Maze()
+    maze.set_tile(0, 0, 1)
+    assert maze.revision == 0
+
+
+def test_neighbour_masks_match_walls():
+    """open_directions() agrees with is_wall() on every tile."""
+    maze = Maze()
+    for y in range(maze.height):
+        for x in range(maze.width):
+            mask = maze.open_directions(x, y)
+            if maze.is_wall(x, y):
+                assert mask == 0
+                continue
+            for direction, (dx, dy) in enumerate(DIRECTION_VECTORS):
+                is_open = bool(mask & (1 << direction))
+                assert is_open == (not maze.is_wall(x + dx, y + dy))
+
+
+def test_tile_classes():
+    """Junctions, corridors and dead ends are classified by open count."""
+    maze = Maze()
+    # Open room tile with all four neighbours open
+    assert maze.is_junction(12, 9)
+    # Tile next to the border wall: wall below, left/right/up open, so
+    # still three ways out - a junction, not a corridor
+    assert maze.tile_class(12, 1) == TILE_CLASS_JUNCTION
+    assert maze.tile_class(0, 0) == TILE_CLASS_WALL
+
+    # Walling off the corner's right side leaves a dead end and a corridor
+    maze.set_tile(2, 1, 1)
+    maze.set_tile(2, 2, 1)
+    assert maze.tile_class(1, 1) == TILE_CLASS_DEAD_END
+    assert maze.open_directions(1, 1) == 1 << DIRECTION_UP
+    assert maze.tile_class(1, 2) == TILE_CLASS_CORRIDOR
+
+
+def test_connected_components():
+    """Walled-off regions get their own label, size and reachability."""
+    grid = [
+        [1, 1, 1, 1, 1, 1],
+        [1, 0, 0, 1, 0, 1],
+        [1, 0, 1, 1, 0, 1],
+        [1, 1, 1, 1, 1, 1],
+    ]
+    # Regions are labelled on first use, whichever query comes first
+    assert Maze(grid).component_size(1, 1) == 3
+    maze = Maze(grid)
+
+    assert maze.is_reachable((1, 1), (2, 1))
+    assert maze.is_reachable((1, 1), (1, 2))
+    assert not maze.is_reachable((1, 1), (4, 1))
+    assert not maze.is_reachable((0, 0), (0, 0))  # Walls reach nothing
+    assert maze.component_size(1, 1) == 3
+    assert maze.component_size(4, 2) == 2
+    assert maze.component_size(3, 1) == 0
+    assert maze.component_tiles(4, 1) == [(4, 1), (4, 2)]
+
+    # Opening the wall between the regions joins them
+    maze.set_tile(3, 1, 0)
+    assert maze.is_reachable((1, 2), (4, 2))
+    assert maze.component_size(1, 1) == 6
+
+
+def test_nearest_reachable_tile():
+    """The closest tile in the start's region is found, walls skipped."""
+    grid = [
+        [1, 1, 1, 1, 1, 1],
+        [1, 0, 0, 1, 0, 1],
+        [1, 0, 1, 1, 0, 1],
+        [1, 1, 1, 1, 1, 1],
+    ]
+    maze = Maze(grid)
+
+    assert maze.nearest_reachable_tile((1, 1), 5, 3) == (2, 1)
+    assert maze.nearest_reachable_tile((4, 1), 0, 0) == (4, 1)
+    assert maze.nearest_reachable_tile((0, 0), 1, 1) is None
@@ -0,0 +1,62 @@
+"""
+Tests for grid observations.
+"""
+
+import numpy as np
+import pytest
+
+from pacman.maps.generator import generate_level
+from pacman.observation import (
+    CHANNEL_CHICKEN,
+    CHANNEL_SEEDS,
+    CHANNEL_SUPER_SEEDS,
+    CHANNEL_WALLS,
+    FOX_STATE_CHANNELS,
+    GridObservation,
+)
+from pacman.simulation import Simulation
+
+
+def test_channels_match_simulation():
+    """Every channel shows the current game state."""
+    sim = Simulation(level=generate_level(21, 15, seed=2), seed=1)
+    observation = GridObservation(sim)
+    planes = observation.planes
+
+    assert planes.shape == (8, 15, 21)
+    assert (planes[CHANNEL_WALLS] == np.array(sim.maze.grid)).all()
+    seeds = int(planes[CHANNEL_SEEDS].sum() + planes[CHANNEL_SUPER_SEEDS].sum())
+    assert seeds == sim.seed_manager.get_remaining_seeds()
+
+    for tick in range(90):
+        sim.step((tick // 30) % 4)
+        observation.update()
+
+    tile_x, tile_y = sim.player.get_tile_position()
+    assert planes[CHANNEL_CHICKEN].sum() == 1
+    assert planes[CHANNEL_CHICKEN, tile_y, tile_x] == 1
+    for fox in sim.fox_manager.foxes:
+        fox_x, fox_y = fox.get_tile_position()
+        assert planes[FOX_STATE_CHANNELS[fox.state], fox_y, fox_x] == 1
+    seeds_now = int(planes[CHANNEL_SEEDS].sum() + planes[CHANNEL_SUPER_SEEDS].sum())
+    assert seeds_now == sim.seed_manager.get_remaining_seeds() < seeds
+
+
+def test_views_are_shared_and_read_only():
+    """Updates write into the same memory; consumers can't write to it."""
+    sim = Simulation(seed=1)
+    observation = GridObservation(sim)
+    planes = observation.planes
+    seeds = observation.channel("seeds")
+
+    sim.step(0)
+    assert observation.update() is planes
+    assert np.shares_memory(seeds, planes)
+    with pytest.raises(ValueError):
+        planes[CHANNEL_WALLS, 0, 0] = 0
+
+    # A reset lays the seeds out again
+    sim.reset()
+    observation.update()
+    total = int(planes[CHANNEL_SEEDS].sum() + planes[CHANNEL_SUPER_SEEDS].sum())
+    assert total == sim.seed_manager.get_remaining_seeds()
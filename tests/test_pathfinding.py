@@ -0,0 +1,144 @@
+"""
+Tests for the maze distance table and fox targeting.
+"""
+
+import pytest
+
+from pacman.entities.fox import FoxManager, FoxState
+from pacman.maps.maze import Maze
+from pacman.utils.constants import DIRECTION_VECTORS
+from pacman.utils.pathfinding import FlowField
+
+
+@pytest.fixture
+def maze():
+    """Default maze."""
+    return Maze()
+
+
+def test_table_covers_walkable_tiles(maze):
+    """Every non-wall tile has a compact id."""
+    table = maze.distance_table
+    walkable = sum(row.count(0) for row in maze.grid)
+    assert len(table.tiles) == walkable
+    assert table.tile_id(0, 0) == -1
+
+
+def test_distances_are_symmetric(maze):
+    """Grid paths are undirected, so distances are symmetric."""
+    table = maze.distance_table
+    assert table.distance((12, 9), (12, 9)) == 0
+    assert table.distance((12, 9), (22, 16)) == table.distance((22, 16), (12, 9))
+    assert table.distance((12, 9), (13, 9)) == 1
+
+
+def test_next_hop_follows_shortest_path(maze):
+    """Following next hops reaches the goal in exactly distance steps."""
+    table = maze.distance_table
+    start, goal = (6, 1), (17, 16)
+    steps = table.distance(start, goal)
+
+    tile = start
+    for _ in range(steps):
+        dx, dy = DIRECTION_VECTORS[table.next_direction(tile, goal)]
+        tile = (tile[0] + dx, tile[1] + dy)
+        assert not maze.is_wall(*tile)
+
+    assert tile == goal
+    assert table.next_direction(goal, goal) is None
+
+
+def test_unreachable_pair(maze):
+    """Tiles in the closed-off corner box have no path to the centre."""
+    table = maze.distance_table
+    assert table.distance((1, 1), (12, 9)) is None
+    assert table.next_direction((1, 1), (12, 9)) is None
+
+
+def test_table_rebuilt_after_set_tile(maze):
+    """Changing a tile invalidates the distance table."""
+    before = maze.distance_table
+    maze.set_tile(12, 9, 1)
+    after = maze.distance_table
+    assert after is not before
+    assert after.tile_id(12, 9) == -1
+
+
+def test_table_built_on_first_use(maze):
+    """Constructing a maze doesn't pay for the table; precompute() does."""
+    assert maze._distance_table is None
+    maze.precompute()
+    table = maze._distance_table
+    assert table is not None
+    assert maze.distance_table is table
+
+
+def test_eaten_fox_returns_to_spawn(maze):
+    """An eaten fox walks back to its spawn tile and resumes chasing."""
+    manager = FoxManager()
+    manager.create_foxes(maze, [(12, 9)])
+    fox = manager.foxes[0]
+    fox.center_x, fox.center_y = maze.get_tile_center(20, 9)
+    fox.set_state(FoxState.EATEN)
+
+    for _ in range(200):
+        manager.update(maze, *maze.get_tile_center(20, 16))
+        if fox.state != FoxState.EATEN:
+            break
+
+    assert fox.state == FoxState.CHASE
+    assert fox.get_tile_position() == (12, 9)
+
+
+def test_power_mode_does_not_revive_eaten_foxes(maze):
+    """Frighten/unfrighten leaves eaten foxes alone."""
+    manager = FoxManager()
+    manager.create_foxes(maze)
+    eaten = manager.foxes[0]
+    eaten.set_state(FoxState.EATEN)
+
+    manager.set_all_frightened(True)
+    assert eaten.state == FoxState.EATEN
+    assert manager.foxes[1].state == FoxState.FRIGHTENED
+
+    manager.set_all_frightened(False)
+    assert eaten.state == FoxState.EATEN
+    assert manager.foxes[1].state == FoxState.CHASE
+
+
+def test_flow_field_matches_distance_table(maze):
+    """A flow field's distances agree with the all-pairs table."""
+    field = FlowField(maze, 12, 9)
+    table = maze.distance_table
+    for tile in table.tiles:
+        assert field.distance(*tile) == table.distance(tile, (12, 9))
+
+
+def test_flow_field_chase_and_flee(maze):
+    """Chase steps get one tile closer to the root, flee steps get further."""
+    field = FlowField(maze, 12, 9)
+    tile = (16, 14)
+    here = field.distance(*tile)
+
+    dx, dy = DIRECTION_VECTORS[field.chase_direction(*tile)]
+    assert field.distance(tile[0] + dx, tile[1] + dy) == here - 1
+
+    dx, dy = DIRECTION_VECTORS[field.flee_direction(*tile)]
+    assert field.distance(tile[0] + dx, tile[1] + dy) == here + 1
+
+    assert field.chase_direction(12, 9) is None
+
+
+def test_chicken_field_rebuilt_only_on_tile_change(maze):
+    """FoxManager keeps one chicken field until the chicken changes tile."""
+    manager = FoxManager()
+    manager.create_foxes(maze)
+
+    manager.update(maze, 610, 460)
+    field = manager.chicken_field
+    manager.update(maze, 620, 470)  # Same tile (12, 9)
+    assert manager.chicken_field is field
+
+    manager.update(maze, 660, 460)  # Tile (13, 9)
+    assert manager.chicken_field is not field
+    assert manager.chicken_field.root == (13, 9)
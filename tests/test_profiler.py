@@ -0,0 +1,67 @@
+"""
+Tests for the frame profiler.
+"""
+
+import json
+
+from pacman.simulation import Simulation
+from pacman.ui.profiler_overlay import format_profiler_lines
+from pacman.utils.profiler import (
+    NULL_PROFILER,
+    STAGE_FOX_UPDATE,
+    STAGE_PLAYER_UPDATE,
+    STAGE_SEED_COLLISION,
+    FrameProfiler,
+)
+
+
+def test_percentiles_over_rolling_window():
+    """Only the last `window` frames count towards the percentiles."""
+    profiler = FrameProfiler(window=100)
+    for value in range(200):
+        profiler._frame_totals["stage"] = value / 1000  # value ms
+        profiler.count_draw_calls(value)
+        profiler.end_frame()
+
+    p50, p95, p99 = profiler.stage_percentiles("stage")
+    assert (round(p50), round(p95), round(p99)) == (150, 195, 199)
+    assert profiler.frames == 200
+    assert profiler.summary()["draw_calls"]["max"] == 199
+
+
+def test_stage_time_summed_per_frame():
+    """A stage running several times in one frame is one sample."""
+    profiler = FrameProfiler()
+    for _ in range(3):
+        with profiler.stage("tick"):
+            pass
+    profiler.end_frame()
+
+    assert len(profiler.samples["tick"]) == 1
+
+
+def test_simulation_stages_and_json_dump(tmp_path):
+    """The update stages are recorded and dumped to JSON."""
+    sim = Simulation(seed=1)
+    profiler = FrameProfiler()
+    sim.profiler = profiler
+    for _ in range(10):
+        sim.step(0)
+        profiler.end_frame()
+
+    path = tmp_path / "profile.json"
+    profiler.dump_json(str(path))
+    data = json.loads(path.read_text())
+
+    for stage in (STAGE_PLAYER_UPDATE, STAGE_FOX_UPDATE, STAGE_SEED_COLLISION):
+        assert data["stages"][stage]["samples"] == 10
+    assert data["frames"] == 10
+    assert len(format_profiler_lines(profiler)) == 9
+
+
+def test_null_profiler_is_default():
+    """Profiling is off unless a profiler is attached."""
+    sim = Simulation(seed=1)
+    assert sim.profiler is NULL_PROFILER
+    with NULL_PROFILER.stage("anything"):
+        pass
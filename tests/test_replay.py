@@ -0,0 +1,145 @@
+"""
+Tests for seeded simulations and replays.
+"""
+
+import random
+
+import pytest
+
+from pacman.maps.maze import Maze
+from pacman.replay import (
+    MAX_SEED,
+    Replay,
+    ReplayRecorder,
+    main,
+    map_digest,
+    play_replay,
+)
+from pacman.simulation import Simulation
+
+
+def _play_session(simulation, ticks, input_seed=3):
+    """Drive a simulation with pseudo-random held directions."""
+    rng = random.Random(input_seed)
+    direction = None
+    for _ in range(ticks):
+        if rng.random() < 0.05:
+            direction = rng.choice([0, 1, 2, 3, None])
+        simulation.step(direction)
+
+
+def _fox_positions(simulation):
+    return [(fox.center_x, fox.center_y) for fox in simulation.fox_manager.foxes]
+
+
+def test_replay_bytes_round_trip():
+    """Encoding and decoding keeps every field."""
+    replay = Replay(
+        MAX_SEED,
+        [(1, 0), (90, None), (200, 3), (70000, 1)],
+        70010,
+        1234,
+        map_hash=2**63 + 9,
+    )
+
+    data = replay.to_bytes()
+    decoded = Replay.from_bytes(data)
+
+    assert decoded.seed == replay.seed
+    assert decoded.inputs == replay.inputs
+    assert decoded.length == replay.length
+    assert decoded.final_score == replay.final_score
+    assert decoded.map_hash == replay.map_hash
+    # Header + 1-3 bytes per input change + end record
+    assert len(data) < 23 + 4 * 3 + 6
+
+
+def test_version_1_replays_still_load():
+    """Replays from before the map hash load without one."""
+    data = Replay(9, [(5, 2)], 10, 30).to_bytes()
+    version_1 = data[:6] + bytes([1]) + data[7:15] + data[23:]
+
+    replay = Replay.from_bytes(version_1)
+    assert (replay.seed, replay.inputs, replay.final_score) == (9, [(5, 2)], 30)
+    assert replay.map_hash is None
+
+
+def test_bad_replay_data_rejected():
+    """Truncated or foreign data raises ValueError."""
+    data = Replay(1, [(5, 2)], 10).to_bytes()
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data[:-2])
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"NOTRPL" + data[6:])
+
+
+def test_recorder_stores_only_changes():
+    """Holding a key for many ticks is a single record."""
+    recorder = ReplayRecorder(seed=1)
+    for tick, direction in enumerate([None, 0, 0, 0, 2, 2, None, None], start=1):
+        recorder.record(tick, direction)
+
+    replay = recorder.finish()
+    assert replay.inputs == [(2, 0), (5, 2), (7, None)]
+    assert list(replay.iter_inputs()) == [None, 0, 0, 0, 2, 2, None, None]
+
+
+def test_same_seed_same_wandering_foxes():
+    """Foxes without a pathfinding table wander the same way for a seed."""
+    maze = Maze(width=40, height=40)
+    first = Simulation(maze, seed=42)
+    second = Simulation(maze, seed=42)
+    _play_session(first, 300)
+    _play_session(second, 300)
+    assert _fox_positions(first) == _fox_positions(second)
+
+
+def test_replay_reproduces_session(tmp_path):
+    """Playing a saved replay ends in exactly the recorded state."""
+    maze = Maze(width=40, height=40)
+    simulation = Simulation(maze, seed=7)
+    simulation.recorder = ReplayRecorder(simulation.seed, map_digest(maze))
+    _play_session(simulation, 600)
+
+    path = tmp_path / "session.chkrpl"
+    simulation.recorder.finish(simulation.score).save(str(path))
+
+    replayed = play_replay(Replay.load(str(path)), maze=maze)
+
+    assert replayed.tick == simulation.tick
+    assert replayed.score == simulation.score
+    assert (replayed.player.center_x, replayed.player.center_y) == (
+        simulation.player.center_x,
+        simulation.player.center_y,
+    )
+    assert _fox_positions(replayed) == _fox_positions(simulation)
+
+
+def test_replay_on_another_map_rejected():
+    """A replay names the map it needs instead of silently diverging."""
+    maze = Maze(width=40, height=40)
+    recorder = ReplayRecorder(seed=1, map_hash=map_digest(maze))
+    recorder.record(1, 0)
+    replay = recorder.finish()
+
+    assert play_replay(replay, maze=maze).tick == 1
+    with pytest.raises(ValueError, match="different map"):
+        play_replay(replay, maze=Maze(width=30, height=40))
+
+
+def test_cli_reports_unreadable_replays_and_goes_on(tmp_path, capsys):
+    """A broken file counts as a mismatch; the other replays are still checked."""
+    recorder = ReplayRecorder(seed=1, map_hash=map_digest(Maze()))
+    recorder.record(1, 0)
+    good = tmp_path / "good.chkrpl"
+    recorder.finish().save(str(good))
+    broken = tmp_path / "broken.chkrpl"
+    broken.write_bytes(good.read_bytes()[:10])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(broken), str(good)])
+
+    assert exit_info.value.code == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{broken}: ")
+    assert lines[1].startswith(f"{good}: 1 ticks") and " ok," in lines[1]
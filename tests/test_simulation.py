@@ -0,0 +1,77 @@
+"""
+Tests for the headless game simulation.
+"""
+
+from pacman.maps.generator import generate_level
+from pacman.simulation import Simulation
+from pacman.utils.constants import CHICKEN_SPEED, FOX_SCARED_TIME
+
+
+def test_simulation_runs_without_window():
+    """Simulation can be created and stepped with no arcade window."""
+    sim = Simulation()
+    for _ in range(120):
+        sim.step()
+    assert sim.tick == 120
+    assert sim.player is not None
+    assert sim.seed_manager.get_remaining_seeds() > 0
+
+
+def test_step_moves_player():
+    """Holding a direction moves the chicken; releasing it stops it."""
+    sim = Simulation()
+    start_x = sim.player.center_x
+
+    sim.step(0)  # Right
+    assert sim.player.center_x == start_x + CHICKEN_SPEED
+
+    sim.step(None)
+    stopped_x = sim.player.center_x
+    sim.step(None)
+    assert sim.player.center_x == stopped_x
+
+
+def test_power_mode_times_out():
+    """Power mode counts down with the tick duration."""
+    sim = Simulation()
+    sim.power_mode = True
+    sim.power_timer = FOX_SCARED_TIME
+
+    sim.step(delta_time=FOX_SCARED_TIME)
+
+    assert not sim.power_mode
+    assert sim.power_timer == 0.0
+
+
+def test_reset_restores_state():
+    """reset() clears score and tick counter."""
+    sim = Simulation()
+    for _ in range(30):
+        sim.step(2)
+    sim.score = 123
+
+    sim.reset()
+
+    assert sim.score == 0
+    assert sim.tick == 0
+
+
+def test_catch_counted_once_per_contact():
+    """A fox touching the chicken for many ticks is one catch."""
+    simulation = Simulation(level=generate_level(21, 15, seed=3, fox_count=1), seed=3)
+    fox = simulation.fox_manager.foxes[0]
+    player = simulation.player
+
+    for _ in range(10):
+        fox.center_x, fox.center_y = player.center_x, player.center_y
+        simulation.step()
+
+    assert simulation.first_caught_tick == 1
+    assert simulation.fox_catches == 1
+
+    # Contact lost, then a new catch
+    fox.center_x += 500
+    simulation.step()
+    fox.center_x, fox.center_y = player.center_x, player.center_y
+    simulation.step()
+    assert simulation.fox_catches == 2
@@ -0,0 +1,45 @@
+"""
+Tests for the render-to-texture static layer (the parts that need no GPU).
+"""
+
+from pacman.entities.collectibles import SeedManager
+from pacman.maps.maze import Maze
+from pacman.ui.static_layer import StaticLayer
+from pacman.utils.constants import CHICKEN_SIZE
+
+
+def _layer():
+    """Static layer over the default maze with seeds from its centre."""
+    maze = Maze()
+    seed_manager = SeedManager()
+    seed_manager.create_seeds_for_maze(maze)
+    return maze, seed_manager, StaticLayer(maze, seed_manager)
+
+
+def test_collected_seeds_are_erased_once():
+    """Each collected tile is handed out for erasing exactly once."""
+    maze, seed_manager, layer = _layer()
+    layer.chunks[(0, 0)] = object()  # Pretend draw() rendered it
+
+    seed_manager.check_collisions(*maze.get_tile_center(10, 3), CHICKEN_SIZE // 2)
+    seed_manager.check_collisions(*maze.get_tile_center(11, 3), CHICKEN_SIZE // 2)
+
+    assert layer._sync() == [(10, 3), (11, 3)]
+    assert layer._sync() == []
+    assert (0, 0) in layer.chunks
+
+
+def test_layout_change_drops_textures():
+    """Resetting the seeds or editing the maze re-renders everything."""
+    maze, seed_manager, layer = _layer()
+    layer.chunks[(0, 0)] = object()
+    seed_manager.check_collisions(*maze.get_tile_center(10, 3), CHICKEN_SIZE // 2)
+
+    seed_manager.reset_seeds()
+    assert layer._sync() == []
+    assert not layer.chunks
+
+    layer.chunks[(0, 0)] = object()
+    maze.set_tile(3, 3, 1)
+    layer._sync()
+    assert not layer.chunks
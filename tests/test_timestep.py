@@ -0,0 +1,59 @@
+"""
+Tests for the fixed timestep and render interpolation.
+"""
+
+import pytest
+
+from pacman.entities.player import Player
+from pacman.simulation import Simulation
+from pacman.utils.constants import DIRECTION_LEFT
+from pacman.utils.timestep import FixedTimestep
+
+
+def test_slow_frames_run_several_ticks():
+    """A 30 FPS frame runs two 60 Hz ticks."""
+    timestep = FixedTimestep(step=1 / 60, max_steps=5)
+    assert timestep.advance(1 / 30) == 2
+    assert timestep.alpha == pytest.approx(0, abs=1e-6)
+
+    assert timestep.advance(1 / 120) == 0
+    assert timestep.alpha == pytest.approx(0.5)
+
+
+def test_catch_up_is_capped():
+    """A long stall runs at most max_steps ticks and drops the rest."""
+    timestep = FixedTimestep(step=1 / 60, max_steps=5)
+    assert timestep.advance(1.0) == 5
+    assert timestep.dropped_time == pytest.approx(55 / 60)
+    assert timestep.accumulator < timestep.step
+
+
+@pytest.mark.parametrize("frame_rate", [30, 45, 144])
+def test_game_speed_independent_of_frame_rate(frame_rate):
+    """One second of play ends in the same state at any frame rate."""
+    reference = Simulation()
+    for _ in range(60):
+        reference.step(DIRECTION_LEFT)
+
+    sim = Simulation()
+    timestep = FixedTimestep(step=1 / 60)
+    for _ in range(frame_rate):
+        for _ in range(timestep.advance(1 / frame_rate)):
+            sim.step(DIRECTION_LEFT, timestep.step)
+
+    assert sim.tick == reference.tick
+    assert sim.player.center_x == reference.player.center_x
+    assert [(f.center_x, f.center_y) for f in sim.fox_manager.foxes] == [
+        (f.center_x, f.center_y) for f in reference.fox_manager.foxes
+    ]
+
+
+def test_interpolated_position():
+    """Rendering blends the positions before and after the last update."""
+    player = Player(100, 100)
+    player.change_x = 4
+    player.update()
+
+    assert player.interpolated_position(0.0) == (100, 100)
+    assert player.interpolated_position(0.5) == (102, 100)
+    assert player.interpolated_position(1.0) == (104, 100)
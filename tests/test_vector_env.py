@@ -0,0 +1,121 @@
+"""
+Tests for the vectorized training environment.
+"""
+
+import random
+
+import numpy as np
+
+from pacman.batch import SeedBot
+from pacman.entities.actors import STATE_CODES
+from pacman.entities.collectibles import SEED_SUPER
+from pacman.maps.generator import generate_level
+from pacman.simulation import Simulation
+from pacman.utils.constants import (
+    CHICKEN_SPEED,
+    FOX_SCARED_TIME,
+    SEED_POINTS,
+    TILE_SIZE,
+)
+from pacman.vector_env import CHASE, FRIGHTENED, NO_ACTION, VectorEnv
+
+
+def _open_direction(env, game):
+    """A direction the chicken of a game can walk from its spawn tile."""
+    maze = env.maze
+    tile_x = int(env.chicken_x[game] // TILE_SIZE)
+    tile_y = int(env.chicken_y[game] // TILE_SIZE)
+    mask = maze.open_directions(tile_x, tile_y)
+    return next(direction for direction in range(4) if mask & (1 << direction))
+
+
+def test_games_step_independently():
+    """Each game follows its own action; a batched reset only touches its games."""
+    env = VectorEnv(3, level=generate_level(21, 15, seed=2), seed=1)
+    seeds = int(env.seeds_left[0])
+    start_x, start_y = env.chicken_x[0], env.chicken_y[0]
+
+    obs, rewards, terminated, truncated, _infos = env.step([NO_ACTION] * 3)
+    # The seed under the spawn is eaten on the first tick
+    assert list(rewards) == [SEED_POINTS] * 3
+    assert not terminated.any() and not truncated.any()
+
+    env.step([_open_direction(env, 0), NO_ACTION, NO_ACTION])
+    moved = abs(env.chicken_x[0] - start_x) + abs(env.chicken_y[0] - start_y)
+    assert moved == CHICKEN_SPEED
+    assert (env.chicken_x[1], env.chicken_y[1]) == (start_x, start_y)
+    assert obs is env.observations
+
+    env.reset([0])
+    assert (env.chicken_x[0], env.chicken_y[0]) == (start_x, start_y)
+    assert env.seeds_left[0] == seeds
+    assert env.score[1] == SEED_POINTS
+    assert env.tick[1] == 2
+
+
+def test_super_seed_frightens_foxes():
+    """Eating a super seed starts power mode in that game only."""
+    env = VectorEnv(2, seed=1, end_on_catch=False)
+    index = int(np.flatnonzero(env._kinds == SEED_SUPER)[0])
+    tile_x, tile_y = index % env._width, index // env._width
+    env.chicken_x[0], env.chicken_y[0] = env.maze.get_tile_center(tile_x, tile_y)
+
+    env.step([NO_ACTION, NO_ACTION])
+    assert env.power_timer[0] > FOX_SCARED_TIME - 0.1
+    assert (env.fox_state[0] == FRIGHTENED).all()
+    assert env.power_timer[1] == 0
+    assert not (env.fox_state[1] == FRIGHTENED).any()
+
+    # Power mode ends in time and the foxes calm down
+    for _ in range(int(FOX_SCARED_TIME * 60) + 1):
+        env.step([NO_ACTION, NO_ACTION])
+    assert env.power_timer[0] == 0
+    assert not (env.fox_state[0] == FRIGHTENED).any()
+    assert (env.fox_state[0] == CHASE).any()
+
+
+def test_episodes_end_and_restart():
+    """Truncated games are reset automatically and report their length."""
+    env = VectorEnv(
+        4,
+        level=generate_level(21, 15, seed=2),
+        seed=3,
+        max_ticks=50,
+        end_on_catch=False,
+    )
+    for _ in range(49):
+        env.step([NO_ACTION] * 4)
+    _obs, _rewards, terminated, truncated, infos = env.step([NO_ACTION] * 4)
+
+    assert truncated.all() and not terminated.any()
+    assert list(infos["ticks"]) == [50] * 4
+    assert (env.tick == 0).all()
+
+
+def test_one_game_matches_simulation():
+    """A one-game env plays the same game as Simulation, tick for tick."""
+    level = generate_level(21, 15, seed=2)
+    simulation = Simulation(level=level, seed=2)
+    env = VectorEnv(1, level=level, seed=2, max_ticks=10**6, end_on_catch=False)
+    bot = SeedBot(random.Random(2))
+
+    for _ in range(800):
+        direction = bot(simulation)
+        simulation.step(direction)
+        env.step([NO_ACTION if direction is None else direction])
+
+        foxes = simulation.fox_manager.foxes
+        assert (env.chicken_x[0], env.chicken_y[0]) == (
+            simulation.player.center_x,
+            simulation.player.center_y,
+        )
+        assert list(env.fox_x[0]) == [fox.center_x for fox in foxes]
+        assert list(env.fox_y[0]) == [fox.center_y for fox in foxes]
+        assert list(env.fox_state[0]) == [STATE_CODES[fox.state] for fox in foxes]
+        assert env.score[0] == simulation.score
+        assert env.power_timer[0] == simulation.power_timer
+
+    # The session covered the interesting rules
+    assert simulation.foxes_eaten and simulation.fox_catches
+    assert env.foxes_eaten[0] == simulation.foxes_eaten
+    assert env.fox_catches[0] == simulation.fox_catches